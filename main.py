@@ -1,6 +1,6 @@
 # main.py
 import tkinter as tk
-from gui import NumbrixApp
+from numbrix.gui import NumbrixApp
 
 def main():
     root = tk.Tk()
@@ -0,0 +1,13 @@
+# __init__.py
+"""
+Inti pemecah Numbrix tanpa GUI. Mengimpor paket ini hanya memuat papan dan pemecah (tanpa tkinter, sqlite3 atau
+multiprocessing), sehingga proses pekerja dan panggilan CLI singkat mulai secepat mungkin. Modul lain
+(`numbrix.batch`, `numbrix.service`, `numbrix.gui`, ...) diimpor secara eksplisit bila dibutuhkan.
+"""
+from .board import Board
+from .solver import SolveResult, count_solutions, read_input_from_file, solve, solve_exact
+from .strategies import METHODS, STRATEGIES, solve_board, solve_file
+from .tabu import solve_tabu
+
+__all__ = ["Board", "METHODS", "STRATEGIES", "SolveResult", "count_solutions", "read_input_from_file", "solve",
+           "solve_board", "solve_exact", "solve_file", "solve_tabu"]
@@ -0,0 +1,37 @@
+# __main__.py
+import argparse
+import json
+import sys
+
+from .strategies import METHODS, solve_file
+
+def main(argv=None):
+    """
+    Selesaikan satu file puzzle: `python -m numbrix PUZZLE`. Dengan --json hasilnya dicetak sebagai satu objek JSON
+    (sama dengan satu baris keluaran `numbrix.batch`); tanpa itu status dan papan solusi dicetak sebagai teks.
+    Kode keluar 0 jika puzzle terselesaikan (atau unik untuk metode "count"), 1 jika tidak.
+    """
+    parser = argparse.ArgumentParser(prog="python -m numbrix", description="Solve a single Numbrix puzzle file.")
+    parser.add_argument("puzzle", help="puzzle file")
+    parser.add_argument("--method", choices=METHODS, default="anneal", help="solver to use (default: anneal)")
+    parser.add_argument("--timeout", type=float, default=None, help="time limit in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for annealing")
+    parser.add_argument("--cache", default=None, metavar="PATH", help="solution cache database to use and update")
+    parser.add_argument("--json", action="store_true", help="print the result as a JSON object")
+    args = parser.parse_args(argv)
+
+    result = solve_file(args.puzzle, args.method, args.timeout, args.seed, args.cache)
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"{result['status']} in {result['elapsed']:.3f}s ({result['iterations']} iterations)")
+        if "error" in result:
+            print(f"Error: {result['error']}", file=sys.stderr)
+        if result["solution"] is not None:
+            width = len(str(len(result["solution"]) ** 2))
+            for row in result["solution"]:
+                print(" ".join(str(value).rjust(width) for value in row))
+    return 0 if result["status"] in ("solved", "unique") else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
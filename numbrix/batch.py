@@ -0,0 +1,125 @@
+# batch.py
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .corpus import read_puzzles
+from .strategies import METHODS, solve_board, solve_file
+
+def find_puzzles(patterns):
+    """
+    Kumpulkan file puzzle dari daftar direktori, file, atau pola glob (misalnya "samples/*.txt").
+    Direktori diperluas menjadi semua file *.txt di dalamnya. Urutan mengikuti nama file, tanpa duplikat.
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = glob.glob(os.path.join(pattern, "*.txt"))
+        else:
+            matches = glob.glob(pattern)
+        for path in sorted(matches):
+            if os.path.isfile(path) and path not in files:
+                files.append(path)
+    return files
+
+def solve_puzzle(puzzle, method, timeout, seed, cache_path=None):
+    """Seperti `strategies.solve_file`, untuk satu `corpus.Puzzle`; papannya baru dibangun di proses pekerja."""
+    start_time = time.perf_counter()
+    result = {"file": puzzle.path, "puzzle": puzzle.number, "method": method, "status": "error", "solution": None,
+              "iterations": 0}
+    solve_board(puzzle.to_board(), method, timeout, seed, cache_path, result)
+    result["elapsed"] = round(time.perf_counter() - start_time, 6)
+    return result
+
+def corpus_jobs(files, errors):
+    """
+    Hasilkan puzzle dari semua file korpus satu per satu. Puzzle yang formatnya salah tidak dihasilkan; hasil
+    "error"-nya ditambahkan ke daftar `errors`.
+    """
+    def report(error):
+        errors.append({"file": error.path, "puzzle": error.number, "line": error.line, "offset": error.offset,
+                       "status": "error", "error": error.message})
+    for path in files:
+        try:
+            yield from read_puzzles(path, on_error=report)
+        except OSError as e:
+            errors.append({"file": path, "status": "error", "error": str(e)})
+
+def run_batch(files, method="anneal", workers=None, timeout=None, seed=None, output=sys.stdout, cache_path=None,
+              corpus=False):
+    """
+    Selesaikan semua `files` di process pool dan tulis satu baris JSON per puzzle ke `output` segera setelah
+    puzzle tersebut selesai (urutan penyelesaian, bukan urutan input).
+
+    Jika `corpus` True, setiap file adalah korpus berisi banyak puzzle (lihat `corpus.py`) yang dibaca secara
+    streaming; hasilnya juga memuat nomor puzzle di file tersebut.
+
+    Hanya sebagian kecil puzzle yang dikirim ke pool sekaligus, sehingga memori tetap kecil untuk ribuan file.
+    Untuk annealing, puzzle ke-i memakai seed `seed + i` jika `seed` diberikan. Mengembalikan jumlah per status.
+    """
+    workers = workers or os.cpu_count() or 1
+    counts = {}
+    pending = set()
+    errors = []
+    if corpus:
+        queue = enumerate(corpus_jobs(files, errors))
+        task = solve_puzzle
+    else:
+        queue = iter(enumerate(files))
+        task = solve_file
+
+    def write(result):
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for number, job in queue:
+                puzzle_seed = None if seed is None else seed + number
+                pending.add(executor.submit(task, job, method, timeout, puzzle_seed, cache_path))
+                if len(pending) >= workers * 2:
+                    break
+            while errors:
+                write(errors.pop(0))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                write(future.result())
+    return counts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve Numbrix puzzles headlessly and stream JSONL results.")
+    parser.add_argument("puzzles", nargs="+", help="puzzle files, directories or glob patterns such as 'samples/*.txt'")
+    parser.add_argument("--corpus", action="store_true",
+                        help="treat each file as a multi-puzzle corpus (grids separated by blank lines, or one "
+                             "puzzle per line with rows separated by '/')")
+    parser.add_argument("--method", choices=METHODS, default="anneal", help="solver to use (default: anneal)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-puzzle time limit in seconds")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for reproducible annealing runs")
+    parser.add_argument("--output", default=None, help="write JSONL to this file instead of stdout")
+    parser.add_argument("--cache", default=None, metavar="PATH", help="solution cache file to read and update")
+    args = parser.parse_args(argv)
+
+    files = find_puzzles(args.puzzles)
+    if not files:
+        parser.error("no puzzle files matched")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            counts = run_batch(files, args.method, args.workers, args.timeout, args.seed, output, args.cache,
+                               args.corpus)
+    else:
+        counts = run_batch(files, args.method, args.workers, args.timeout, args.seed, cache_path=args.cache,
+                           corpus=args.corpus)
+    print(", ".join(f"{status}: {count}" for status, count in sorted(counts.items())), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+# bench.py
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import Board
+from .generator import generate_puzzle
+from .scoring import score_swaps
+from .solver import read_input_from_file
+from .strategies import STRATEGIES
+
+DEFAULT_SEEDS = (1, 2, 3)
+
+# Batas regresi relatif per jenis metrik (0.25 berarti boleh 25% lebih buruk dari baseline). Untuk "success_rate"
+# batasnya adalah penurunan absolut yang diizinkan. "wall_time" diberi batas lebih longgar: jalankan yang identik
+# (iterasi sama) tetap berbeda hingga ~45% antar proses interpreter meskipun diulang di satu proses, jadi regresi
+# algoritmik terutama tertangkap oleh "iterations", yang deterministik per seed. Median jalur panas ("per_call") dari
+# beberapa proses baru (lihat `measure_hot_paths_isolated`) masih bergeser hingga ~25% antar pemanggilan.
+DEFAULT_THRESHOLDS = {
+    "wall_time": 0.5,
+    "iterations": 0.25,
+    "peak_memory": 0.25,
+    "success_rate": 0.0,
+    "per_call": 0.5,
+    "cold_start": 0.25,
+}
+# Selisih absolut minimum terhadap baseline sebelum sebuah metrik dianggap regresi, dalam satuan metriknya (detik,
+# mikrodetik untuk "per_call", byte untuk "peak_memory"). Jalankan yang hanya beberapa milidetik berfluktuasi jauh
+# lebih dari 25% antar proses, sehingga batas relatif saja memberi regresi palsu.
+DEFAULT_NOISE_FLOORS = {
+    "wall_time": 0.05,
+    "iterations": 0,
+    "peak_memory": 4096,
+    "per_call": 0.5,
+    "cold_start": 0.03,
+}
+DEFAULT_STARTUP_BUDGET = 0.25
+DEFAULT_REPEATS = 5
+DEFAULT_ITERATIONS = 50000
+DEFAULT_HOT_PATH_PROCESSES = 5
+
+def run_mode(mode, board, seed, time_limit, max_iterations=DEFAULT_ITERATIONS):
+    """Jalankan strategi `mode` (lihat `strategies.STRATEGIES`) dan kembalikan (terselesaikan, iterasi).
+
+    Iterasi adalah jumlah simpul untuk pencarian eksak, yang deterministik sehingga seed tidak berpengaruh.
+    Pencarian lokal diberi anggaran `max_iterations`: dengan batas waktu saja, jadwal pendinginan annealing mengikuti
+    kecepatan yang terukur sehingga jalannya berbeda antar percobaan; dengan anggaran iterasi, seed yang sama selalu
+    memberi jalankan yang sama dan `time_limit` hanya menjadi batas pengaman.
+    """
+    options = {} if mode == "exact" else {"max_iterations": max_iterations}
+    result = STRATEGIES[mode](board, "quiet", time_limit=time_limit, rng=random.Random(seed), **options)
+    return result.solved, result.iterations
+
+def load_puzzles(patterns, generated, size, density):
+    """Kembalikan daftar (nama, papan) dari file sampel yang cocok dengan `patterns` dan puzzle yang dibangkitkan."""
+    puzzles = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            puzzles.append((os.path.basename(path), read_input_from_file(path, verbose=False)))
+    for number in range(generated):
+        puzzle = generate_puzzle(size, number, density)
+        puzzles.append((f"generated-{size}x{size}-{number}", puzzle.to_board()))
+    return puzzles
+
+def time_per_call(statement, setup_globals):
+    """Ukur waktu rata-rata satu pemanggilan `statement` dalam mikrodetik."""
+    timer = timeit.Timer(statement, globals=setup_globals)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=number))
+    return best / number * 1e6
+
+def measure_hot_paths(board):
+    """Ukur waktu per pemanggilan jalur panas papan pada salinan `board` yang sudah diinisialisasi acak."""
+    local = Board(other_board=board)
+    local.initialize_board(random.Random(0))
+    local.resync()  # Seperti setelah pencarian lokal, dan sama untuk papan asli maupun papan hasil unpickle
+    empty = Board(size=board.size)
+    free = [index for index in range(local.cell_count) if not local.fixed >> index & 1]
+    rng = random.Random(0)
+    pairs = [tuple(rng.sample(free, 2)) for _ in range(256)] if len(free) >= 2 else []
+    names = {"board": local, "empty": empty, "Board": Board, "pairs": pairs, "score_swaps": score_swaps}
+    return {
+        "calculate_conflicts": time_per_call("board.calculate_conflicts()", names),
+        "board_copy": time_per_call("Board(other_board=board)", names),
+        "board_set": time_per_call("Board(other_board=empty).set(0, 0, 1)", names)
+                     - time_per_call("Board(other_board=empty)", names),
+        "get_neighbors": time_per_call("board.get_neighbors()", names),
+        "score_swaps_256": time_per_call("score_swaps(board, pairs)", names),
+    }
+
+def measure_hot_paths_isolated(board, processes=DEFAULT_HOT_PATH_PROCESSES):
+    """
+    Jalankan `measure_hot_paths` di `processes` interpreter baru, satu per satu, dan kembalikan median setiap jalur.
+
+    Waktu terbaik sebuah jalur di satu proses bisa berbeda hingga ~70% dari proses lain (tata letak memori interpreter
+    berbeda per proses, dan berbeda pula pengaruhnya per fungsi), sehingga hanya median atas beberapa proses yang
+    cukup stabil untuk dibandingkan dengan baseline.
+    """
+    context = multiprocessing.get_context("spawn")
+    samples = []
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as executor:
+        for _ in range(processes):
+            samples.append(executor.submit(measure_hot_paths, board).result())
+    return {name: statistics.median(sample[name] for sample in samples) for name in samples[0]}
+
+def measure_cold_start(board, repeats=5):
+    """
+    Ukur waktu dari start interpreter baru sampai hasil pertama: `python -m numbrix PUZZLE --json` untuk `board`
+    dengan metode "exact". Mengembalikan waktu tercepat dari `repeats` percobaan (paling sedikit terganggu noise).
+
+    Kode keluar 1 berarti puzzle tidak terselesaikan, dan itu tetap hasil pertama yang sah; hanya kode keluar lain
+    atau kematian karena sinyal yang dianggap gagal (`subprocess.CalledProcessError`).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for row in board.to_rows():
+            f.write(" ".join(str(value) if value else "-" for value in row) + "\n")
+    command = [sys.executable, "-m", "numbrix", f.name, "--method", "exact", "--json"]
+    try:
+        best = None
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            completed = subprocess.run(command, cwd=root, stdout=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start_time
+            if completed.returncode not in (0, 1):
+                raise subprocess.CalledProcessError(completed.returncode, command)
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+    finally:
+        os.remove(f.name)
+
+def run_benchmarks(puzzles, modes, seeds, time_limit, measure_memory=True, repeats=DEFAULT_REPEATS,
+                   max_iterations=DEFAULT_ITERATIONS):
+    """
+    Jalankan setiap mode pada setiap puzzle untuk setiap seed, masing-masing `repeats` kali.
+
+    Mengembalikan (runs, metrics): `runs` berisi hasil mentah per seed, `metrics` adalah dict datar
+    "<mode>/<puzzle>/<metrik>" -> nilai untuk waktu, iterasi rata-rata, tingkat keberhasilan dan memori puncak
+    (diukur terpisah dengan tracemalloc pada seed pertama, agar tidak memengaruhi waktu). Waktu sebuah seed adalah
+    yang tercepat dari `repeats` percobaan (seperti `time_per_call`), dan "wall_time" adalah rata-rata waktu
+    tersebut atas semua seed. Seed yang jalannya habis waktu tidak diulang.
+    """
+    runs = []
+    metrics = {}
+    for mode in modes:
+        for name, board in puzzles:
+            elapsed_total = 0.0
+            iterations_total = 0
+            solved_count = 0
+            for seed in seeds:
+                elapsed = None
+                for _ in range(repeats):
+                    start_time = time.perf_counter()
+                    solved, iterations = run_mode(mode, board, seed, time_limit, max_iterations)
+                    duration = time.perf_counter() - start_time
+                    elapsed = duration if elapsed is None else min(elapsed, duration)
+                    if time_limit is not None and duration >= time_limit:
+                        break  # Jalankan yang habis waktu selalu makan seluruh anggaran; mengulangnya tidak berguna
+                runs.append({"mode": mode, "puzzle": name, "seed": seed, "solved": solved,
+                             "iterations": iterations, "elapsed": elapsed})
+                elapsed_total += elapsed
+                iterations_total += iterations
+                solved_count += solved
+            key = f"{mode}/{name}"
+            metrics[f"{key}/wall_time"] = elapsed_total / len(seeds)
+            metrics[f"{key}/iterations"] = iterations_total / len(seeds)
+            metrics[f"{key}/success_rate"] = solved_count / len(seeds)
+            if measure_memory:
+                tracemalloc.start()
+                run_mode(mode, board, seeds[0], time_limit, max_iterations)
+                metrics[f"{key}/peak_memory"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    return runs, metrics
+
+def fastest_modes(metrics):
+    """
+    Pilih, untuk setiap puzzle, strategi dengan waktu rata-rata tercepat di antara strategi dengan tingkat
+    keberhasilan tertinggi. Mengembalikan dict puzzle -> nama strategi.
+    """
+    best = {}
+    for key, value in metrics.items():
+        mode, _, rest = key.partition("/")
+        puzzle, _, metric = rest.rpartition("/")
+        if metric != "wall_time" or mode not in STRATEGIES:
+            continue
+        rank = (-metrics[f"{mode}/{puzzle}/success_rate"], value)
+        if puzzle not in best or rank < best[puzzle][0]:
+            best[puzzle] = (rank, mode)
+    return {puzzle: mode for puzzle, (_, mode) in sorted(best.items())}
+
+def find_regressions(metrics, baseline, thresholds, noise_floors=DEFAULT_NOISE_FLOORS):
+    """
+    Bandingkan `metrics` dengan metrik baseline dan kembalikan daftar pesan untuk setiap metrik yang memburuk
+    melebihi batas relatifnya dan sekaligus melebihi batas noise absolutnya (`noise_floors`). Metrik yang tidak ada di
+    salah satu sisi diabaikan.
+    """
+    regressions = []
+    for key, value in sorted(metrics.items()):
+        if key not in baseline:
+            continue
+        base = baseline[key]
+        kind = "per_call" if key.startswith("hot_path/") else key.rsplit("/", 1)[-1]
+        limit = thresholds.get(kind)
+        if limit is None:
+            continue
+        if kind == "success_rate":
+            if value < base - limit:
+                regressions.append(f"{key}: {value:.2f} < baseline {base:.2f}")
+        elif value > base * (1 + limit) and value - base > noise_floors.get(kind, 0):
+            regressions.append(f"{key}: {value:.6g} > baseline {base:.6g} (+{limit:.0%} allowed)")
+    return regressions
+
+def write_results(path, results):
+    """Tulis `results` sebagai JSON ke `path`."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+def parse_thresholds(items):
+    """Ubah argumen seperti "wall_time=0.5" menjadi dict batas, di atas `DEFAULT_THRESHOLDS`."""
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for item in items:
+        kind, _, value = item.partition("=")
+        if kind not in thresholds or not value:
+            raise ValueError(f"Invalid threshold '{item}', expected one of {', '.join(thresholds)} as name=value.")
+        thresholds[kind] = float(value)
+    return thresholds
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Numbrix solvers and check for regressions.")
+    parser.add_argument("--samples", nargs="*", default=["samples/*.txt"], help="sample puzzle glob patterns")
+    parser.add_argument("--generated", type=int, default=3, help="number of generated puzzles (default: 3)")
+    parser.add_argument("--size", type=int, default=9, help="size of generated puzzles (default: 9)")
+    parser.add_argument("--density", type=float, default=0.25, help="clue density of generated puzzles")
+    parser.add_argument("--modes", nargs="+", choices=sorted(STRATEGIES), default=sorted(STRATEGIES),
+                        help="solver strategies")
+    parser.add_argument("--seeds", nargs="+", type=int, default=list(DEFAULT_SEEDS), help="seeds per puzzle")
+    parser.add_argument("--timeout", type=float, default=10.0, help="time limit per run in seconds (default: 10)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help=f"iteration budget for local search strategies (default: {DEFAULT_ITERATIONS})")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help=f"runs per seed; the fastest is kept (default: {DEFAULT_REPEATS})")
+    parser.add_argument("--hot-path-processes", type=int, default=DEFAULT_HOT_PATH_PROCESSES, metavar="N",
+                        help="fresh interpreters for the hot path timings; the median is kept "
+                             f"(default: {DEFAULT_HOT_PATH_PROCESSES})")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory pass")
+    parser.add_argument("--output", default="bench_results.json", help="results file (default: bench_results.json)")
+    parser.add_argument("--baseline", default=None,
+                        help="baseline results file to compare against (written from these results if missing)")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to --baseline as well")
+    parser.add_argument("--threshold", action="append", default=[], metavar="KIND=VALUE",
+                        help=f"override a regression threshold ({', '.join(DEFAULT_THRESHOLDS)})")
+    parser.add_argument("--startup-budget", type=float, default=DEFAULT_STARTUP_BUDGET, metavar="SECONDS",
+                        help=f"maximum cold start to first result (default: {DEFAULT_STARTUP_BUDGET})")
+    args = parser.parse_args(argv)
+
+    try:
+        thresholds = parse_thresholds(args.threshold)
+    except ValueError as e:
+        parser.error(str(e))
+
+    puzzles = load_puzzles(args.samples, args.generated, args.size, args.density)
+    if not puzzles:
+        parser.error("no puzzles to benchmark")
+    if args.repeats < 1 or args.hot_path_processes < 1:
+        parser.error("--repeats and --hot-path-processes must be at least 1")
+    runs, metrics = run_benchmarks(puzzles, args.modes, args.seeds, args.timeout, not args.no_memory, args.repeats,
+                                   args.iterations)
+    for name, value in measure_hot_paths_isolated(puzzles[0][1], args.hot_path_processes).items():
+        metrics[f"hot_path/{name}"] = value
+
+    results = {
+        "config": {"modes": args.modes, "seeds": args.seeds, "repeats": args.repeats,
+                   "iterations": args.iterations, "timeout": args.timeout,
+                   "puzzles": [name for name, _ in puzzles]},
+        "runs": runs,
+        "metrics": metrics,
+        "fastest": fastest_modes(metrics),
+    }
+    # Simpan dulu hasil yang sudah ada: pengukuran cold start menjalankan interpreter baru yang masih bisa gagal
+    write_results(args.output, results)
+    metrics["startup/cold_start"] = measure_cold_start(puzzles[0][1])
+    write_results(args.output, results)
+    for key, value in sorted(metrics.items()):
+        print(f"{key}: {value:.6g}")
+    for puzzle, mode in results["fastest"].items():
+        print(f"fastest/{puzzle}: {mode}")
+
+    status = 0
+    if metrics["startup/cold_start"] > args.startup_budget:
+        print(f"Cold start {metrics['startup/cold_start']:.3f}s exceeds the budget of {args.startup_budget:.3f}s")
+        status = 1
+    if args.baseline and (args.update_baseline or not os.path.exists(args.baseline)):
+        if not args.update_baseline:
+            print(f"Baseline {args.baseline} does not exist yet; recording these results as the baseline.")
+        write_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["metrics"]
+        regressions = find_regressions(metrics, baseline, thresholds)
+        if regressions:
+            print("Regressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No regressions against baseline.")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,760 @@
+# board.py
+import random
+from array import array
+
+def iter_mask(mask):
+    """Yield the values whose bits are set in `mask`, in increasing order."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+def value_range_mask(low, high, max_value=81):
+    """Return a domain mask with the bits for all values in [low .. high] (clipped to [1 .. max_value]) set."""
+    low = max(low, 1)
+    high = min(high, max_value)
+    if low > high:
+        return 0
+    return ((1 << (high - low + 1)) - 1) << low
+
+def is_one_away(val1, val2):
+    """Return whether or not the two values are numerically adjacent."""
+    return abs(val1 - val2) == 1
+
+def get_directional_neighbors(row, col):
+    """Given a row and column value, return the row and column values of the corresponding up, down, left and right
+    neighboring squares."""
+    return [[a + b for a, b in zip((row, col), directional)]
+            for directional in ((-1, 0), (1, 0), (0, -1), (0, 1))]
+
+def get_all_coordinates_at_distance(row, col, distance, size=9):
+    """Return all feasible coordinates in a board which have a Manhattan Distance of `distance` from the location given
+    by (row, col)."""
+    coordinates = set()
+
+    if distance <= 0:
+        return coordinates
+
+    pairs = [(x, distance - x) for x in range(distance + 1)]
+    for quadrant_multiplier in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        row_multiplier, col_multiplier = quadrant_multiplier
+        for row_pair_part, col_pair_part in pairs:
+            r = row + (row_pair_part * row_multiplier)
+            c = col + (col_pair_part * col_multiplier)
+            if 0 <= r < size and 0 <= c < size:
+                coordinates.add((r, c))
+
+    return coordinates
+
+def are_adjacent(index1, index2, size=9):
+    """Return whether or not the two cell indices are directional neighbors on a `size` x `size` board."""
+    difference = abs(index1 - index2)
+    return difference == size or (difference == 1 and index1 // size == index2 // size)
+
+_MASK64 = (1 << 64) - 1
+
+class Geometry:
+    """Tabel geometri untuk papan berukuran `size` x `size`.
+
+    Tabel dihitung sekali per ukuran (lihat `get_geometry`) dan dibagi oleh semua papan seukuran, sehingga `Board.set`
+    dan pemecah tidak perlu menghitung ulang koordinat tetangga atau cincin jarak pada setiap pemanggilan.
+    """
+
+    __slots__ = ("size", "cell_count", "max_distance", "full_domain", "odd_values", "even_values", "neighbors",
+                 "_rings", "_zobrist")
+
+    def __init__(self, size):
+        self.size = size
+        self.cell_count = size * size  # Juga nilai terbesar pada papan
+        self.max_distance = 2 * (size - 1)
+        # Bit ke-v pada sebuah domain menyala jika nilai v (1 .. cell_count) masih mungkin; bit 0 tidak digunakan.
+        self.full_domain = (1 << (self.cell_count + 1)) - 2
+        self.odd_values = sum(1 << value for value in range(1, self.cell_count + 1, 2))
+        self.even_values = self.full_domain & ~self.odd_values
+        self.neighbors = [
+            tuple(r * size + c for r, c in get_directional_neighbors(index // size, index % size)
+                  if 0 <= r < size and 0 <= c < size)
+            for index in range(self.cell_count)
+        ]
+        self._rings = [None] * self.cell_count
+        self._zobrist = None
+
+    def rings(self, index):
+        """Return, for every distance 0 .. max_distance, the cell indices at that Manhattan distance from `index`.
+
+        Rings are built on first use for each cell and then cached.
+        """
+        rings = self._rings[index]
+        if rings is None:
+            size = self.size
+            row, col = divmod(index, size)
+            by_distance = [[] for _ in range(self.max_distance + 1)]
+            for other in range(self.cell_count):
+                by_distance[abs(other // size - row) + abs(other % size - col)].append(other)
+            rings = self._rings[index] = tuple(tuple(ring) for ring in by_distance)
+        return rings
+
+    def zobrist_key(self, index, value):
+        """Return the random 64-bit Zobrist key of `value` at cell `index`; the key of value 0 (an empty cell) is 0.
+
+        Only one key per cell and one per value are stored (O(cell_count) memory); the key of a pair is the
+        SplitMix64 finalizer applied to both, so pair keys are independent and a hash does not split into separate
+        cell and value parts. The tables are built on first use from a generator seeded with the board size, so
+        hashes are the same in every process.
+        """
+        if not value:
+            return 0
+        keys = self._zobrist
+        if keys is None:
+            getrandbits = random.Random(self.size).getrandbits
+            keys = self._zobrist = ([getrandbits(64) for _ in range(self.cell_count)],
+                                    [getrandbits(64) for _ in range(self.cell_count + 1)])
+        key = keys[0][index] ^ keys[1][value]
+        key = (key ^ key >> 30) * 0xBF58476D1CE4E5B9 & _MASK64
+        key = (key ^ key >> 27) * 0x94D049BB133111EB & _MASK64
+        return key ^ key >> 31
+
+_GEOMETRIES = {}
+
+def get_geometry(size):
+    """Return the shared `Geometry` for `size` x `size` boards, building it on first use."""
+    geometry = _GEOMETRIES.get(size)
+    if geometry is None:
+        geometry = _GEOMETRIES[size] = Geometry(size)
+    return geometry
+
+class Val:
+    """
+    Kelas ini merepresentasikan lokasi nilai pada papan Numbrix.
+
+    Val tidak menyimpan data sendiri: objek ini hanyalah tampilan ringan atas satu sel di dalam buffer milik `Board`,
+    sehingga kode lama yang memakai `board.get(row, col).get()`, `.is_set()` atau `.is_fixed` tetap bekerja.
+    """
+
+    __slots__ = ("board", "index")
+
+    def __init__(self, board, index):
+        """
+        Inisialisasi tampilan Val.
+        - `board`: Papan yang menyimpan nilai sel ini.
+        - `index`: Indeks sel di dalam papan (baris * ukuran + kolom).
+        """
+        self.board = board
+        self.index = index
+
+    @property
+    def val(self):
+        """Nilai sel, atau None jika sel belum diatur."""
+        return self.board.values[self.index] or None
+
+    @property
+    def is_fixed(self):
+        """Menunjukkan apakah nilai ini adalah petunjuk (diberikan) dan tidak boleh diubah."""
+        return bool(self.board.fixed >> self.index & 1)
+
+    @property
+    def possible_values(self):
+        """Daftar nilai yang masih mungkin untuk sel ini, dibangun dari bitmask domain."""
+        return list(iter_mask(self.board.domains[self.index]))
+
+    def remove_possible_value(self, possible_value):
+        """Remove a value from this Val's `possible_values`."""
+        if not self.is_set():
+            self.board.domains[self.index] &= ~(1 << possible_value)
+            if not self.board.domains[self.index]:
+                self.board.dirty.add(self.index)
+
+    def is_set(self):
+        """
+        Periksa apakah Val ini memiliki nilai yang ditentukan.
+        Mengembalikan True jika 'val' bukan None, yang menunjukkan bahwa nilai telah diatur.
+        """
+        return self.board.values[self.index] != 0
+
+    def possible_values_size(self):
+        """Return the size of this Val's `possible_values`."""
+        return self.board.domains[self.index].bit_count()
+
+    def get(self):
+        """
+        Dapatkan nilai saat ini.
+        Mengembalikan nilai dari atribut 'val'.
+        """
+        return self.val
+
+    def set(self, value, is_fixed=False):
+        """
+        Tetapkan nilai dan apakah itu tetap.
+        - `value`: Nilai yang akan diatur.
+        - `is_fixed`: Boolean yang menunjukkan apakah nilai ini tidak boleh diubah.
+        Ini memperbarui 'val' dan 'is_fixed' berdasarkan parameter yang diberikan.
+        """
+        self.board.assign(self.index, value, is_fixed)
+
+    def __str__(self):
+        """
+        Representasi string dari Val.
+        Jika nilai telah diatur ('is_set' mengembalikan True), mengembalikan nilai sebagai string.
+        Jika tidak, mengembalikan "-" yang menunjukkan bahwa Val belum diatur.
+        """
+        if self.is_set():
+            return str(self.get())
+        else:
+            return "-"
+
+class Board:
+    """Papan Numbrix.
+
+    Papan berukuran `size` x `size` (9 secara default) dan disimpan secara ringkas agar penyalinan murah:
+     * `values`: buffer `array('B')` (atau `array('H')` untuk papan di atas 255 sel), 0 berarti sel kosong
+     * `fixed`: bitmask integer, bit ke-i menyala jika sel i adalah petunjuk
+     * `domains`: satu bitmask integer per sel, bit ke-v menyala jika nilai v masih mungkin di sel tersebut
+     * `geometry`: tabel tetangga dan jarak bersama untuk ukuran papan ini (lihat `get_geometry`)
+     * `zobrist`: hash Zobrist dari semua nilai yang ditempatkan (XOR kunci (sel, nilai) dari
+       `Geometry.zobrist_key`), diperbarui secara inkremental oleh `assign`/`set` dan `undo`; None sampai
+       `start_hashing()` dipanggil, karena hanya pencarian eksak dengan tabel transposisi yang membutuhkannya
+     * `dirty`: sel yang nilainya berubah atau domainnya menjadi kosong sejak `is_not_feasible` terakhir berhasil,
+       sehingga pemeriksaan kelayakan hanya melihat sel tersebut dan tetangganya
+    Menyalin papan hanya berarti menyalin buffer `values` dan daftar `domains` (integer tidak dapat diubah, sehingga
+    dapat dibagi antar salinan), tanpa membangun objek per sel.
+
+    Pencarian pohon dapat memakai satu papan saja dengan jejak (trail): setelah `start_trail()`, setiap perubahan
+    nilai dan domain dicatat sehingga `undo(mark)` dapat mengembalikan papan ke titik `mark()` sebelumnya.
+
+    Pencarian lokal (`initialize_board`, `swap`, `ConflictTracker`, `moves`) menulis buffer `values` secara langsung
+    dan tidak memperbarui `zobrist` maupun `dirty` demi kecepatan; panggil `resync()` sebelum memakai papan seperti
+    itu untuk pencarian pohon.
+    """
+
+    __slots__ = ("geometry", "values", "fixed", "domains", "trail", "zobrist", "dirty")
+
+    def __init__(self, other_board=None, size=9):
+        if other_board is not None:
+            self.geometry = other_board.geometry
+            self.values = other_board.values[:]
+            self.fixed = other_board.fixed
+            self.domains = other_board.domains[:]
+            self.zobrist = other_board.zobrist
+            self.dirty = other_board.dirty.copy()
+        else:
+            self.geometry = get_geometry(size)
+            cell_count = self.geometry.cell_count
+            self.values = array("B" if cell_count <= 255 else "H", [0]) * cell_count  # Inisialisasi papan kosong
+            self.fixed = 0
+            self.domains = [self.geometry.full_domain] * cell_count
+            self.zobrist = None  # Hash hanya dipelihara setelah start_hashing()
+            self.dirty = set()  # Papan kosong dengan domain penuh selalu layak
+        self.trail = None  # Jejak perubahan hanya aktif setelah start_trail()
+
+    def __getstate__(self):
+        """Status untuk pickle/deepcopy: tabel geometri tidak ikut diserialisasi, hanya ukurannya."""
+        return self.geometry.size, self.values, self.fixed, self.domains
+
+    def __setstate__(self, state):
+        size, self.values, self.fixed, self.domains = state
+        self.geometry = get_geometry(size)
+        self.trail = None
+        self.zobrist = None
+        self.resync()
+
+    @property
+    def size(self):
+        """Panjang sisi papan."""
+        return self.geometry.size
+
+    @property
+    def cell_count(self):
+        """Jumlah sel pada papan, yang juga merupakan nilai terbesar."""
+        return self.geometry.cell_count
+
+    def resync(self):
+        """Tandai semua sel kotor dan hitung ulang `zobrist` (jika hash dipelihara) dari buffer nilai, misalnya setelah
+        pencarian lokal mengubah nilai secara langsung. Pemeriksaan `is_not_feasible` berikutnya kembali memeriksa
+        seluruh papan.
+        """
+        if self.zobrist is not None:
+            self.start_hashing()
+        self.dirty = set(range(self.geometry.cell_count))
+
+    def start_hashing(self):
+        """Hitung `zobrist` dari buffer nilai dan mulai memeliharanya pada setiap perubahan nilai.
+
+        Mengembalikan hash tersebut.
+        """
+        zobrist_key = self.geometry.zobrist_key
+        zobrist = 0
+        for index, value in enumerate(self.values):
+            zobrist ^= zobrist_key(index, value)
+        self.zobrist = zobrist
+        return zobrist
+
+    def start_trail(self):
+        """Mulai mencatat perubahan nilai dan domain agar dapat dibatalkan dengan `undo`."""
+        self.trail = []
+
+    def mark(self):
+        """Kembalikan posisi jejak saat ini, untuk diberikan ke `undo` saat backtrack."""
+        return len(self.trail)
+
+    def undo(self, mark):
+        """Batalkan semua perubahan nilai dan domain yang tercatat setelah `mark`.
+
+        Jejak berisi pasangan (indeks, nilai lama); indeks negatif `~index` menandai perubahan nilai sel, indeks
+        non-negatif menandai perubahan domain. Status petunjuk (`fixed`) tidak pernah diubah oleh pencarian.
+        Hash `zobrist` (jika dipelihara) ikut dikembalikan bersama setiap nilai sel, dan sel yang nilainya
+        dikembalikan ditandai kotor.
+        Domain yang dikembalikan hanya bisa bertambah, sehingga tidak perlu diperiksa ulang.
+        """
+        trail = self.trail
+        values = self.values
+        domains = self.domains
+        dirty = self.dirty
+        zobrist_key = self.geometry.zobrist_key
+        zobrist = self.zobrist
+        while len(trail) > mark:
+            old = trail.pop()
+            index = trail.pop()
+            if index < 0:
+                index = ~index
+                if zobrist is not None:
+                    zobrist ^= zobrist_key(index, values[index]) ^ zobrist_key(index, old)
+                values[index] = old
+                dirty.add(index)
+            else:
+                domains[index] = old
+        self.zobrist = zobrist
+
+    def restrict(self, index, mask):
+        """Persempit domain sel `index` menjadi irisannya dengan `mask` (tercatat di jejak jika aktif).
+
+        Mengembalikan jumlah nilai yang dihapus dari domain.
+        """
+        domain = self.domains[index]
+        narrowed = domain & mask
+        if narrowed == domain:
+            return 0
+        if self.trail is not None:
+            self.trail += (index, domain)
+        self.domains[index] = narrowed
+        if not narrowed:
+            self.dirty.add(index)
+        return domain.bit_count() - narrowed.bit_count()
+
+    def assign(self, index, value, is_fixed=False):
+        """Simpan nilai pada indeks sel tanpa efek riak ke sel lain."""
+        old = self.values[index]
+        if self.trail is not None:
+            self.trail += (~index, old, index, self.domains[index])
+        value = value or 0
+        if self.zobrist is not None:
+            zobrist_key = self.geometry.zobrist_key
+            self.zobrist ^= zobrist_key(index, old) ^ zobrist_key(index, value)
+        self.values[index] = value
+        self.dirty.add(index)
+        if is_fixed:
+            self.fixed |= 1 << index
+            self.domains[index] = 0  # Clear possible values if fixed
+        else:
+            self.fixed &= ~(1 << index)
+
+    def is_complete(self):
+        """Check if the board has valid values for all squares."""
+        return 0 not in self.values
+
+    def is_not_feasible(self):
+        """Check if the current board is no longer feasible.
+
+        This may happen if:
+         * Any squares no longer have any feasible values which they can hold
+         * Any squares have become somewhat surrounded but they do not have their required "correct neighbors"
+
+        Only the dirty cells (see `dirty`) and their neighbors are checked: a set square's feasibility depends on its
+        own value and its neighbors' values only, and a domain only becomes empty through `set`/`restrict`, which mark
+        the cell. The dirty cells are cleared once the board is found feasible and kept otherwise, so the check costs
+        O(changed cells) per search node instead of O(board).
+        """
+        dirty = self.dirty
+        if not dirty:
+            return False
+        values = self.values
+        domains = self.domains
+        neighbors = self.geometry.neighbors
+        size = self.geometry.size
+        cells = set(dirty)
+        for index in dirty:
+            cells.update(neighbors[index])
+        for index in cells:
+            value = values[index]
+            if value:
+                if not self.would_be_feasible(index // size, index % size, value):
+                    return True
+            elif not domains[index]:
+                return True
+        dirty.clear()
+        return False
+
+    def get(self, row, col):
+        """Dapatkan nilai pada lokasi (baris, kolom)."""
+        size = self.geometry.size
+        if not (0 <= row < size and 0 <= col < size):
+            return None
+        return Val(self, row * size + col)
+
+    def set(self, row, col, val, is_fixed=False):
+        """Atur nilai pada lokasi (baris, kolom)."""
+        geometry = self.geometry
+        size = geometry.size
+        if not (0 <= row < size and 0 <= col < size):
+            raise ValueError(
+                f"Nilai baris dan kolom harus berada dalam rentang [0 .. {size - 1}] tetapi diberi baris: {row}, "
+                f"kolom: {col}"
+            )
+        self.assign(row * size + col, val, is_fixed)
+
+        # Ripple effect: remove possible values from surrounding cells
+        values = self.values
+        domains = self.domains
+        trail = self.trail
+        rings = geometry.rings(row * size + col)
+        for distance in range(1, geometry.max_distance + 1):
+            keep = ~value_range_mask(val - distance + 1, val + distance - 1, geometry.cell_count)
+            for index in rings[distance]:
+                if not values[index]:
+                    domain = domains[index]
+                    if domain & keep != domain:
+                        if trail is not None:
+                            trail += (index, domain)
+                        domain &= keep
+                        domains[index] = domain
+                        if not domain:
+                            self.dirty.add(index)
+
+    def would_be_feasible(self, row, col, val):
+        """Check if the provided value would be feasible at the specified location.
+
+        For a value to be feasible at a location, it must have (provided it is not 1 or the largest value):
+         * At least two open neighbors (if none of the directional neighbors are correct)
+         * Or one correct directional neighbor and at least one open neighbor
+         * Or two correct directional neighbors
+
+        If the value is 1 or the largest value:
+         * It can either have at least one open neighbor
+         * Or one correct directional neighbor
+        """
+        open_neighbors = 0
+        correct_directional_neighbors = 0
+        values = self.values
+
+        for directional_index in self.geometry.neighbors[row * self.geometry.size + col]:
+            directional_val = values[directional_index]
+            if not directional_val:
+                open_neighbors += 1
+            elif is_one_away(val, directional_val):
+                correct_directional_neighbors += 1
+
+        if val == 1 or val == self.geometry.cell_count:
+            return open_neighbors >= 1 or correct_directional_neighbors == 1
+        else:
+            return (correct_directional_neighbors == 0 and open_neighbors >= 2) or \
+                   (correct_directional_neighbors == 1 and open_neighbors >= 1) or \
+                   correct_directional_neighbors == 2
+
+    def get_next_boards(self):
+        """Evaluate the board and take the next logical assignments on some specific square. Return all boards that
+        represent feasible moves on the minimal options location.
+        """
+        next_boards = []
+
+        move = self.get_next_moves()
+        if move is None:
+            return next_boards  # No possible moves
+
+        row, col, values = move
+        for value in values:
+            new_board = Board(other_board=self)
+            new_board.set(row, col, value)
+            next_boards.append(new_board)
+
+        return next_boards
+
+    def get_next_moves(self):
+        """Pick the unset square with the fewest possible values and return `(row, col, values)`, where `values` are
+        the feasible values for that square. Return None when every square is set.
+
+        This is the move selection behind `get_next_boards`, without building a board per move.
+        """
+        minimal_options_index = None
+        minimal_options_size = None
+
+        for index in range(self.geometry.cell_count):
+            if not self.values[index]:
+                size = self.domains[index].bit_count()
+                if minimal_options_index is None or size < minimal_options_size:
+                    minimal_options_index, minimal_options_size = index, size
+
+        if minimal_options_index is None:
+            return None  # No possible moves
+
+        # Minimal options location has been identified, now return all feasible values on it
+        row, col = divmod(minimal_options_index, self.geometry.size)
+        values = [value for value in iter_mask(self.domains[minimal_options_index])
+                  if self.would_be_feasible(row, col, value)]
+        return row, col, values
+
+    def initialize_board(self, rng=random):
+        """Inisialisasi papan untuk pencarian lokal.
+
+        `rng` adalah sumber acak untuk pengacakan (modul `random` secara default, atau `random.Random` per rantai).
+        """
+        cell_count = self.geometry.cell_count
+        numbers = list(range(1, cell_count + 1))
+        for index in range(cell_count):
+            if self.fixed >> index & 1:
+                if self.values[index] in numbers:
+                    numbers.remove(self.values[index])
+        rng.shuffle(numbers)
+        for index in range(cell_count):
+            if not self.fixed >> index & 1:
+                if numbers:
+                    self.values[index] = numbers.pop()
+
+    def initialize_from_domains(self, rng=random):
+        """Inisialisasi papan untuk pencarian lokal seperti `initialize_board`, tetapi setiap nilai yang hilang
+        ditempatkan di sel tidak tetap yang domainnya memuat nilai tersebut.
+
+        Penempatan adalah pencocokan maksimum antara sel dan nilai (jalur augmentasi, sel dengan domain tersempit lebih
+        dulu, urutan acak dari `rng`); sel yang tidak kebagian nilai dari domainnya diisi sisa nilai secara acak.
+        Mengembalikan jumlah sel yang mendapat nilai dari domainnya.
+        """
+        cell_count = self.geometry.cell_count
+        values = self.values
+        placed = 0
+        for index in range(cell_count):
+            if self.fixed >> index & 1:
+                placed |= 1 << values[index]
+        missing = self.geometry.full_domain & ~placed
+        cells = [index for index in range(cell_count) if not self.fixed >> index & 1]
+        rng.shuffle(cells)
+        candidates = {}
+        for index in cells:
+            candidates[index] = list(iter_mask(self.domains[index] & missing))
+            rng.shuffle(candidates[index])
+        cells.sort(key=lambda index: len(candidates[index]))
+
+        match = {}  # sel -> nilai
+        owner = {}  # nilai -> sel
+        for cell in cells:
+            # Cari jalur augmentasi dengan BFS: sel -> nilai -> pemilik nilai tersebut -> ...
+            parent = {}
+            queue = [cell]
+            found = None
+            for current in queue:
+                for value in candidates[current]:
+                    if value in parent:
+                        continue
+                    parent[value] = current
+                    if value not in owner:
+                        found = value
+                        break
+                    queue.append(owner[value])
+                if found is not None:
+                    break
+            value = found
+            while value is not None:
+                current = parent[value]
+                previous = match.get(current)
+                match[current] = value
+                owner[value] = current
+                value = None if current == cell else previous
+
+        numbers = [value for value in iter_mask(missing) if value not in owner]
+        rng.shuffle(numbers)
+        for index in cells:
+            if index in match:
+                values[index] = match[index]
+            elif numbers:
+                values[index] = numbers.pop()
+        return len(match)
+
+    def calculate_conflicts(self):
+        """Hitung jumlah konflik di papan."""
+        conflicts = 0
+        size = self.geometry.size
+        cell_count = self.geometry.cell_count
+        position_of_number = [None] * (cell_count + 1)  # Indeks 0 tidak digunakan
+
+        values = self.values
+
+        # Peta posisi setiap angka
+        for index in range(cell_count):
+            num = values[index]
+            if num:
+                position_of_number[num] = divmod(index, size)
+
+        # Periksa setiap angka dari 1 hingga nilai terbesar
+        for num in range(1, cell_count + 1):
+            if position_of_number[num] is None:
+                continue  # Angka tidak ditempatkan di papan
+            row, col = position_of_number[num]
+
+            # Tentukan angka tetangga yang diharapkan
+            if num == 1:
+                expected_neighbors = [2]
+            elif num == cell_count:
+                expected_neighbors = [cell_count - 1]
+            else:
+                expected_neighbors = [num - 1, num + 1]
+
+            # Periksa jika tetangga yang diharapkan berdekatan
+            found_neighbors = 0
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                adj_row, adj_col = row + dr, col + dc
+                if 0 <= adj_row < size and 0 <= adj_col < size:
+                    adj_num = values[adj_row * size + adj_col]
+                    if adj_num in expected_neighbors:
+                        found_neighbors += 1
+
+            # Perbarui konflik
+            conflicts += len(expected_neighbors) - found_neighbors
+
+        return conflicts
+
+    def swap(self, index1, index2):
+        """Tukar nilai dua sel secara langsung, tanpa efek riak pada domain.
+
+        Pencarian lokal tidak pernah membaca domain, sehingga pertukaran cukup menyentuh buffer nilai.
+        """
+        values = self.values
+        values[index1], values[index2] = values[index2], values[index1]
+
+    def get_neighbors(self, count=10):
+        """Hasilkan `count` papan tetangga dengan menukar dua sel acak yang tidak tetap.
+
+        `solve` tidak lagi memakai metode ini (lihat `moves.PathMoves`); setiap tetangga di sini masih
+        berupa salinan papan, tetapi pertukarannya tidak lagi menjalankan efek riak domain. Untuk menilai banyak
+        tetangga sekaligus, lihat `scoring.score_boards` dan `scoring.score_swaps`.
+        """
+        neighbors = []
+        size = self.geometry.size
+        non_fixed_positions = [
+            divmod(index, size)
+            for index in range(self.geometry.cell_count)
+            if not self.fixed >> index & 1
+        ]
+
+        # Hasilkan sejumlah tetangga acak yang tetap
+        for _ in range(count):  # Hasilkan `count` tetangga acak
+            if len(non_fixed_positions) < 2:
+                break
+            pos1, pos2 = random.sample(non_fixed_positions, 2)
+            row1, col1 = pos1
+            row2, col2 = pos2
+            new_board = Board(other_board=self)
+            new_board.swap(row1 * size + col1, row2 * size + col2)
+            neighbors.append(new_board)
+        return neighbors
+
+    def is_goal(self):
+        """Periksa apakah papan adalah solusi yang valid."""
+        return self.calculate_conflicts() == 0
+
+    def to_rows(self):
+        """Kembalikan nilai papan sebagai daftar baris (None untuk sel kosong), misalnya untuk ditulis sebagai JSON."""
+        size = self.geometry.size
+        return [[self.values[row * size + col] or None for col in range(size)] for row in range(size)]
+
+    def __repr__(self):
+        """Representasi string dari papan."""
+        size = self.geometry.size
+        width = max(3, len(str(self.geometry.cell_count)) + 1)
+        border = "+" + "-" * (size * width + 1) + "+"
+        output = border + "\n"
+        for row in range(size):
+            output += "|"
+            for col in range(size):
+                val = self.values[row * size + col]
+                output += (str(val) if val else "-").rjust(width)
+            output += " |\n"
+        output += border
+        return output
+
+class ConflictTracker:
+    """Penghitung konflik inkremental untuk pencarian lokal.
+
+    Menyimpan indeks nilai -> posisi sel dan kontribusi konflik setiap pasangan angka berurutan (k, k + 1). Sebuah
+    pasangan bernilai 0 jika kedua angka bertetangga, 2 jika keduanya ada di papan tetapi berjauhan, dan 1 jika hanya
+    salah satunya yang ada. Jumlahnya sama dengan `Board.calculate_conflicts()` untuk papan tanpa angka ganda, tetapi
+    perubahan skor akibat menukar dua sel cukup dihitung dari nilai yang ditukar dan pasangan ±1-nya.
+    """
+
+    __slots__ = ("board", "size", "last_link", "position", "link_costs", "total")
+
+    def __init__(self, board):
+        self.board = board
+        self.size = board.size
+        self.last_link = board.cell_count - 1  # Pasangan terakhir adalah (n - 1, n)
+        self.position = [-1] * (board.cell_count + 2)  # Indeks 0 dan n + 1 tidak digunakan
+        for index, num in enumerate(board.values):
+            if num:
+                self.position[num] = index
+        self.link_costs = [0] * (board.cell_count + 1)  # link_costs[k] untuk pasangan (k, k + 1), k = 1 .. n - 1
+        for num in range(1, self.last_link + 1):
+            self.link_costs[num] = self.link_cost(num)
+        self.total = sum(self.link_costs)
+
+    def link_cost(self, num):
+        """Hitung kontribusi konflik pasangan (num, num + 1) dari posisi saat ini."""
+        return self.pair_cost(self.position[num], self.position[num + 1])
+
+    def pair_cost(self, first, second):
+        """Kontribusi konflik sebuah pasangan jika kedua angkanya berada di sel `first` dan `second` (-1: tidak ada)."""
+        if first < 0 or second < 0:
+            return 0 if first == second else 1
+        return 0 if are_adjacent(first, second, self.size) else 2
+
+    def _affected_links(self, val1, val2):
+        """Pasangan yang bisa berubah jika posisi `val1` dan `val2` ditukar, tanpa duplikat."""
+        if val2 - 1 == val1:
+            links = (val1 - 1, val1, val2)
+        elif val1 - 1 == val2:
+            links = (val2 - 1, val2, val1)
+        else:
+            links = (val1 - 1, val1, val2 - 1, val2)
+        return [num for num in links if 1 <= num <= self.last_link]
+
+    def swap_delta(self, index1, index2):
+        """Hitung perubahan jumlah konflik jika nilai di sel `index1` dan `index2` ditukar, tanpa mengubah papan."""
+        values = self.board.values
+        val1 = values[index1]
+        val2 = values[index2]
+        if val1 == val2:
+            return 0
+        position = self.position
+        links = self._affected_links(val1, val2)
+        before = 0
+        for num in links:
+            before += self.link_costs[num]
+
+        position[val1], position[val2] = index2, index1
+        after = 0
+        for num in links:
+            after += self.link_cost(num)
+        position[val1], position[val2] = index1, index2
+        return after - before
+
+    def apply_swap(self, index1, index2):
+        """Tukar nilai di sel `index1` dan `index2` di papan (tanpa efek riak) dan kembalikan perubahan konfliknya."""
+        values = self.board.values
+        val1 = values[index1]
+        val2 = values[index2]
+        if val1 == val2:
+            return 0
+        self.board.swap(index1, index2)
+        self.position[val1], self.position[val2] = index2, index1
+        delta = 0
+        for num in self._affected_links(val1, val2):
+            cost = self.link_cost(num)
+            delta += cost - self.link_costs[num]
+            self.link_costs[num] = cost
+        self.total += delta
+        return delta
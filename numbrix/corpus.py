@@ -0,0 +1,216 @@
+# corpus.py
+import argparse
+import sys
+
+from .board import Board
+
+# Format korpus (banyak puzzle dalam satu file), dideteksi per puzzle:
+# - Grid: N baris berisi N nilai ('-' untuk sel kosong) seperti file puzzle tunggal; puzzle dipisahkan baris kosong
+#   (atau langsung bersambung, karena puzzle selesai setelah N baris).
+# - Ringkas: satu baris per puzzle dengan baris-baris grid dipisahkan '/', misalnya "1 - 3 / - - - / 7 - 9".
+ROW_SEPARATOR = b"/"
+EMPTY = b"-"
+
+class PuzzleFormatError(ValueError):
+    """Kesalahan format korpus, dengan lokasinya: nama file, offset byte dan nomor baris (mulai dari 1)."""
+
+    def __init__(self, message, path=None, offset=None, line=None, number=None):
+        super().__init__(message)
+        self.message = message
+        self.path = path
+        self.offset = offset
+        self.line = line
+        self.number = number  # Urutan puzzle yang salah di file
+
+    def __str__(self):
+        return f"{self.path or '<input>'}:{self.line} (byte {self.offset}): {self.message}"
+
+class Puzzle:
+    """
+    Puzzle ringan dari korpus: ukuran dan daftar petunjuk (indeks, nilai), tanpa papan. `Board` baru dibangun
+    saat `to_board()` dipanggil, sehingga membaca dan menyaring korpus besar tidak membayar biaya propagasi domain.
+    `number` adalah urutan puzzle di file (mulai dari 1), `offset` dan `line` adalah lokasi awalnya.
+    """
+    __slots__ = ("size", "clues", "path", "number", "offset", "line")
+
+    def __init__(self, size, clues, path=None, number=None, offset=None, line=None):
+        self.size = size
+        self.clues = clues
+        self.path = path
+        self.number = number
+        self.offset = offset
+        self.line = line
+
+    def to_board(self):
+        """Bangun `Board` baru dengan semua petunjuk sebagai nilai tetap."""
+        board = Board(size=self.size)
+        size = self.size
+        for index, value in self.clues:
+            board.set(index // size, index % size, value, is_fixed=True)
+        return board
+
+    def to_line(self):
+        """Kembalikan puzzle dalam format ringkas satu baris."""
+        cells = ["-"] * (self.size * self.size)
+        for index, value in self.clues:
+            cells[index] = str(value)
+        size = self.size
+        return " / ".join(" ".join(cells[row * size:(row + 1) * size]) for row in range(size))
+
+    def to_grid(self):
+        """Kembalikan puzzle dalam format grid N baris seperti file di samples/ (tanpa baris baru di akhir)."""
+        cells = ["-"] * (self.size * self.size)
+        for index, value in self.clues:
+            cells[index] = str(value)
+        size = self.size
+        return "\n".join(" ".join(cells[row * size:(row + 1) * size]) for row in range(size))
+
+    @classmethod
+    def from_board(cls, board):
+        """Buat puzzle dari petunjuk (sel tetap) `board`."""
+        clues = tuple((index, board.values[index]) for index in range(board.cell_count) if board.fixed >> index & 1)
+        return cls(board.size, clues)
+
+    def __repr__(self):
+        return f"Puzzle(size={self.size}, clues={len(self.clues)}, number={self.number})"
+
+def _parse_row(tokens, row, size, clues, seen):
+    """
+    Periksa dan simpan satu baris token sekaligus: tambahkan (indeks, nilai) ke `clues`. `seen` adalah bitmask nilai
+    yang sudah dipakai pada puzzle ini. Mengembalikan bitmask yang diperbarui; kesalahan dilaporkan sebagai ValueError.
+    """
+    if len(tokens) != size:
+        raise ValueError(f"expected {size} values in row {row + 1}, found {len(tokens)}")
+    top = size * size
+    base = row * size
+    for col, token in enumerate(tokens):
+        if token == EMPTY:
+            continue
+        if not token.isdigit():
+            raise ValueError(f"invalid value {token.decode(errors='replace')!r} in row {row + 1}")
+        value = int(token)
+        if not 1 <= value <= top:
+            raise ValueError(f"value {value} in row {row + 1} is outside 1-{top}")
+        if seen >> value & 1:
+            raise ValueError(f"value {value} appears more than once")
+        seen |= 1 << value
+        clues.append((base + col, value))
+    return seen
+
+def parse_line(line):
+    """Parse satu puzzle format ringkas (bytes atau str) menjadi `Puzzle`; kesalahan dilaporkan sebagai ValueError."""
+    if isinstance(line, str):
+        line = line.encode()
+    rows = line.split(ROW_SEPARATOR)
+    size = len(rows)
+    clues = []
+    seen = 0
+    for row, text in enumerate(rows):
+        seen = _parse_row(text.split(), row, size, clues, seen)
+    return Puzzle(size, tuple(clues))
+
+def read_puzzles(path, on_error=None):
+    """
+    Generator yang membaca korpus `path` baris demi baris dan menghasilkan `Puzzle` satu per satu, sehingga memori
+    tetap konstan berapa pun ukuran file. Setiap baris diperiksa dan petunjuknya disimpan dalam satu kali lewat.
+
+    Kesalahan format dilaporkan sebagai `PuzzleFormatError` dengan offset byte dan nomor baris awal puzzle. Jika
+    `on_error` diberikan, fungsi itu dipanggil dengan kesalahan tersebut dan pembacaan dilanjutkan dari puzzle
+    berikutnya (baris kosong berikutnya untuk format grid); jika tidak, kesalahan dilempar.
+    """
+    number = 0
+    size = None  # Ukuran puzzle grid yang sedang dibaca, None jika tidak ada
+    row = start_offset = start_line = 0  # Baris berikutnya dan lokasi awal puzzle grid itu, diset saat size diset
+    skipping = False  # Lewati sisa puzzle grid yang tidak valid sampai baris kosong
+    offset = 0
+    with open(path, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            line_offset = offset
+            offset += len(line)
+            tokens = line.split()
+            if not tokens:
+                skipping = False
+                if size is not None:
+                    error = PuzzleFormatError(f"expected {size} rows, found {row}", path, start_offset, start_line,
+                                               number)
+                    size = None
+                    if on_error is None:
+                        raise error
+                    on_error(error)
+                continue
+            if skipping:
+                continue
+            try:
+                if size is None:
+                    number += 1
+                    start_offset, start_line = line_offset, line_number
+                    if ROW_SEPARATOR in line:
+                        puzzle = parse_line(line)
+                        puzzle.path, puzzle.number, puzzle.offset, puzzle.line = path, number, line_offset, line_number
+                        yield puzzle
+                        continue
+                    size, row, clues, seen = len(tokens), 0, [], 0
+                seen = _parse_row(tokens, row, size, clues, seen)
+                row += 1
+                if row == size:
+                    yield Puzzle(size, tuple(clues), path, number, start_offset, start_line)
+                    size = None
+            except ValueError as e:
+                error = PuzzleFormatError(str(e), path, line_offset, line_number, number)
+                skipping = size is not None
+                size = None
+                if on_error is None:
+                    raise error from None
+                on_error(error)
+    if size is not None:
+        error = PuzzleFormatError(f"expected {size} rows, found {row}", path, start_offset, start_line, number)
+        if on_error is None:
+            raise error
+        on_error(error)
+
+def write_puzzles(puzzles, file, grid=False):
+    """
+    Tulis `puzzles` (objek `Puzzle` atau `Board`) ke objek file teks `file`: satu baris ringkas per puzzle, atau
+    grid yang dipisahkan baris kosong jika `grid` True. Mengembalikan jumlah puzzle yang ditulis.
+    """
+    count = 0
+    for puzzle in puzzles:
+        if isinstance(puzzle, Board):
+            puzzle = Puzzle.from_board(puzzle)
+        if grid:
+            file.write(("\n" if count else "") + puzzle.to_grid() + "\n")
+        else:
+            file.write(puzzle.to_line() + "\n")
+        count += 1
+    return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and convert multi-puzzle Numbrix corpus files.")
+    parser.add_argument("corpus", nargs="+",
+                        help="corpus files (grids separated by blank lines, or one puzzle per line)")
+    parser.add_argument("--to-lines", metavar="PATH", default=None,
+                        help="also write every valid puzzle to PATH in the one-line format")
+    args = parser.parse_args(argv)
+
+    errors = []
+    def report(error):
+        errors.append(error)
+        print(error, file=sys.stderr)
+
+    output = open(args.to_lines, "w") if args.to_lines else None
+    try:
+        for path in args.corpus:
+            sizes = {}
+            for puzzle in read_puzzles(path, on_error=report):
+                sizes[puzzle.size] = sizes.get(puzzle.size, 0) + 1
+                if output is not None:
+                    output.write(puzzle.to_line() + "\n")
+            summary = ", ".join(f"{count} of size {size}" for size, count in sorted(sizes.items())) or "no puzzles"
+            print(f"{path}: {summary}")
+    finally:
+        if output is not None:
+            output.close()
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+# generator.py
+import argparse
+import os
+import random
+import sys
+import time
+
+from .board import get_geometry
+from .corpus import Puzzle, write_puzzles
+from .solver import count_solutions
+from .transposition import TranspositionTable
+
+def random_path(size, rng=random, mixing=1.0):
+    """
+    Bangun jalur Hamilton acak pada grid `size` x `size` dan kembalikan daftar indeks sel sesuai urutan jalur
+    (sel ke-i berisi nilai i + 1).
+
+    Jalur dimulai sebagai jalan acak dari sel acak yang diperpanjang ke tetangga kosong selama mungkin. Jika kedua
+    ujungnya buntu, langkah backbite memindahkan salah satu ujung tanpa memutus jalur, sampai semua sel terkunjungi.
+    Setelah itu `mixing` x N*N langkah backbite tambahan di kedua ujung mengacak bentuk jalur lebih jauh.
+    """
+    neighbors = get_geometry(size).neighbors
+    cell_count = size * size
+    start = rng.randrange(cell_count)
+    path = [start]
+    position = [-1] * cell_count  # Posisi setiap sel di jalur, -1 jika belum dikunjungi
+    position[start] = 0
+    while len(path) < cell_count:
+        free = [neighbor for neighbor in neighbors[path[-1]] if position[neighbor] < 0]
+        if free:
+            cell = rng.choice(free)
+            position[cell] = len(path)
+            path.append(cell)
+        elif any(position[neighbor] < 0 for neighbor in neighbors[path[0]]):
+            # Hanya awal jalur yang masih bisa diperpanjang: balik jalur agar awal menjadi ujung akhir.
+            path.reverse()
+            for index, cell in enumerate(path):
+                position[cell] = index
+        else:
+            # Kedua ujung buntu; gerakkan salah satunya, karena sel yang tersisa mungkin hanya dapat dicapai dari
+            # ujung awal (misalnya jika ujung awal berada pada warna papan catur yang salah).
+            backbite(path, position, neighbors, rng, tail=rng.random() < 0.5)
+    for _ in range(round(mixing * cell_count)):
+        backbite(path, position, neighbors, rng, tail=rng.random() < 0.5)
+    return path
+
+def backbite(path, position, neighbors, rng, tail=True):
+    """
+    Satu langkah backbite di ujung akhir (`tail`) atau awal jalur: pilih tetangga acak ujung tersebut yang sudah
+    ada di jalur, sambungkan ujung ke tetangga itu dan balik segmen di antaranya, sehingga sel lain menjadi ujung.
+    `path` dan `position` diperbarui di tempat.
+    """
+    if len(path) < 2:
+        return
+    if tail:
+        end, previous = path[-1], path[-2]
+    else:
+        end, previous = path[0], path[1]
+    choices = [neighbor for neighbor in neighbors[end] if position[neighbor] >= 0 and neighbor != previous]
+    if not choices:
+        return
+    k = position[rng.choice(choices)]
+    if tail:
+        path[k + 1:] = path[:k:-1]
+        changed = range(k + 1, len(path))
+    else:
+        path[:k] = path[k - 1::-1]
+        changed = range(k)
+    for index in changed:
+        position[path[index]] = index
+
+def solution_values(path):
+    """Kembalikan nilai setiap sel (daftar baris demi baris) untuk jalur dari `random_path`."""
+    values = [0] * len(path)
+    for number, index in enumerate(path):
+        values[index] = number + 1
+    return values
+
+def puzzle_from(size, values, clues):
+    """Buat `Puzzle` dari nilai solusi dan himpunan indeks sel petunjuk."""
+    return Puzzle(size, tuple((index, values[index]) for index in sorted(clues)))
+
+def find_other_solution(puzzle, values, time_limit=None, table=None):
+    """
+    Cari solusi `puzzle` yang berbeda dari `values` dengan `count_solutions(limit=2)`. Mengembalikan (solusi lain
+    sebagai daftar nilai atau None, jumlah simpul, apakah waktu habis). `table` adalah tabel transposisi opsional
+    yang dipakai bersama oleh pemeriksaan berturut-turut pada jalur solusi yang sama.
+    """
+    result = count_solutions(puzzle.to_board(), 2, time_limit=time_limit, table=table)
+    other = None
+    if result.details["solutions"] > 1:
+        other = list(result.board.values)
+        if other == values:
+            other = [value for row in result.details["alternative"] for value in row]
+    return other, result.iterations, result.timed_out and other is None
+
+def make_puzzle(path, size, rng=random, density=0.3, unique=False, difficulty=None, check_time=1.0):
+    """
+    Ubah jalur solusi menjadi `Puzzle` dengan menyisakan sebagian sel sebagai petunjuk.
+
+    - density: Bagian sel yang dipertahankan sebagai petunjuk (dipilih acak, selalu minimal dua).
+    - unique: Jika True, solusi dijamin tunggal. Selama pencarian eksak menemukan solusi lain, satu sel tempat solusi
+      itu berbeda ditambahkan sebagai petunjuk; ini jauh lebih murah daripada memeriksa setiap penghapusan.
+    - difficulty: Jumlah simpul pencarian eksak minimal. Jika diberikan, petunjuk dihapus satu per satu (tetap tunggal
+      jika `unique`) sampai pencarian membutuhkan setidaknya sebanyak itu atau tidak ada lagi yang bisa dihapus.
+    - check_time: Batas waktu per pemeriksaan eksak dalam detik; pemeriksaan yang habis waktu dianggap gagal dan
+      sebuah petunjuk acak ditambahkan kembali.
+    """
+    cell_count = size * size
+    values = solution_values(path)
+    clues = set(rng.sample(range(cell_count), min(cell_count, max(2, round(cell_count * density)))))
+    # Penugasan yang terbukti buntu tetap buntu setelah petunjuk ditambah atau dihapus, jadi satu tabel dipakai untuk
+    # semua pemeriksaan puzzle ini.
+    table = TranspositionTable()
+    if unique:
+        while True:
+            other, nodes, timed_out = find_other_solution(puzzle_from(size, values, clues), values, check_time,
+                                                          table)
+            if other is None and not timed_out:
+                break
+            if other is not None:
+                candidates = [index for index in range(cell_count) if other[index] != values[index]]
+            else:
+                candidates = [index for index in range(cell_count) if index not in clues]
+            clues.add(rng.choice(candidates))
+
+    if difficulty is not None:
+        order = sorted(clues)
+        rng.shuffle(order)
+        nodes = 0
+        for index in order:
+            if nodes >= difficulty or len(clues) <= 2:
+                break
+            clues.discard(index)
+            other, removed_nodes, timed_out = find_other_solution(puzzle_from(size, values, clues), values,
+                                                                  check_time, table)
+            if timed_out or (unique and other is not None):
+                clues.add(index)
+            else:
+                nodes = removed_nodes
+    return puzzle_from(size, values, clues)
+
+def generate_puzzle(size=9, seed=None, density=0.3, unique=False, difficulty=None, check_time=1.0):
+    """Bangkitkan satu puzzle acak; `seed` yang sama selalu menghasilkan puzzle yang sama."""
+    rng = random.Random(seed)
+    return make_puzzle(random_path(size, rng), size, rng, density, unique, difficulty, check_time)
+
+def generate_puzzles(count, size=9, seed=0, density=0.3, unique=False, difficulty=None, check_time=1.0):
+    """Generator `count` puzzle; puzzle ke-i memakai seed `seed + i` sehingga korpus dapat dibangun ulang."""
+    for number in range(count):
+        puzzle = generate_puzzle(size, seed + number, density, unique, difficulty, check_time)
+        puzzle.number = number + 1
+        yield puzzle
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate random Numbrix puzzles for benchmarks and load tests.")
+    parser.add_argument("--count", type=int, default=100, help="number of puzzles (default: 100)")
+    parser.add_argument("--size", type=int, default=9, help="board size (default: 9)")
+    parser.add_argument("--density", type=float, default=0.3, help="fraction of cells kept as clues (default: 0.3)")
+    parser.add_argument("--unique", action="store_true", help="add clues until the solution is unique")
+    parser.add_argument("--difficulty", type=int, default=None, metavar="NODES",
+                        help="remove clues until the exact solver needs at least NODES nodes")
+    parser.add_argument("--check-time", type=float, default=1.0, help="time limit per uniqueness check in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (default: 0)")
+    parser.add_argument("--output", default=None, help="corpus file to write (default: stdout)")
+    parser.add_argument("--grid", action="store_true", help="write grids separated by blank lines instead of lines")
+    parser.add_argument("--directory", default=None,
+                        help="write one file per puzzle in the samples/ format to this directory instead")
+    args = parser.parse_args(argv)
+    if args.size < 1 or not 0 < args.density <= 1:
+        parser.error("size must be positive and density in (0, 1]")
+
+    start_time = time.perf_counter()
+    puzzles = generate_puzzles(args.count, args.size, args.seed, args.density, args.unique, args.difficulty,
+                               args.check_time)
+    if args.directory:
+        os.makedirs(args.directory, exist_ok=True)
+        width = len(str(args.count))
+        count = 0
+        for puzzle in puzzles:
+            name = f"generated-{args.size}x{args.size}-{args.seed + puzzle.number - 1:0{width}d}.txt"
+            with open(os.path.join(args.directory, name), "w") as f:
+                f.write(puzzle.to_grid() + "\n")
+            count += 1
+    elif args.output:
+        with open(args.output, "w") as f:
+            count = write_puzzles(puzzles, f, args.grid)
+    else:
+        count = write_puzzles(puzzles, sys.stdout, args.grid)
+    elapsed = time.perf_counter() - start_time
+    print(f"Generated {count} puzzles in {elapsed:.2f} seconds ({count / max(elapsed, 1e-9) * 60:.0f} per minute).",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
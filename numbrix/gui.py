@@ -0,0 +1,223 @@
+# gui.py
+import tkinter as tk
+from tkinter import filedialog, messagebox, simpledialog
+from .board import Board
+from .solver import solve, read_input_from_file
+from .steptrace import StepTrace
+from .solution_cache import SolutionCache
+from array import array
+import sqlite3
+import threading
+
+class NumbrixApp:
+    def __init__(self, master, fps=30):
+        self.master = master
+        master.title("Numbrix Solver")
+
+        # Tombol untuk memuat game dari file
+        self.load_button = tk.Button(master, text="Load Game", command=self.load_game)
+
+        # Tombol untuk memulai penyelesaian game
+        self.solve_button = tk.Button(master, text="Solve", command=self.start_solving)
+
+        # Label untuk menampilkan iterasi dan konflik selama penyelesaian
+        self.status_label = tk.Label(master, text="")
+
+        # Cache solusi bersama; GUI tetap berjalan tanpa cache jika file cache tidak dapat dibuka
+        try:
+            self.cache = SolutionCache()
+        except (OSError, sqlite3.Error):
+            self.cache = None
+
+        # Inisialisasi papan
+        self.board = Board()
+        self.buttons = []
+        self.build_grid()
+
+        # Jejak langkah-langkah penyelesaian (pertukaran dua sel per langkah) dan hasil/kemajuan solver
+        self.trace = None
+        self.result = None
+        self.progress = None
+        self.solver_thread = None
+        self.fps = fps  # Batas jumlah frame per detik saat menampilkan kemajuan solver
+
+    def build_grid(self):
+        """
+        Membangun ulang grid tombol sesuai ukuran papan saat ini.
+        """
+        for row_buttons in self.buttons:
+            for btn in row_buttons:
+                btn.destroy()
+
+        size = self.board.size
+        self.buttons = [[None for _ in range(size)] for _ in range(size)]
+        self.shown = [None] * (size * size)  # (teks, warna) yang sedang ditampilkan per sel
+        for i in range(size):
+            for j in range(size):
+                btn = tk.Button(self.master, text='-', width=4, height=2, font=("Helvetica", 16 if size <= 9 else 10),
+                                command=lambda row=i, col=j: self.button_click(row, col))
+                btn.grid(row=i, column=j, padx=1, pady=1, sticky='news')
+                self.buttons[i][j] = btn
+
+        half = (size - 1) // 2
+        self.load_button.grid(row=size, column=0, columnspan=half, pady=10, sticky='news')
+        self.solve_button.grid(row=size, column=size - half, columnspan=half, pady=10, sticky='news')
+        self.status_label.grid(row=size + 1, column=0, columnspan=size, sticky='news')
+
+    def button_click(self, row, col):
+        """
+        Input manual untuk memasukkan angka ke papan.
+        """
+        val = self.board.get(row, col).get()
+        if self.board.get(row, col).is_fixed:
+            messagebox.showwarning("Warning", "Cannot change fixed cells.")
+            return
+        new_val = simpledialog.askinteger("Input", f"Enter value for ({row + 1},{col + 1}):", initialvalue=val)
+        if new_val is not None:
+            if not (1 <= new_val <= self.board.cell_count):
+                messagebox.showerror("Error", f"Value must be between 1 and {self.board.cell_count}.")
+                return
+            self.board.set(row, col, new_val, is_fixed=False)
+            self.update_board()
+
+    def load_game(self):
+        """
+        Fungsi untuk memuat game dari file. Tidak tersedia selama solver berjalan, karena solver memakai papan saat ini.
+        """
+        if self.solver_thread is not None and self.solver_thread.is_alive():
+            return
+        filename = filedialog.askopenfilename(title="Select Numbrix Puzzle File",
+                                              filetypes=(("Text Files", "*.txt"), ("All Files", "*.*")))
+        if filename:
+            try:
+                board = read_input_from_file(filename, cache=self.cache)
+                resized = board.size != self.board.size
+                self.board = board
+                if resized:
+                    self.build_grid()
+                self.update_board()
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+
+    def update_board(self):
+        """
+        Memperbarui tampilan papan UI berdasarkan nilai papan saat ini.
+        """
+        self.show_values(self.board.values)
+
+    def start_solving(self):
+        """
+        Memulai proses penyelesaian dan menampilkan kemajuannya secara langsung.
+        """
+        if not self.validate_board():
+            return
+        if self.solver_thread is not None and self.solver_thread.is_alive():
+            return
+
+        # Solver mencatat setiap perpindahan yang diterima ke jejak, bukan salinan papan
+        self.trace = StepTrace()
+        self.result = None
+        self.progress = None
+        self.solve_button['state'] = 'disabled'
+        self.load_button['state'] = 'disabled'
+
+        def record_progress(sample):
+            """Hook solver: simpan sampel terbaru; GUI hanya membacanya saat menggambar frame."""
+            self.progress = sample
+
+        # Definisikan fungsi untuk menjalankan solver
+        def run_solver():
+            self.result = solve(self.board, "none", trace=self.trace, hook=record_progress, hook_interval=100,
+                                cache=self.cache)
+
+        # Jalankan solver di thread terpisah
+        self.solver_thread = threading.Thread(target=run_solver, daemon=True)
+        self.solver_thread.start()
+
+        # Mulai menggambar frame
+        self.master.after(0, self.render_frame)
+
+    def render_frame(self):
+        """
+        Menggambar keadaan terbaru solver, paling banyak `fps` kali per detik. Langkah di antara dua frame dilewati,
+        sehingga waktu gambar tidak bergantung pada jumlah langkah.
+        """
+        finished = not self.solver_thread.is_alive()
+        if finished and self.result is not None:
+            values = self.result.board.values
+        elif self.trace.current is not None:
+            values = array('H', self.trace.current)  # Salinan, karena solver terus menukar nilai di thread lain
+        else:
+            values = None
+        if values is not None:
+            self.show_values(values, highlight_changes=not finished)
+        self.show_progress(finished)
+
+        if not finished:
+            self.master.after(max(1, 1000 // self.fps), self.render_frame)
+            return
+
+        self.solve_button['state'] = 'normal'
+        self.load_button['state'] = 'normal'
+        if self.result is None:
+            messagebox.showerror("Error", "The solver stopped unexpectedly.")
+        elif self.result.solved:
+            messagebox.showinfo("Success", "Solution found!")
+        elif self.result.details.get("infeasible"):
+            messagebox.showinfo("Info", "This puzzle has no solution.")
+        else:
+            messagebox.showinfo("Info", f"No solution found after {self.result.iterations} iterations.")
+
+    def show_values(self, values, highlight_changes=False):
+        """
+        Tampilkan nilai sel (urut baris demi baris) dan hanya perbarui tombol yang teks atau warnanya berubah.
+        Jika `highlight_changes`, sel yang nilainya berubah sejak frame sebelumnya ditandai kuning.
+        """
+        size = self.board.size
+        fixed = self.board.fixed
+        shown = self.shown
+        for index in range(size * size):
+            value = values[index]
+            text = str(value) if value else "-"
+            if fixed >> index & 1:
+                color = 'light blue'  # Warna untuk sel tetap
+            elif highlight_changes and shown[index] is not None and shown[index][0] != text:
+                color = 'yellow'  # Menandai perubahan
+            else:
+                color = 'light gray'
+            if shown[index] != (text, color):
+                button = self.buttons[index // size][index % size]
+                if shown[index] is None or shown[index][0] != text:
+                    button['text'] = text
+                if shown[index] is None or shown[index][1] != color:
+                    button['bg'] = color
+                shown[index] = (text, color)
+
+    def show_progress(self, finished):
+        """
+        Memperbarui label iterasi dan konflik dari sampel solver terbaru.
+        """
+        if finished and self.result is not None:
+            text = f"Iterations: {self.result.iterations}  Conflicts: {self.result.details.get('conflicts')}"
+        elif self.progress is not None:
+            text = f"Iterations: {self.progress['iteration']}  Conflicts: {self.progress['conflicts']}"
+        else:
+            text = "Solving..."
+        if self.status_label['text'] != text:
+            self.status_label['text'] = text
+
+    def validate_board(self):
+        """
+        Memeriksa apakah papan awal valid sebelum memulai penyelesaian.
+        """
+        numbers = set()
+        size = self.board.size
+        for i in range(size):
+            for j in range(size):
+                val = self.board.get(i, j).get()
+                if val is not None and val != 0:
+                    if val in numbers:
+                        messagebox.showerror("Error", f"Duplicate number {val} found at ({i + 1},{j + 1}).")
+                        return False
+                    numbers.add(val)
+        return True
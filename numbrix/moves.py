@@ -0,0 +1,369 @@
+# moves.py
+
+# Operator ketetanggaan untuk pencarian lokal. Setiap operator mengusulkan perpindahan berupa tuple:
+# ("reverse", a, b) membalik urutan sel angka a..b di sepanjang jalur, ("rotate", a, b, m) menukar urutan rangkaian
+# a..m dan m + 1..b, dan ("swap", i, j) menukar isi sel i dan j.
+OPERATORS = ("reverse", "shift", "two_opt", "or_opt", "block_swap", "window_swap", "swap")
+
+class PathMoves:
+    """
+    Operator perpindahan yang memperhatikan rantai nilai 1, 2, ..., n, dengan pemilihan operator adaptif.
+
+    Papan Numbrix adalah jalur Hamilton; menukar dua nilai acak hampir selalu memutus dua rantai. Operator di sini
+    memindahkan potongan jalur secara utuh:
+    - "reverse": balik urutan sebuah rangkaian angka berurutan; hanya dua sambungan di ujungnya yang berubah.
+    - "shift": geser sebuah rangkaian di sepanjang jalur dengan menukar urutan dua bagiannya (rotasi).
+    - "two_opt": ambil satu sambungan yang putus (k, k + 1) dan balik rangkaian sehingga k + 1 (atau k) berpindah ke
+      sel tetangga ujung lainnya, seperti 2-opt pada jalur.
+    - "or_opt": seperti "two_opt", tetapi rangkaian dirotasi, bukan dibalik (pemindahan segmen ala or-opt).
+    - "block_swap": tukar sel dua rangkaian sepanjang paling banyak `window` dari bagian jalur yang berbeda, sehingga
+      k + 1 (atau k) dari sambungan putus berpindah ke sel tetangga ujung lainnya.
+    - "window_swap": tukar dua angka yang selisihnya paling banyak `window`.
+    - "swap": pertukaran acak dua sel tidak tetap, seperti pada annealing semula.
+
+    Angka tetap (petunjuk) tidak pernah berpindah, sehingga rangkaian yang dibalik atau digeser selalu berada di
+    antara dua petunjuk; "block_swap" adalah satu-satunya operator jalur yang memindahkan rangkaian melewati
+    petunjuk. Perubahan konflik setiap usulan dihitung dari `ConflictTracker` dalam waktu konstan (hanya sambungan di
+    ujung rangkaian yang berubah), tanpa mengubah papan; hanya perpindahan yang diterima yang diterapkan (lewat
+    `apply`).
+
+    Operator dipilih dengan peluang sebanding dengan tingkat keberhasilan terbarunya (rata-rata eksponensial dari
+    usulan yang mengurangi konflik), ditambah batas bawah agar setiap operator tetap dicoba.
+    """
+
+    def __init__(self, tracker, operators=OPERATORS, samples=10, window=4, decay=0.98, floor=0.01):
+        self.tracker = tracker
+        board = tracker.board
+        self.values = board.values
+        self.neighbors = board.geometry.neighbors
+        self.last_value = board.cell_count
+        self.samples = samples
+        self.window = window
+        self.decay = decay
+        self.floor = floor
+        self.operators = tuple(operators)
+        for name in self.operators:
+            if name not in OPERATORS:
+                raise ValueError(f"Unknown move operator '{name}', expected one of {', '.join(OPERATORS)}.")
+        self.proposers = [getattr(self, "propose_" + name) for name in self.operators]
+        self.rates = [1.0] * len(self.operators)
+        self.attempts = [0] * len(self.operators)
+        self.improvements = [0] * len(self.operators)
+        self.evaluations = 0  # Jumlah usulan yang dinilai
+
+        # Angka yang boleh berpindah (bukan petunjuk), sel tidak tetap, dan untuk setiap angka a yang boleh
+        # berpindah, angka terbesar (run_end) dan terkecil (run_start) sehingga seluruh rangkaiannya boleh berpindah.
+        fixed_values = {board.values[index] for index in range(board.cell_count) if board.fixed >> index & 1}
+        self.free_cells = [index for index in range(board.cell_count) if not board.fixed >> index & 1]
+        self.free_values = [value for value in range(1, self.last_value + 1) if value not in fixed_values]
+        self.run_end = [0] * (self.last_value + 2)
+        self.run_start = [0] * (self.last_value + 2)
+        for value in range(self.last_value, 0, -1):
+            if value not in fixed_values:
+                self.run_end[value] = self.run_end[value + 1] or value
+        for value in range(1, self.last_value + 1):
+            if value not in fixed_values:
+                self.run_start[value] = self.run_start[value - 1] or value
+
+    def choose(self, rng):
+        """Pilih indeks operator secara acak sebanding dengan tingkat keberhasilannya."""
+        weights = [rate + self.floor for rate in self.rates]
+        pick = rng.random() * sum(weights)
+        for operator, weight in enumerate(weights):
+            pick -= weight
+            if pick < 0:
+                return operator
+        return len(weights) - 1
+
+    def propose(self, rng):
+        """
+        Pilih operator dan usulkan perpindahan terbaik dari beberapa sampel.
+        Mengembalikan (operator, perpindahan, delta), dengan perpindahan None jika operator tidak menemukan usulan.
+        """
+        operator = self.choose(rng)
+        move, delta = self.proposers[operator](rng)
+        return operator, move, delta
+
+    def record(self, operator, delta):
+        """Perbarui statistik operator dengan hasil usulannya (berhasil jika konflik berkurang)."""
+        improved = delta is not None and delta < 0
+        self.attempts[operator] += 1
+        self.improvements[operator] += improved
+        self.rates[operator] = self.rates[operator] * self.decay + (1 - self.decay) * improved
+
+    def stats(self):
+        """Jumlah usulan dan usulan yang mengurangi konflik per operator."""
+        return {name: {"attempts": self.attempts[operator], "improvements": self.improvements[operator]}
+                for operator, name in enumerate(self.operators)}
+
+    # Perubahan konflik, dihitung dari posisi dan biaya sambungan saat ini tanpa mengubah papan.
+
+    def reverse_delta(self, first, last):
+        """Perubahan konflik jika urutan angka `first`..`last` dibalik."""
+        tracker = self.tracker
+        position = tracker.position
+        link_costs = tracker.link_costs
+        delta = 0
+        if first > 1:
+            delta += tracker.pair_cost(position[first - 1], position[last]) - link_costs[first - 1]
+        if last < self.last_value:
+            delta += tracker.pair_cost(position[first], position[last + 1]) - link_costs[last]
+        return delta
+
+    def rotate_delta(self, first, last, split):
+        """
+        Perubahan konflik jika rangkaian `first`..`split` dan `split + 1`..`last` bertukar urutan di sepanjang jalur:
+        angka `first` pindah ke sel `split + 1`, dan seterusnya. Sambungan di dalam kedua bagian tetap utuh, jadi
+        hanya tiga sambungan yang berubah.
+        """
+        tracker = self.tracker
+        position = tracker.position
+        link_costs = tracker.link_costs
+        pair_cost = tracker.pair_cost
+        delta = pair_cost(position[last], position[first]) - link_costs[split]
+        if first > 1:
+            delta += pair_cost(position[first - 1], position[split + 1]) - link_costs[first - 1]
+        if last < self.last_value:
+            delta += pair_cost(position[split], position[last + 1]) - link_costs[last]
+        return delta
+
+    def block_delta(self, first, other, length, flipped):
+        """
+        Perubahan konflik jika rangkaian `first`..`first + length - 1` dan `other`..`other + length - 1` (tidak
+        bersinggungan, `first` < `other`) bertukar sel, dengan urutan dibalik jika `flipped`. Hanya empat sambungan
+        di ujung kedua rangkaian yang berubah.
+        """
+        tracker = self.tracker
+        position = tracker.position
+        link_costs = tracker.link_costs
+        pair_cost = tracker.pair_cost
+        first_end = first + length - 1
+        other_end = other + length - 1
+        if flipped:
+            new_first, new_first_end = position[other_end], position[other]
+            new_other, new_other_end = position[first_end], position[first]
+        else:
+            new_first, new_first_end = position[other], position[other_end]
+            new_other, new_other_end = position[first], position[first_end]
+        delta = (pair_cost(new_first_end, position[first_end + 1]) - link_costs[first_end]
+                 + pair_cost(position[other - 1], new_other) - link_costs[other - 1])
+        if first > 1:
+            delta += pair_cost(position[first - 1], new_first) - link_costs[first - 1]
+        if other_end < self.last_value:
+            delta += pair_cost(new_other_end, position[other_end + 1]) - link_costs[other_end]
+        return delta
+
+    def move_delta(self, move):
+        """Perubahan konflik untuk sebuah perpindahan."""
+        kind = move[0]
+        if kind == "reverse":
+            return self.reverse_delta(move[1], move[2])
+        if kind == "rotate":
+            return self.rotate_delta(move[1], move[2], move[3])
+        if kind == "block":
+            return self.block_delta(move[1], move[2], move[3], move[4])
+        return self.tracker.swap_delta(move[1], move[2])
+
+    # Operator. Setiap operator mengembalikan (perpindahan terbaik, delta) atau (None, None).
+
+    def _random_run(self, rng, min_length):
+        """Pilih rangkaian angka bebas a..b acak dengan panjang minimal `min_length`, atau None."""
+        if not self.free_values:
+            return None
+        first = self.free_values[rng.randrange(len(self.free_values))]
+        end = self.run_end[first]
+        if end - first + 1 < min_length:
+            return None
+        return first, first + min_length - 1 + rng.randrange(end - first + 2 - min_length)
+
+    def _best_of(self, candidates):
+        """Nilai semua kandidat perpindahan (None dilewati) dan kembalikan (perpindahan, delta) terbaik."""
+        best_move = best_delta = None
+        for move in candidates:
+            if move is None:
+                continue
+            delta = self.move_delta(move)
+            self.evaluations += 1
+            if best_delta is None or delta < best_delta:
+                best_move, best_delta = move, delta
+        return best_move, best_delta
+
+    def _broken_link(self, rng):
+        """Pilih sambungan putus (k, k + 1) mulai dari titik acak, atau None; biaya sebanding n / jumlah yang putus."""
+        tracker = self.tracker
+        link_costs = tracker.link_costs
+        last_link = tracker.last_link
+        if tracker.total == 0 or last_link < 1:
+            return None
+        link = rng.randrange(1, last_link + 1)
+        while not link_costs[link]:
+            link = link + 1 if link < last_link else 1
+        return link
+
+    def _repair_targets(self, link):
+        """
+        Untuk sambungan putus k = `link`, kembalikan angka j di sel tetangga k dengan j > k + 1 dan angka j di sel
+        tetangga k + 1 dengan j < k, masing-masing hanya jika rangkaian di antaranya boleh berpindah.
+        """
+        position = self.tracker.position
+        values = self.values
+        run_end = self.run_end
+        after = []
+        before = []
+        if position[link] >= 0:
+            for cell in self.neighbors[position[link]]:
+                value = values[cell]
+                if value > link + 1 and run_end[link + 1] >= value:
+                    after.append(value)
+        if position[link + 1] >= 0:
+            for cell in self.neighbors[position[link + 1]]:
+                value = values[cell]
+                if 0 < value < link and run_end[value] >= link:
+                    before.append(value)
+        return after, before
+
+    def propose_reverse(self, rng):
+        def build():
+            run = self._random_run(rng, 2)
+            return None if run is None else ("reverse",) + run
+        return self._best_of(build() for _ in range(self.samples))
+
+    def propose_shift(self, rng):
+        def build():
+            run = self._random_run(rng, 2)
+            if run is None:
+                return None
+            first, last = run
+            return ("rotate", first, last, first + rng.randrange(last - first))
+        return self._best_of(build() for _ in range(self.samples))
+
+    def propose_two_opt(self, rng):
+        # Balik k + 1 .. j agar k + 1 pindah ke sel tetangga k, atau j .. k agar k pindah ke sel tetangga k + 1.
+        link = self._broken_link(rng)
+        if link is None:
+            return None, None
+        after, before = self._repair_targets(link)
+        return self._best_of([("reverse", link + 1, value) for value in after]
+                             + [("reverse", value, link) for value in before])
+
+    def propose_or_opt(self, rng):
+        # Pindahkan rangkaian j .. b ke depan k + 1 .. j - 1 sehingga j berpindah ke sel k + 1 (di sebelah k), atau
+        # rangkaian a .. j ke belakang j + 1 .. k sehingga k berpindah ke sel j (di sebelah k + 1).
+        link = self._broken_link(rng)
+        if link is None:
+            return None, None
+        after, before = self._repair_targets(link)
+        run_end = self.run_end
+        run_start = self.run_start
+        candidates = []
+        for value in after:
+            for _ in range(self.samples // 2 or 1):
+                candidates.append(("rotate", link + 1, value + rng.randrange(run_end[value] - value + 1), value - 1))
+        for value in before:
+            for _ in range(self.samples // 2 or 1):
+                candidates.append(("rotate", value - rng.randrange(value - run_start[value] + 1), link, value))
+        return self._best_of(candidates)
+
+    def _block_move(self, first, other, length, flipped):
+        """Bangun perpindahan "block" yang sah (rangkaian tidak bersinggungan dan boleh berpindah), atau None."""
+        if first > other:
+            first, other = other, first
+        if length < 1 or first < 1 or other + length - 1 > self.last_value or first + length >= other:
+            return None
+        run_end = self.run_end
+        if run_end[first] < first + length - 1 or run_end[other] < other + length - 1:
+            return None
+        return ("block", first, other, length, flipped)
+
+    def propose_block_swap(self, rng):
+        # Tukar sel dua rangkaian sepanjang L dari bagian jalur yang berbeda, misalnya dua rangkaian di antara
+        # petunjuk yang berlainan. Jika ada sambungan putus (k, k + 1), rangkaian yang dimulai di k + 1 ditukar dengan
+        # rangkaian yang memuat angka j di sel tetangga k, sehingga k + 1 berpindah ke sebelah k.
+        link = self._broken_link(rng)
+        if link is None:
+            return None, None
+        position = self.tracker.position
+        values = self.values
+        max_length = self.window
+        candidates = []
+        if position[link] >= 0:
+            for cell in self.neighbors[position[link]]:
+                value = values[cell]
+                if value and value != link + 1:
+                    length = 1 + rng.randrange(max_length)
+                    candidates.append(self._block_move(link + 1, value, length, False))
+                    candidates.append(self._block_move(link + 1, value - length + 1, length, True))
+        if position[link + 1] >= 0:
+            for cell in self.neighbors[position[link + 1]]:
+                value = values[cell]
+                if value and value != link:
+                    length = 1 + rng.randrange(max_length)
+                    candidates.append(self._block_move(link - length + 1, value - length + 1, length, False))
+                    candidates.append(self._block_move(link - length + 1, value, length, True))
+        return self._best_of(candidates)
+
+    def propose_window_swap(self, rng):
+        position = self.tracker.position
+        window = self.window
+        run_end = self.run_end
+
+        def build():
+            value = self.free_values[rng.randrange(len(self.free_values))]
+            other = value + rng.randrange(1, window + 1) * (1 if rng.random() < 0.5 else -1)
+            if not 1 <= other <= self.last_value or not run_end[other] or position[other] < 0:
+                return None
+            return ("swap", position[value], position[other])
+        return self._best_of(build() for _ in range(self.samples))
+
+    def propose_swap(self, rng):
+        free_cells = self.free_cells
+
+        def build():
+            if len(free_cells) < 2:
+                return None
+            first = rng.randrange(len(free_cells))
+            second = rng.randrange(len(free_cells) - 1)
+            if second >= first:
+                second += 1
+            return ("swap", free_cells[first], free_cells[second])
+        return self._best_of(build() for _ in range(self.samples))
+
+    def apply(self, move):
+        """
+        Terapkan perpindahan pada papan dan `ConflictTracker` sebagai rangkaian pertukaran sel.
+        Mengembalikan daftar pertukaran (index1, index2) yang dilakukan, misalnya untuk `StepTrace.record_swap`.
+        """
+        kind = move[0]
+        tracker = self.tracker
+        if kind == "swap":
+            tracker.apply_swap(move[1], move[2])
+            return [(move[1], move[2])]
+
+        # Susun sel tujuan untuk setiap angka yang berpindah, lalu tempatkan setiap angka di selnya dengan satu
+        # pertukaran; angka yang sudah ditempatkan tidak tersentuh lagi.
+        position = tracker.position
+        if kind == "block":
+            _, first, other, length, flipped = move
+            moved = list(range(first, first + length)) + list(range(other, other + length))
+            first_cells = position[first:first + length]
+            other_cells = position[other:other + length]
+            if flipped:
+                first_cells.reverse()
+                other_cells.reverse()
+            cells = other_cells + first_cells
+        else:
+            first, last = move[1], move[2]
+            moved = range(first, last + 1)
+            cells = position[first:last + 1]
+            if kind == "reverse":
+                cells.reverse()
+            else:
+                split = move[3] - first + 1
+                cells = cells[split:] + cells[:split]
+        swaps = []
+        for value, cell in zip(moved, cells):
+            current = position[value]
+            if current != cell:
+                swaps.append((current, cell))
+                tracker.apply_swap(current, cell)
+        return swaps
@@ -0,0 +1,118 @@
+# parallel.py
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .solution_cache import SolutionCache
+from .solver import SolveResult, cached_result, read_input_from_file, solve
+
+# Event pembatalan bersama, diset di setiap proses pekerja oleh `_init_worker`.
+_stop_event = None
+
+def _init_worker(stop_event):
+    """Simpan event pembatalan bersama di proses pekerja."""
+    global _stop_event
+    _stop_event = stop_event
+
+def run_chain(board, seed, time_limit=None):
+    """
+    Jalankan satu rantai annealing dengan `random.Random(seed)` miliknya sendiri.
+
+    Mengembalikan `SolveResult` dari `solve`, dengan "seed" ditambahkan ke `details`.
+    """
+    result = solve(board, "quiet", time_limit=time_limit, rng=random.Random(seed), stop_event=_stop_event)
+    result.details["seed"] = seed
+    return result
+
+def solve_parallel(board, chains=4, seed=None, workers=None, time_limit=None, debug_level="none", cache=None):
+    """
+    Menyelesaikan puzzle dengan beberapa rantai Simulated Annealing independen yang berjalan paralel.
+
+    Parameter:
+    - board: Papan permainan Numbrix yang akan diselesaikan.
+    - chains: Jumlah rantai; rantai ke-k memakai seed `seed + k`, sehingga hasilnya dapat diulang.
+    - seed: Seed dasar, atau None untuk memilih seed secara acak.
+    - workers: Jumlah proses (default: min(chains, jumlah CPU)).
+    - time_limit: Batas waktu per rantai dalam detik.
+    - debug_level: "quiet" tidak mencetak apa pun.
+    - cache: `SolutionCache` opsional; solusi tersimpan dikembalikan tanpa menjalankan rantai.
+
+    Begitu satu rantai mencapai nol konflik, rantai lain diminta berhenti lewat event bersama dan rantai yang belum
+    dimulai dibatalkan. Mengembalikan `SolveResult` dengan papan rantai pemenang; `iterations` dan `counters`
+    dijumlahkan dari semua rantai, sedangkan `details` berisi seed pemenang ("winning_seed", None jika tidak ada)
+    dan hasil setiap rantai yang sempat berjalan ("chains", diurutkan menurut seed).
+    """
+    start_time = time.perf_counter()
+    if cache is not None:
+        result = cached_result(board, cache, debug_level, start_time)
+        if result is not None:
+            return result
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+    workers = workers or min(chains, os.cpu_count() or 1)
+
+    stop_event = multiprocessing.Event()
+    result = SolveResult()
+    winning_seed = None
+    chain_results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stop_event,)) as executor:
+        pending = {executor.submit(run_chain, board, seed + chain, time_limit) for chain in range(chains)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                chain = future.result()
+                chain_results.append(chain)
+                if chain.solved and not result.solved:
+                    result.board = chain.board
+                    result.solved = True
+                    winning_seed = chain.details["seed"]
+                    stop_event.set()
+                    for other in pending:
+                        other.cancel()
+
+    chain_results.sort(key=lambda chain: chain.details["seed"])
+    for chain in chain_results:
+        result.iterations += chain.iterations
+        for name, count in chain.counters.items():
+            result.counters[name] = result.counters.get(name, 0) + count
+    result.timed_out = not result.solved and any(chain.timed_out for chain in chain_results)
+    result.details = {"winning_seed": winning_seed, "chains": chain_results}
+    if cache is not None and result.solved:
+        cache.put(board, result.board)
+    result.elapsed = time.perf_counter() - start_time
+    if debug_level != "quiet":
+        if result.solved:
+            print(f"Success! Chain with seed {winning_seed} found a solution in {result.elapsed:.3f} seconds "
+                  f"({len(chain_results)} of {chains} chains ran).")
+            print(result.board)
+        else:
+            print(f"Failed to find a solution with {chains} chains in {result.elapsed:.3f} seconds.")
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a Numbrix puzzle with parallel annealing chains.")
+    parser.add_argument("puzzle", help="puzzle file")
+    parser.add_argument("--chains", type=int, default=4, help="number of independent chains (default: 4)")
+    parser.add_argument("--seed", type=int, default=None, help="base seed; chain k uses seed + k")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="time limit per chain in seconds")
+    parser.add_argument("--cache", default=None, metavar="PATH", help="solution cache file to read and update")
+    args = parser.parse_args(argv)
+
+    cache = None if args.cache is None else SolutionCache(args.cache)
+    board = read_input_from_file(args.puzzle, cache=cache)
+    result = solve_parallel(board, args.chains, args.seed, args.workers, args.timeout, cache=cache)
+    for chain in result.details.get("chains", ()):
+        print(f"seed {chain.details['seed']}: {chain.iterations} iterations, {chain.details['conflicts']} conflicts, "
+              f"acceptance rate {chain.acceptance_rate:.3f}, {chain.elapsed:.3f} seconds"
+              + (" (cancelled)" if chain.cancelled else ""))
+    return 0 if result.solved else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
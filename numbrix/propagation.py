@@ -0,0 +1,251 @@
+# propagation.py
+from .board import are_adjacent, iter_mask, value_range_mask
+
+PRUNE_RULES = ("parity", "reachability", "connectivity", "forced")
+
+def new_prune_counts():
+    """Buat penghitung pemangkasan per aturan, diisi oleh `propagate`."""
+    return dict.fromkeys(PRUNE_RULES, 0)
+
+def propagate(board, counts):
+    """
+    Jalankan propagasi batasan pada papan sampai tidak ada lagi yang berubah (fixpoint).
+
+    Aturan yang dijalankan secara bergantian:
+     * parity: angka berurutan selalu berada di sel dengan warna papan catur yang berbeda, sehingga paritas nilai
+       harus cocok dengan warna sel
+     * reachability: nilai di antara dua angka yang sudah ditempatkan a dan b harus dapat dicapai dari keduanya
+       melalui sel kosong saja, bukan sekadar menurut jarak Manhattan
+     * connectivity: setiap wilayah sel kosong yang terhubung harus dapat diisi tepat oleh deretan nilai yang hilang
+       yang dapat memasukinya
+     * forced: sel dengan satu kemungkinan nilai, atau nilai yang hanya mungkin di satu sel, langsung ditempatkan
+
+    Semua perubahan melalui `Board.restrict` dan `Board.set`, sehingga tercatat di jejak papan jika aktif.
+    `counts` (lihat `new_prune_counts`) ditambah untuk setiap domain yang dipersempit, penempatan paksa, atau keadaan
+    yang ditolak oleh aturan tersebut. Mengembalikan False jika papan terbukti tidak mungkin diselesaikan.
+    """
+    while True:
+        if not apply_parity(board, counts):
+            return False
+        if not apply_reachability(board, counts):
+            return False
+        if not apply_connectivity(board, counts):
+            return False
+        forced = assign_forced(board, counts)
+        if forced is None:
+            return False
+        if not forced:
+            return True
+
+def value_positions(board):
+    """Kembalikan daftar posisi sel untuk setiap nilai (-1 jika belum ditempatkan) dan daftar nilai yang ditempatkan."""
+    position = [-1] * (board.cell_count + 2)
+    for index, value in enumerate(board.values):
+        if value:
+            position[value] = index
+    return position, [value for value in range(1, board.cell_count + 1) if position[value] >= 0]
+
+def free_distances(board, start, limit):
+    """Jarak langkah dari sel `start` ke setiap sel kosong yang dapat dicapai melalui sel kosong saja, hingga `limit`."""
+    values = board.values
+    neighbors = board.geometry.neighbors
+    distances = {}
+    frontier = [start]
+    for distance in range(1, limit + 1):
+        next_frontier = []
+        for index in frontier:
+            for neighbor in neighbors[index]:
+                if not values[neighbor] and neighbor not in distances:
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return distances
+
+def apply_parity(board, counts):
+    """Batasi domain setiap sel kosong pada nilai dengan paritas yang cocok dengan warna selnya."""
+    values = board.values
+    geometry = board.geometry
+    size = geometry.size
+    # Papan dengan jumlah sel ganjil (misalnya 9x9: 41 sel "genap" untuk 41 nilai ganjil) selalu menempatkan nilai
+    # ganjil di sel dengan baris + kolom genap. Pada papan genap, arah paritas diambil dari angka pertama yang ada.
+    offset = 1 if geometry.cell_count % 2 else None
+    for index in range(geometry.cell_count):
+        value = values[index]
+        if value:
+            cell_offset = (value + index // size + index % size) % 2
+            if offset is None:
+                offset = cell_offset
+            elif cell_offset != offset:
+                counts["parity"] += 1
+                return False
+    if offset is None:
+        return True
+
+    for index in range(geometry.cell_count):
+        if not values[index]:
+            mask = geometry.odd_values if (index // size + index % size + offset) % 2 else geometry.even_values
+            if board.restrict(index, mask):
+                counts["parity"] += 1
+                if not board.domains[index]:
+                    return False
+    return True
+
+def apply_reachability(board, counts):
+    """Batasi domain sel kosong pada nilai yang dapat dicapai dari angka terdekat di bawah dan di atasnya."""
+    values = board.values
+    cell_count = board.cell_count
+    position, placed = value_positions(board)
+    if not placed:
+        return True
+
+    allowed = [0] * cell_count
+    first = placed[0]
+    if first > 1:
+        for index, distance in free_distances(board, position[first], first - 1).items():
+            allowed[index] |= value_range_mask(1, first - distance, cell_count)
+    for low, high in zip(placed, placed[1:]):
+        if high == low + 1:
+            if not are_adjacent(position[low], position[high], board.size):
+                counts["reachability"] += 1
+                return False
+            continue
+        from_low = free_distances(board, position[low], high - low - 1)
+        from_high = free_distances(board, position[high], high - low - 1)
+        reachable = False
+        for index, low_distance in from_low.items():
+            high_distance = from_high.get(index)
+            if high_distance is not None and low_distance + high_distance <= high - low:
+                allowed[index] |= value_range_mask(low + low_distance, high - high_distance, cell_count)
+                reachable = True
+        if not reachable:
+            counts["reachability"] += 1
+            return False
+    last = placed[-1]
+    if last < cell_count:
+        for index, distance in free_distances(board, position[last], cell_count - last).items():
+            allowed[index] |= value_range_mask(last + distance, cell_count, cell_count)
+
+    for index in range(cell_count):
+        if not values[index] and board.restrict(index, allowed[index]):
+            counts["reachability"] += 1
+            if not board.domains[index]:
+                return False
+    return True
+
+def apply_connectivity(board, counts):
+    """Periksa bahwa wilayah sel kosong dapat diisi tepat oleh deretan nilai yang hilang.
+
+    Setiap deretan nilai yang hilang (di antara dua angka yang ditempatkan, atau di ujung 1 / n) harus berada
+    seluruhnya di satu wilayah yang menyentuh ujung-ujungnya. Sebuah wilayah ditolak jika lebih besar dari total
+    deretan yang dapat memasukinya, atau lebih kecil dari total deretan yang hanya dapat masuk ke wilayah itu.
+    Domain sel di setiap wilayah juga dibatasi pada nilai deretan yang dapat memasuki wilayah tersebut.
+    """
+    values = board.values
+    neighbors = board.geometry.neighbors
+    cell_count = board.cell_count
+    region_of = [-1] * cell_count
+    sizes = []
+    for start in range(cell_count):
+        if values[start] or region_of[start] >= 0:
+            continue
+        region = len(sizes)
+        region_of[start] = region
+        stack = [start]
+        size = 0
+        while stack:
+            index = stack.pop()
+            size += 1
+            for neighbor in neighbors[index]:
+                if not values[neighbor] and region_of[neighbor] < 0:
+                    region_of[neighbor] = region
+                    stack.append(neighbor)
+        sizes.append(size)
+    if not sizes:
+        return True
+
+    def touching(index):
+        """Wilayah yang bersebelahan dengan sel `index`."""
+        return {region_of[neighbor] for neighbor in neighbors[index] if region_of[neighbor] >= 0}
+
+    position, placed = value_positions(board)
+    runs = []  # (nilai terendah, nilai tertinggi, wilayah yang mungkin)
+    if not placed:
+        runs.append((1, cell_count, set(range(len(sizes)))))
+    else:
+        if placed[0] > 1:
+            runs.append((1, placed[0] - 1, touching(position[placed[0]])))
+        for low, high in zip(placed, placed[1:]):
+            if high > low + 1:
+                runs.append((low + 1, high - 1, touching(position[low]) & touching(position[high])))
+        if placed[-1] < cell_count:
+            runs.append((placed[-1] + 1, cell_count, touching(position[placed[-1]])))
+
+    capacity = [0] * len(sizes)
+    required = [0] * len(sizes)
+    region_masks = [0] * len(sizes)
+    for low, high, regions in runs:
+        if not regions:
+            counts["connectivity"] += 1
+            return False
+        mask = value_range_mask(low, high, cell_count)
+        for region in regions:
+            capacity[region] += high - low + 1
+            region_masks[region] |= mask
+        if len(regions) == 1:
+            required[next(iter(regions))] += high - low + 1
+    for region, size in enumerate(sizes):
+        if capacity[region] < size or required[region] > size:
+            counts["connectivity"] += 1
+            return False
+
+    for index in range(cell_count):
+        if region_of[index] >= 0 and board.restrict(index, region_masks[region_of[index]]):
+            counts["connectivity"] += 1
+            if not board.domains[index]:
+                return False
+    return True
+
+def assign_forced(board, counts):
+    """Tempatkan sel yang hanya memiliki satu kemungkinan nilai, dan nilai yang hanya mungkin di satu sel.
+
+    Mengembalikan jumlah penempatan, atau None jika ada sel tanpa kemungkinan nilai atau nilai tanpa sel.
+    """
+    values = board.values
+    domains = board.domains
+    size = board.size
+    cell_count = board.cell_count
+    forced = 0
+    for index in range(cell_count):
+        if not values[index]:
+            domain = domains[index]
+            if not domain:
+                counts["forced"] += 1
+                return None
+            if not domain & (domain - 1):
+                board.set(index // size, index % size, domain.bit_length() - 1)
+                forced += 1
+
+    placed = 0
+    seen_once = 0
+    seen_twice = 0
+    for index in range(cell_count):
+        if values[index]:
+            placed |= 1 << values[index]
+        else:
+            seen_twice |= seen_once & domains[index]
+            seen_once |= domains[index]
+    missing = board.geometry.full_domain & ~placed
+    if missing & ~seen_once:
+        counts["forced"] += 1
+        return None
+    for value in iter_mask(missing & seen_once & ~seen_twice):
+        for index in range(cell_count):
+            if not values[index] and domains[index] >> value & 1:
+                board.set(index // size, index % size, value)
+                forced += 1
+                break
+
+    counts["forced"] += forced
+    return forced
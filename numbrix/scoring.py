@@ -0,0 +1,76 @@
+# scoring.py
+from .board import ConflictTracker
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional; tanpa NumPy dipakai jalur Python murni
+    np = None
+
+HAVE_NUMPY = np is not None
+
+def _use_numpy(use_numpy):
+    """Tentukan backend: None berarti NumPy jika tersedia."""
+    if use_numpy is None:
+        return HAVE_NUMPY
+    if use_numpy and not HAVE_NUMPY:
+        raise RuntimeError("NumPy is not installed.")
+    return use_numpy
+
+def stack_boards(boards):
+    """Susun nilai papan-papan berukuran sama menjadi array NumPy (K, N, N)."""
+    size = boards[0].size
+    stack = np.array([board.values for board in boards], dtype=np.int32)
+    return stack.reshape(len(boards), size, size)
+
+def conflict_counts(stack):
+    """
+    Hitung jumlah konflik setiap papan dalam array (K, N, N) sekaligus.
+
+    Setiap angka yang ditempatkan mengharapkan dua tetangga (satu untuk 1 dan nilai terbesar); setiap pasangan sel
+    bertetangga yang nilainya berselisih tepat 1 memenuhi satu harapan di kedua sisinya. Pasangan tersebut dicari
+    dengan membandingkan array yang digeser satu kolom dan satu baris, sehingga hasilnya sama dengan
+    `Board.calculate_conflicts()` untuk papan tanpa angka ganda.
+    """
+    top = stack.shape[1] * stack.shape[2]
+    placed = stack > 0
+    expected = 2 * placed.sum(axis=(1, 2)) - (stack == 1).sum(axis=(1, 2))
+    if top > 1:
+        expected -= (stack == top).sum(axis=(1, 2))
+
+    horizontal = (np.abs(stack[:, :, 1:] - stack[:, :, :-1]) == 1) & placed[:, :, 1:] & placed[:, :, :-1]
+    vertical = (np.abs(stack[:, 1:, :] - stack[:, :-1, :]) == 1) & placed[:, 1:, :] & placed[:, :-1, :]
+    found = 2 * (horizontal.sum(axis=(1, 2)) + vertical.sum(axis=(1, 2)))
+    return expected - found
+
+def score_boards(boards, use_numpy=None):
+    """
+    Kembalikan daftar jumlah konflik untuk `boards` (semua berukuran sama): satu kali evaluasi tervektorisasi
+    dengan NumPy, atau `calculate_conflicts` per papan tanpa NumPy.
+    """
+    if not boards:
+        return []
+    if _use_numpy(use_numpy):
+        return conflict_counts(stack_boards(boards)).tolist()
+    return [board.calculate_conflicts() for board in boards]
+
+def score_swaps(board, pairs, use_numpy=None):
+    """
+    Kembalikan jumlah konflik `board` setelah masing-masing pertukaran (index1, index2) di `pairs`, tiap pertukaran
+    diterapkan sendiri-sendiri pada papan asal. Dengan NumPy, K salinan papan dibangun sebagai array (K, N, N) dan
+    dinilai sekaligus; tanpa NumPy dipakai skor inkremental `ConflictTracker.swap_delta`.
+    """
+    if not pairs:
+        return []
+    if not _use_numpy(use_numpy):
+        tracker = ConflictTracker(board)
+        return [tracker.total + tracker.swap_delta(index1, index2) for index1, index2 in pairs]
+
+    size = board.size
+    count = len(pairs)
+    flat = np.tile(np.array(board.values, dtype=np.int32), (count, 1))
+    first, second = np.array(pairs, dtype=np.intp).T
+    rows = np.arange(count)
+    swapped = flat[rows, first]
+    flat[rows, first] = flat[rows, second]
+    flat[rows, second] = swapped
+    return conflict_counts(flat.reshape(count, size, size)).tolist()
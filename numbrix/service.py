@@ -0,0 +1,491 @@
+# service.py
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from .strategies import METHODS, solve_board
+from .corpus import parse_line
+
+MAX_BODY = 1 << 20  # Ukuran body permintaan terbesar yang diterima, dalam byte
+DEFAULT_MAX_SIZE = 30  # Sisi papan terbesar yang diterima secara bawaan
+LATENCY_WINDOW = 1000  # Jumlah latensi terakhir untuk persentil
+PROGRESS_BACKLOG = 100  # Event progres yang belum terkirim per klien sebelum event baru dibuang
+
+# Diset di setiap proses pekerja oleh `_init_worker`: satu flag pembatalan per slot dispatcher dan antrean progres.
+_cancel_flags = None
+_progress_queue = None
+
+def _init_worker(cancel_flags, progress_queue):
+    """Simpan flag pembatalan dan antrean progres bersama di proses pekerja."""
+    global _cancel_flags, _progress_queue
+    _cancel_flags = cancel_flags
+    _progress_queue = progress_queue
+
+class SlotEvent:
+    """Event pembatalan untuk satu slot: `is_set()` membaca flag di memori bersama tanpa lock."""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def is_set(self):
+        return _cancel_flags[self.slot] != 0
+
+def run_job(slot, puzzle, method, timeout, seed, progress_interval):
+    """
+    Jalankan satu pekerjaan di proses pekerja dan kembalikan dict hasil seperti `strategies.solve_file`.
+
+    Semua metode berhenti lewat `stop_event` jika pekerjaan dibatalkan. Hanya jika `progress_interval` diberikan, sampel
+    progres dikirim ke antrean progres setiap sekian iterasi atau simpul; tanpa itu pemecah berjalan tanpa hook.
+    """
+    start_time = time.perf_counter()
+
+    def send_progress(sample):
+        _progress_queue.put((slot, dict(sample)))
+
+    hook = send_progress if progress_interval else None
+    result = {"method": method, "status": "error", "solution": None, "iterations": 0}
+    solve_board(puzzle.to_board(), method, timeout, seed, None, result, SlotEvent(slot), hook,
+                progress_interval or 1000)
+    result["elapsed"] = round(time.perf_counter() - start_time, 6)
+    return result
+
+class ServiceBusy(Exception):
+    """Antrean penuh; klien sebaiknya mencoba lagi nanti."""
+
+class Job:
+    """Satu puzzle yang diminta, dibagi oleh semua permintaan identik yang sedang berjalan."""
+    __slots__ = ("id", "key", "puzzle", "method", "timeout", "seed", "progress_interval", "future", "waiters",
+                 "listeners", "state", "slot", "submitted", "started")
+
+    def __init__(self, job_id, key, puzzle, method, timeout, seed, progress_interval, future):
+        self.id = job_id
+        self.key = key
+        self.puzzle = puzzle
+        self.method = method
+        self.timeout = timeout
+        self.seed = seed
+        self.progress_interval = progress_interval
+        self.future = future
+        self.waiters = 0
+        self.listeners = set()  # asyncio.Queue per klien yang meminta progres
+        self.state = "queued"  # "queued", "running", "done" atau "cancelled"
+        self.slot = None
+        self.submitted = time.perf_counter()
+        self.started = None
+
+class SolveService:
+    """
+    Layanan pemecah lokal: antrean pekerjaan berbatas di depan process pool yang tetap hangat.
+
+    - Setiap dispatcher (satu per pekerja) mengambil pekerjaan dari antrean dan menjalankannya di pool dengan slot
+      pembatalannya sendiri, sehingga paling banyak `workers` pekerjaan berjalan sekaligus.
+    - Permintaan untuk puzzle, metode, batas waktu dan seed yang sama dengan pekerjaan yang masih berjalan atau
+      mengantre digabung.
+    - Jika antrean penuh, `submit` melempar `ServiceBusy` alih-alih menunggu (backpressure). Yang dihitung hanya
+      pekerjaan yang masih hidup (`queued`); pekerjaan yang dibatalkan saat mengantre tidak memakan tempat meskipun
+      masih ada di `asyncio.Queue` sampai dispatcher melewatinya.
+    - Puzzle yang lebih besar dari `max_size` x `max_size` ditolak oleh `parse_request`.
+    - Pekerjaan dibatalkan jika semua klien yang menunggunya pergi, lewat `cancel`, atau jika melewati batas
+      waktunya ditambah `grace` detik.
+    """
+
+    def __init__(self, workers=None, queue_size=64, grace=1.0, progress_interval=1000, max_size=DEFAULT_MAX_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.max_size = max_size
+        self.queued = 0  # Pekerjaan yang mengantre dan belum dibatalkan
+        self.grace = grace
+        self.progress_interval = progress_interval
+        self.jobs = {}  # id -> Job untuk pekerjaan yang belum selesai
+        self.by_key = {}  # kunci dedupe -> Job
+        self.running = [None] * self.workers  # Job per slot
+        self.ids = itertools.count(1)
+        self.counters = dict.fromkeys(("submitted", "deduplicated", "rejected", "completed", "cancelled",
+                                       "timeouts", "errors"), 0)
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.finished_at = deque(maxlen=LATENCY_WINDOW)
+        self.started_at = time.perf_counter()
+
+    async def start(self):
+        """Mulai pool dan tunggu semua pekerja siap, sehingga permintaan pertama tidak membayar biaya start."""
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()  # Tidak dibatasi di sini; backpressure memakai `queued` di `submit`
+        # Pekerja tidak dibuat dengan fork dari proses layanan: proses hasil fork akan mewarisi socket klien yang
+        # sedang terbuka, sehingga koneksi tidak benar-benar tertutup saat layanan menutupnya.
+        context = multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods()
+                                              else "spawn")
+        self.cancel_flags = context.Array("b", self.workers, lock=False)
+        self.progress_queue = context.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=_init_worker,
+                                        initargs=(self.cancel_flags, self.progress_queue))
+        await asyncio.gather(*(self.loop.run_in_executor(self.pool, time.sleep, 0.01) for _ in range(self.workers)))
+        self.dispatchers = [asyncio.create_task(self._dispatch(slot)) for slot in range(self.workers)]
+        self.progress_thread = threading.Thread(target=self._read_progress, daemon=True)
+        self.progress_thread.start()
+
+    async def close(self):
+        for task in self.dispatchers:
+            task.cancel()
+        for slot in range(self.workers):
+            self.cancel_flags[slot] = 1
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.progress_queue.put(None)
+        self.progress_thread.join()
+
+    def submit(self, puzzle, method="anneal", timeout=None, seed=None, progress=False):
+        """
+        Antrekan puzzle, atau gabungkan dengan pekerjaan identik yang belum selesai. Mengembalikan (Job, apakah
+        digabung). Pemanggil harus menunggu hasilnya dengan `wait`.
+
+        Sampel progres hanya dikumpulkan untuk pekerjaan yang diminta dengan `progress`. Permintaan progres yang
+        digabung ke pekerjaan yang masih mengantre menyalakannya; pekerjaan yang sudah berjalan tanpa progres hanya
+        mengirim hasil akhirnya.
+
+        Batas waktu dan seed termasuk kunci penggabungan: permintaan dengan batas waktu lain bisa berakhir dengan status
+        berbeda, dan permintaan dengan seed tertentu harus mendapat hasil dari seed itu.
+        """
+        key = (method, puzzle.size, puzzle.clues, timeout, seed)
+        job = self.by_key.get(key)
+        if job is not None:
+            if progress and job.state == "queued":
+                job.progress_interval = self.progress_interval
+            self.counters["deduplicated"] += 1
+            return job, True
+        if self.queued >= self.queue_size:
+            self.counters["rejected"] += 1
+            raise ServiceBusy(f"Queue is full ({self.queue_size} jobs).")
+        job = Job(next(self.ids), key, puzzle, method, timeout, seed, self.progress_interval if progress else None,
+                  self.loop.create_future())
+        self.queue.put_nowait(job)
+        self.queued += 1
+        self.jobs[job.id] = job
+        self.by_key[key] = job
+        self.counters["submitted"] += 1
+        return job, False
+
+    async def wait(self, job, listener=None):
+        """
+        Tunggu hasil `job`. Jika `listener` (asyncio.Queue) diberikan, sampel progres dikirim ke sana selama
+        pekerjaan berjalan. Jika penunggu terakhir dibatalkan (misalnya klien terputus), pekerjaannya ikut dibatalkan.
+        """
+        job.waiters += 1
+        if listener is not None:
+            job.listeners.add(listener)
+        try:
+            return await asyncio.shield(job.future)
+        finally:
+            job.waiters -= 1
+            job.listeners.discard(listener)
+            if job.waiters == 0 and not job.future.done():
+                self.cancel(job)
+
+    def cancel(self, job):
+        """
+        Batalkan `job`: pekerjaan yang mengantre dilewati, pekerjaan yang berjalan diminta berhenti. Keduanya langsung
+        dilepas dari kunci penggabungan, sehingga permintaan baru yang identik tidak ikut menunggu hasil yang batal.
+        """
+        if job.state == "queued":
+            job.state = "cancelled"
+            job.puzzle = None  # Entri antrean tetap ada sampai dispatcher melewatinya; puzzle tidak dibutuhkan lagi
+            self.queued -= 1
+            self._finish(job, {"method": job.method, "status": "cancelled", "solution": None, "iterations": 0})
+        elif job.state == "running":
+            self.cancel_flags[job.slot] = 1
+            if self.by_key.get(job.key) is job:
+                del self.by_key[job.key]
+
+    async def _dispatch(self, slot):
+        """Ambil pekerjaan dari antrean dan jalankan satu per satu di pool dengan slot pembatalan `slot`."""
+        while True:
+            job = await self.queue.get()
+            if job.state != "queued":
+                continue
+            self.queued -= 1
+            job.state = "running"
+            job.slot = slot
+            job.started = time.perf_counter()
+            self.cancel_flags[slot] = 0
+            self.running[slot] = job
+            future = self.loop.run_in_executor(self.pool, run_job, slot, job.puzzle, job.method, job.timeout,
+                                               job.seed, job.progress_interval)
+            try:
+                if job.timeout is None:
+                    result = await future
+                else:
+                    try:
+                        result = await asyncio.wait_for(asyncio.shield(future), job.timeout + self.grace)
+                    except asyncio.TimeoutError:
+                        self.cancel_flags[slot] = 1  # Pemecah tidak berhenti sendiri; paksa berhenti
+                        result = await future
+            except asyncio.CancelledError:
+                self.cancel_flags[slot] = 1
+                raise
+            except Exception as e:
+                result = {"method": job.method, "status": "error", "solution": None, "iterations": 0,
+                          "error": f"{type(e).__name__}: {e}"}
+            finally:
+                self.running[slot] = None
+            self._finish(job, result)
+
+    def _finish(self, job, result):
+        now = time.perf_counter()
+        job.state = "done" if job.state == "running" else job.state
+        self.jobs.pop(job.id, None)
+        if self.by_key.get(job.key) is job:
+            del self.by_key[job.key]
+        status = result["status"]
+        if status == "cancelled":
+            self.counters["cancelled"] += 1
+        elif status == "timeout":
+            self.counters["timeouts"] += 1
+        elif status == "error":
+            self.counters["errors"] += 1
+        self.counters["completed"] += status != "cancelled"
+        result = dict(result, job=job.id, queue_time=round((job.started or now) - job.submitted, 6),
+                      latency=round(now - job.submitted, 6))
+        self.latencies.append(now - job.submitted)
+        self.finished_at.append(now)
+        if not job.future.done():
+            job.future.set_result(result)
+
+    def _read_progress(self):
+        """Thread pembaca antrean progres dari pekerja; sampel diteruskan ke loop asyncio."""
+        while True:
+            item = self.progress_queue.get()
+            if item is None:
+                return
+            self.loop.call_soon_threadsafe(self._deliver_progress, *item)
+
+    def _deliver_progress(self, slot, sample):
+        job = self.running[slot]
+        if job is None:
+            return
+        sample["event"] = "progress"
+        sample["job"] = job.id
+        for listener in job.listeners:
+            if listener.qsize() < PROGRESS_BACKLOG:
+                listener.put_nowait(sample)
+
+    def stats(self):
+        """Penghitung, kedalaman antrean, throughput dan persentil latensi (detik) sebagai dict JSON."""
+        now = time.perf_counter()
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 6) if latencies else None
+
+        recent = sum(1 for finished in self.finished_at if now - finished <= 60)
+        return {
+            "workers": self.workers,
+            "queued": self.queued,
+            "queue_size": self.queue_size,
+            "running": sum(job is not None for job in self.running),
+            "counters": dict(self.counters),
+            "uptime": round(now - self.started_at, 3),
+            "throughput": round(self.counters["completed"] / max(now - self.started_at, 1e-9), 3),
+            "throughput_last_minute": round(recent / 60, 3),
+            "latency": {"mean": round(sum(latencies) / len(latencies), 6) if latencies else None,
+                        "p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+        }
+
+def parse_request(payload, max_size=DEFAULT_MAX_SIZE):
+    """
+    Periksa body JSON permintaan /solve: "puzzle" (format ringkas satu baris dengan '/' atau grid dengan baris baru),
+    "method", "timeout", "seed" dan "progress". Mengembalikan (puzzle, method, timeout, seed, progress); kesalahan,
+    termasuk puzzle yang lebih besar dari `max_size` x `max_size`, dilaporkan sebagai ValueError.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("puzzle"), str):
+        raise ValueError('Expected a JSON object with a "puzzle" string.')
+    puzzle = parse_line(payload["puzzle"].strip().replace("\n", "/"))
+    if puzzle.size > max_size:
+        raise ValueError(f"Puzzle is {puzzle.size}x{puzzle.size}; the largest accepted size is {max_size}x{max_size}.")
+    method = payload.get("method", "anneal")
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {', '.join(METHODS)}.")
+    timeout = payload.get("timeout")
+    if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+        raise ValueError('"timeout" must be a positive number of seconds.')
+    seed = payload.get("seed")
+    if seed is not None and not isinstance(seed, int):
+        raise ValueError('"seed" must be an integer.')
+    return puzzle, method, timeout, seed, bool(payload.get("progress", False))
+
+async def _read_request(reader):
+    """Baca satu permintaan HTTP/1.1 sederhana. Mengembalikan (metode, path, body) atau None jika koneksi ditutup."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("Malformed request line.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY:
+        raise ValueError("Request body too large.")
+    body = await reader.readexactly(length) if length else b""
+    return parts[0].upper(), parts[1], body
+
+def _response_head(status, content_type="application/json", extra=()):
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Type: {content_type}", "Connection: close"]
+    lines.extend(extra)
+    return ("\r\n".join(lines) + "\r\n").encode()
+
+async def _send_json(writer, status, payload, extra=()):
+    body = (json.dumps(payload) + "\n").encode()
+    writer.write(_response_head(status, extra=(f"Content-Length: {len(body)}", *extra)) + b"\r\n" + body)
+    await writer.drain()
+
+async def _send_chunk(writer, payload):
+    data = (json.dumps(payload) + "\n").encode()
+    writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+    await writer.drain()
+
+async def _until_disconnected(reader):
+    """Selesai saat klien menutup koneksi (permintaan sudah dibaca seluruhnya, jadi sisa data diabaikan)."""
+    while await reader.read(4096):
+        pass
+
+async def handle_client(service, reader, writer):
+    """
+    Layani satu koneksi HTTP:
+    - POST /solve: selesaikan puzzle; hasil dikirim sebagai JSON, atau sebagai aliran NDJSON (chunked) berisi event
+      "accepted", "progress" dan "result" jika "progress" bernilai true.
+    - DELETE /jobs/<id>: batalkan pekerjaan.
+    - GET /stats: penghitung layanan.
+    """
+    try:
+        try:
+            request = await _read_request(reader)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            await _send_json(writer, 400, {"error": str(e)})
+            return
+        if request is None:
+            return
+        method, path, body = request
+
+        if method == "GET" and path == "/stats":
+            await _send_json(writer, 200, service.stats())
+        elif method == "DELETE" and path.startswith("/jobs/"):
+            job = service.jobs.get(int(path[6:])) if path[6:].isdigit() else None
+            if job is None:
+                await _send_json(writer, 404, {"error": "No such job."})
+            else:
+                service.cancel(job)
+                await _send_json(writer, 200, {"job": job.id, "cancelled": True})
+        elif method == "POST" and path == "/solve":
+            try:
+                puzzle, solve_method, timeout, seed, progress = parse_request(json.loads(body or b"null"),
+                                                                             service.max_size)
+                job, deduplicated = service.submit(puzzle, solve_method, timeout, seed, progress)
+            except ValueError as e:  # Termasuk json.JSONDecodeError
+                await _send_json(writer, 400, {"error": str(e)})
+                return
+            except ServiceBusy as e:
+                await _send_json(writer, 503, {"error": str(e)}, ("Retry-After: 1",))
+                return
+            await _respond_solve(service, job, deduplicated, progress, reader, writer)
+        else:
+            await _send_json(writer, 404, {"error": f"No route for {method} {path}."})
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+async def _respond_solve(service, job, deduplicated, progress, reader, writer):
+    """Tunggu hasil `job` sambil memantau koneksi; jika klien terputus, penantian (dan mungkin pekerjaannya) batal."""
+    listener = asyncio.Queue() if progress else None
+    waiter = asyncio.create_task(service.wait(job, listener))
+    disconnected = asyncio.create_task(_until_disconnected(reader))
+    try:
+        if not progress:
+            await asyncio.wait((waiter, disconnected), return_when=asyncio.FIRST_COMPLETED)
+            if waiter.done():
+                await _send_json(writer, 200, waiter.result())
+            return
+
+        writer.write(_response_head(200, "application/x-ndjson", ("Transfer-Encoding: chunked",)) + b"\r\n")
+        await _send_chunk(writer, {"event": "accepted", "job": job.id, "deduplicated": deduplicated})
+        while not waiter.done():
+            event = asyncio.create_task(listener.get())
+            await asyncio.wait((waiter, disconnected, event), return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                event.cancel()
+                return
+            if event.done():
+                await _send_chunk(writer, event.result())
+            else:
+                event.cancel()
+        while not listener.empty():
+            await _send_chunk(writer, listener.get_nowait())
+        await _send_chunk(writer, dict(waiter.result(), event="result"))
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+    finally:
+        waiter.cancel()
+        disconnected.cancel()
+
+async def serve(host="127.0.0.1", port=8765, unix=None, workers=None, queue_size=64, grace=1.0,
+                progress_interval=1000, ready=None, max_size=DEFAULT_MAX_SIZE):
+    """Jalankan layanan sampai dibatalkan. `ready` (opsional) dipanggil dengan layanan setelah server siap."""
+    service = SolveService(workers, queue_size, grace, progress_interval, max_size)
+    await service.start()
+
+    async def handler(reader, writer):
+        await handle_client(service, reader, writer)
+
+    if unix:
+        server = await asyncio.start_unix_server(handler, path=unix)
+        address = unix
+    else:
+        server = await asyncio.start_server(handler, host, port)
+        address = "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"Serving Numbrix solver on {address} with {service.workers} workers.", file=sys.stderr)
+    if ready is not None:
+        ready(service)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+        if unix and os.path.exists(unix):
+            os.unlink(unix)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the Numbrix solvers over HTTP to local clients.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--unix", default=None, metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="number of solver processes (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=64, help="queued jobs before rejecting with 503")
+    parser.add_argument("--grace", type=float, default=1.0,
+                        help="seconds past a job's timeout before it is forcibly cancelled (default: 1)")
+    parser.add_argument("--progress-interval", type=int, default=1000,
+                        help="iterations or nodes between progress events (default: 1000)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help=f"largest accepted board side (default: {DEFAULT_MAX_SIZE})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.queue_size, args.grace,
+                          args.progress_interval, max_size=args.max_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
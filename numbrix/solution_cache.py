@@ -0,0 +1,183 @@
+# solution_cache.py
+import argparse
+import hashlib
+import os
+import sqlite3
+import struct
+import sys
+import time
+
+from .board import Board
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "numbrix", "solutions.sqlite3")
+DEFAULT_MAX_ENTRIES = 10000
+
+# Permutasi simetri per ukuran papan, dibangun sekali seperti `Geometry`.
+_SYMMETRIES = {}
+
+def symmetries(size):
+    """
+    Kembalikan 8 simetri dihedral papan `size` x `size` (4 rotasi, masing-masing dengan dan tanpa pencerminan)
+    sebagai tuple permutasi: `perm[index]` adalah indeks sel `index` setelah transformasi. Identitas selalu pertama.
+    """
+    perms = _SYMMETRIES.get(size)
+    if perms is None:
+        perms = []
+        for transpose in (False, True):
+            for flip_rows in (False, True):
+                for flip_cols in (False, True):
+                    perm = []
+                    for row in range(size):
+                        for col in range(size):
+                            r, c = (col, row) if transpose else (row, col)
+                            if flip_rows:
+                                r = size - 1 - r
+                            if flip_cols:
+                                c = size - 1 - c
+                            perm.append(r * size + c)
+                    perms.append(tuple(perm))
+        perms = _SYMMETRIES[size] = tuple(perms)
+    return perms
+
+def canonical_form(board):
+    """
+    Petakan petunjuk (sel tetap) papan ke bentuk kanonik di bawah 8 simetri dihedral dan pembalikan nilai
+    (v -> N*N + 1 - v). Bentuk kanonik adalah urutan petunjuk terkecil secara leksikografis di antara 16 varian.
+
+    Mengembalikan (kunci, perm, reverse): kunci teks untuk cache, serta transformasi yang membawa papan ke bentuk
+    kanoniknya. Semua varian dari puzzle yang sama menghasilkan kunci yang sama.
+    """
+    size = board.size
+    cell_count = board.cell_count
+    top = cell_count + 1
+    clues = [(index, board.values[index]) for index in range(cell_count) if board.fixed >> index & 1]
+    best = None
+    for perm in symmetries(size):
+        for reverse in (False, True):
+            form = [0] * cell_count
+            for index, value in clues:
+                form[perm[index]] = top - value if reverse else value
+            if best is None or form < best[0]:
+                best = (form, perm, reverse)
+    form, perm, reverse = best
+    key = f"{size}:" + hashlib.sha1(_to_bytes(form)).hexdigest()
+    return key, perm, reverse
+
+def _to_bytes(values):
+    """Ubah daftar nilai menjadi byte little-endian 16 bit."""
+    return struct.pack(f"<{len(values)}H", *values)
+
+def _from_bytes(data):
+    """Kebalikan dari `_to_bytes`."""
+    return struct.unpack(f"<{len(data) // 2}H", data)
+
+class SolutionCache:
+    """
+    Cache solusi persisten (SQLite) yang dikunci dengan bentuk kanonik petunjuk, sehingga rotasi, cerminan dan
+    varian dengan nilai terbalik dari puzzle yang sudah pernah diselesaikan langsung mendapat solusinya.
+
+    Entri yang paling lama tidak dipakai dihapus begitu jumlah entri melebihi `max_entries`. Path None memakai
+    variabel lingkungan NUMBRIX_CACHE atau `DEFAULT_PATH`; ":memory:" membuat cache sementara.
+    """
+
+    def __init__(self, path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path or os.environ.get("NUMBRIX_CACHE") or DEFAULT_PATH
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # GUI memanggil solver dari thread lain; pemakaian koneksi tetap berurutan.
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS solutions "
+                                "(key TEXT PRIMARY KEY, solution BLOB NOT NULL, last_used REAL NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS solutions_last_used ON solutions (last_used)")
+        self.connection.commit()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def __contains__(self, board):
+        """Apakah solusi untuk `board` (atau variannya) tersimpan, tanpa mengubah statistik atau urutan LRU."""
+        key, _, _ = canonical_form(board)
+        return self.connection.execute("SELECT 1 FROM solutions WHERE key = ?", (key,)).fetchone() is not None
+
+    def get(self, board):
+        """
+        Kembalikan solusi tersimpan untuk `board`, dipetakan kembali ke orientasi dan penomoran `board`, atau None.
+        Entri yang ternyata tidak cocok dengan petunjuk papan dihapus dan dihitung sebagai miss.
+        """
+        key, perm, reverse = canonical_form(board)
+        row = self.connection.execute("SELECT solution FROM solutions WHERE key = ?", (key,)).fetchone()
+        solution = None
+        if row is not None:
+            canonical = _from_bytes(row[0])
+            top = board.cell_count + 1
+            if len(canonical) == board.cell_count:
+                solution = Board(other_board=board)
+                for index in range(board.cell_count):
+                    value = canonical[perm[index]]
+                    solution.values[index] = top - value if reverse else value
+                if not solution.is_goal() or any(solution.values[index] != board.values[index]
+                                                 for index in range(board.cell_count) if board.fixed >> index & 1):
+                    solution = None
+            if solution is None:
+                self.connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            else:
+                self.connection.execute("UPDATE solutions SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+        if solution is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return solution
+
+    def put(self, board, solution):
+        """Simpan `solution` untuk puzzle `board` dalam orientasi kanonik, lalu hapus entri lama di atas batas."""
+        key, perm, reverse = canonical_form(board)
+        top = board.cell_count + 1
+        canonical = [0] * board.cell_count
+        for index in range(board.cell_count):
+            value = solution.values[index]
+            canonical[perm[index]] = top - value if reverse else value
+        self.connection.execute("INSERT OR REPLACE INTO solutions (key, solution, last_used) VALUES (?, ?, ?)",
+                                (key, _to_bytes(canonical), time.time()))
+        self.connection.execute("DELETE FROM solutions WHERE key IN (SELECT key FROM solutions "
+                                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+        self.connection.commit()
+
+    def clear(self):
+        """Hapus semua entri."""
+        self.connection.execute("DELETE FROM solutions")
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+# Cache yang sudah dibuka per path di proses ini, agar pekerja batch tidak membuka koneksi baru per puzzle.
+_OPEN_CACHES = {}
+
+def open_cache(path=None):
+    """Kembalikan `SolutionCache` bersama untuk `path` di proses ini."""
+    cache = _OPEN_CACHES.get(path)
+    if cache is None:
+        cache = _OPEN_CACHES[path] = SolutionCache(path)
+    return cache
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the Numbrix solution cache.")
+    parser.add_argument("command", choices=("stats", "clear"), help="action to perform")
+    parser.add_argument("--path", default=None, help=f"cache file (default: $NUMBRIX_CACHE or {DEFAULT_PATH})")
+    args = parser.parse_args(argv)
+
+    cache = SolutionCache(args.path)
+    if args.command == "clear":
+        cache.clear()
+        print(f"Cleared {cache.path}")
+    else:
+        print(f"{cache.path}: {len(cache)} of {cache.max_entries} entries")
+    cache.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
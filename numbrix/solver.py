@@ -0,0 +1,683 @@
+# solver.py
+import functools
+import random
+import math
+import time
+from array import array
+from .board import Board, ConflictTracker
+from .moves import OPERATORS, PathMoves
+from .propagation import new_prune_counts, propagate
+
+class SolveResult:
+    """
+    Hasil satu pemanggilan pemecah, dikembalikan oleh `solve`, `solve_exact` dan pemecah lain.
+
+    Atribut:
+    - board: Papan akhir; merupakan solusi jika `solved` bernilai True, jika tidak berisi keadaan terakhir (annealing)
+      atau None (pencarian eksak).
+    - solved: Apakah solusi valid ditemukan.
+    - iterations: Jumlah iterasi (annealing) atau simpul yang diekspansi (pencarian eksak).
+    - elapsed: Waktu total dalam detik.
+    - timed_out / cancelled: Apakah pencarian berhenti karena batas waktu atau diminta berhenti.
+    - counters: Penghitung peristiwa, misalnya "accepted", "uphill_accepted", "boards_allocated" dan
+      "conflict_evaluations" untuk annealing, atau "backtracks" untuk pencarian eksak.
+    - phase_times: Waktu per fase dalam detik ("setup", "search", "finalize").
+    - details: Informasi tambahan yang khusus untuk metode tertentu (misalnya "prunes" atau "seed").
+    """
+
+    def __init__(self, board=None, solved=False, iterations=0):
+        self.board = board
+        self.solved = solved
+        self.iterations = iterations
+        self.elapsed = 0.0
+        self.timed_out = False
+        self.cancelled = False
+        self.counters = {}
+        self.phase_times = {}
+        self.details = {}
+
+    @property
+    def acceptance_rate(self):
+        """Bagian iterasi yang perpindahannya diterima (0 jika tidak ada iterasi)."""
+        if not self.iterations:
+            return 0.0
+        return self.counters.get("accepted", 0) / self.iterations
+
+    def as_dict(self):
+        """Ringkasan hasil yang dapat ditulis sebagai JSON; papan ditulis sebagai daftar baris.
+
+        Hasil bertingkat di `details` (misalnya "chains" dari `parallel.solve_parallel`) ikut diubah dengan `as_dict`.
+        """
+        details = {}
+        for name, value in self.details.items():
+            if isinstance(value, SolveResult):
+                value = value.as_dict()
+            elif isinstance(value, list) and value and isinstance(value[0], SolveResult):
+                value = [item.as_dict() for item in value]
+            details[name] = value
+        return {
+            "solved": self.solved,
+            "iterations": self.iterations,
+            "elapsed": self.elapsed,
+            "timed_out": self.timed_out,
+            "cancelled": self.cancelled,
+            "acceptance_rate": self.acceptance_rate,
+            "counters": self.counters,
+            "phase_times": self.phase_times,
+            "details": details,
+            "board": None if self.board is None else self.board.to_rows(),
+        }
+
+    def __repr__(self):
+        status = "solved" if self.solved else "timed out" if self.timed_out else "not solved"
+        return f"<SolveResult {status}, {self.iterations} iterations, {self.elapsed:.3f}s>"
+
+def print_progress(sample):
+    """Hook bawaan untuk mode "trace": cetak suhu (jika mesinnya memakai suhu) dan konflik saat ini."""
+    temperature = f"Temperature: {sample['temperature']:.4f}, " if "temperature" in sample else ""
+    print(f"Iteration {sample['iteration']}, {temperature}Conflicts: {sample['conflicts']}")
+
+def solve(board, debug_level, trace=None, time_limit=None, rng=random, stop_event=None, hook=None,
+          hook_interval=1000, cache=None, operators=OPERATORS, max_iterations=None, initial_temperature=1.0,
+          final_temperature=0.3, reheat_after=3000, presolve=True):
+    """
+    Menyelesaikan puzzle Numbrix menggunakan Simulated Annealing, sebuah teknik optimisasi probabilistik.
+    
+    Parameter:
+    - board: Papan permainan Numbrix yang akan diselesaikan.
+    - debug_level: Tingkat detail log yang diinginkan ("quiet", "none", "trace"); "quiet" tidak mencetak apa pun.
+    - trace: Objek `StepTrace` (lihat `steptrace.py`) yang menerima papan awal lewat `start` dan setiap perpindahan
+      yang diterima lewat `record_swap`, sehingga seluruh jalannya pencarian dapat diputar ulang.
+    - time_limit: Anggaran waktu dalam detik. Jika diberikan, pencarian berjalan sampai solusi ditemukan atau waktu
+      habis (tanpa batas iterasi kecuali `max_iterations` diberikan) dan jadwal pendinginan disesuaikan dengan sisa
+      waktu. Papan dengan konflik paling sedikit yang pernah ditemukan selalu dikembalikan.
+    - rng: Sumber acak; modul `random` secara default, atau `random.Random(seed)` agar rantai dapat diulang.
+    - stop_event: Objek dengan `is_set()` (misalnya `multiprocessing.Event`); jika diset, pencarian dihentikan.
+    - hook: Fungsi yang dipanggil setiap `hook_interval` iterasi dengan dict sampel ("iteration", "temperature",
+      "conflicts", "accepted", "uphill_accepted", "conflict_evaluations", "elapsed"). Jika None, tidak ada biaya
+      tambahan selain satu perbandingan per iterasi. Mode "trace" memakai `print_progress` sebagai hook.
+    - cache: `SolutionCache` (lihat `solution_cache.py`) opsional. Jika puzzle atau salah satu variannya (rotasi,
+      cerminan, nilai terbalik) sudah tersimpan, solusinya langsung dikembalikan tanpa pencarian; solusi baru disimpan.
+    - operators: Nama operator perpindahan yang dipakai (lihat `moves.PathMoves`); ("swap",) hanya memakai
+      pertukaran acak dua sel seperti semula.
+    - max_iterations: Batas iterasi; None berarti 50000 tanpa `time_limit` dan tanpa batas dengan `time_limit`.
+    - initial_temperature / final_temperature: Suhu awal dan suhu yang dituju di akhir anggaran; keduanya harus
+      positif dan `final_temperature` tidak boleh melebihi `initial_temperature` (ValueError jika tidak).
+    - reheat_after: Jumlah iterasi tanpa perbaikan konflik terbaik sebelum suhu dinaikkan kembali.
+    - presolve: Jalankan propagasi batasan lebih dulu (lihat `freeze_forced`): sel yang terisi olehnya dibekukan untuk
+      annealing, dan nilai lainnya ditempatkan di sel yang domainnya memuat nilai tersebut
+      (`Board.initialize_from_domains`), bukan diacak sembarang. False memakai `Board.initialize_board` seperti semula.
+    
+    Metode ini mengimplementasikan algoritma Simulated Annealing:
+    1. Inisialisasi: Mulai dengan papan hasil propagasi (atau papan sembarang) dan tetapkan suhu awal.
+    2. Iterasi: Pilih operator secara adaptif, usulkan perpindahan terbaik dari beberapa sampel, lalu terima atau
+       tolak perubahan berdasarkan perbandingan konflik.
+    3. Pendinginan: Turunkan suhu secara eksponensial. Setiap 256 iterasi laju pendinginan dihitung ulang agar suhu
+       mencapai `final_temperature` tepat saat sisa anggaran (iterasi, atau waktu dikali kecepatan iterasi yang
+       terukur) habis.
+    4. Pemanasan ulang: Jika konflik terbaik tidak membaik selama `reheat_after` iterasi, suhu dinaikkan kembali ke
+       suhu awal dan jadwal pendinginan dihitung ulang untuk sisa anggaran.
+    5. Kriteria Berhenti: Berhenti jika solusi ditemukan, anggaran iterasi atau waktu habis, atau diminta berhenti.
+
+    Mengembalikan `SolveResult` dengan papan terbaik (konflik paling sedikit), status, jumlah iterasi, penghitung
+    (termasuk "frozen" dan "seeded" dari presolve) dan waktu per fase. Jika presolve membuktikan puzzle tidak punya
+    solusi, `details["infeasible"]` bernilai True dan hasilnya langsung dikembalikan tanpa pencarian, dengan papan yang
+    hanya berisi petunjuk.
+    """
+    if not 0 < final_temperature <= initial_temperature:
+        raise ValueError(f"Temperatures must satisfy 0 < final ({final_temperature}) <= initial "
+                         f"({initial_temperature}).")
+    search = functools.partial(anneal_loop, operators=operators, initial_temperature=initial_temperature,
+                               final_temperature=final_temperature, reheat_after=reheat_after)
+    return run_local_search(board, debug_level, search, trace, time_limit, rng, stop_event, hook, hook_interval, cache,
+                            max_iterations, 50000, presolve)
+
+def run_local_search(board, debug_level, search, trace=None, time_limit=None, rng=random, stop_event=None, hook=None,
+                     hook_interval=1000, cache=None, max_iterations=None, default_iterations=50000, presolve=True):
+    """
+    Kerangka bersama mesin pencarian lokal (`solve`, `tabu.solve_tabu`): cache, anggaran waktu dan iterasi, presolve,
+    pemulihan papan terbaik dan pengisian `SolveResult`. Parameter selain `search` dan `default_iterations` sama seperti
+    pada `solve`; `default_iterations` adalah batas iterasi jika `max_iterations` dan `time_limit` keduanya None.
+
+    `search` adalah loop pencarian mesin, dipanggil sebagai `search(tracker, rng, result, deadline=..., stop_event=...,
+    hook=..., hook_interval=..., max_iterations=..., trace=..., start_time=...)` dengan `ConflictTracker` atas papan
+    awal yang sudah terisi penuh. Loop mengubah papan lewat `tracker`, mengisi `result.iterations`,
+    `result.timed_out`/`cancelled` dan `details` miliknya, menambahkan penghitungnya ke `result.counters`, lalu
+    mengembalikan (nilai papan terbaik, konflik terbaik).
+    """
+    start_time = time.perf_counter()
+    if cache is not None:
+        result = cached_result(board, cache, debug_level, start_time)
+        if result is not None:
+            return result
+    deadline = None if time_limit is None else start_time + time_limit
+    if hook is None and debug_level == "trace":
+        hook = print_progress
+    result = SolveResult()
+    if max_iterations is None and time_limit is None:
+        max_iterations = default_iterations  # Batas iterasi bawaan jika tidak ada anggaran waktu.
+
+    current_board, frozen, seeded = prepare_local_search(board, rng, presolve, result)
+    if result.details.get("infeasible"):
+        return infeasible_result(current_board, result, start_time, debug_level)
+    tracker = ConflictTracker(current_board)  # Indeks posisi angka dan kontribusi konflik untuk skor inkremental.
+    if trace is not None:
+        trace.start(current_board)  # Catat papan awal sebagai langkah 0
+    search_start = time.perf_counter()
+    result.phase_times["setup"] = search_start - start_time
+
+    best_values, best_conflicts = search(tracker, rng, result, deadline=deadline, stop_event=stop_event, hook=hook,
+                                         hook_interval=hook_interval, max_iterations=max_iterations, trace=trace,
+                                         start_time=start_time)
+
+    finalize_start = time.perf_counter()
+    result.phase_times["search"] = finalize_start - search_start
+    current_conflicts = tracker.total
+    if best_conflicts < current_conflicts:
+        current_board.values[:] = best_values  # Kembalikan papan terbaik, bukan keadaan terakhir
+        current_conflicts = best_conflicts
+    current_board.fixed = board.fixed  # Sel yang dibekukan propagasi bukan petunjuk pada papan hasil
+    result.board = current_board
+    result.solved = current_board.is_goal()
+    result.counters["frozen"] = frozen
+    result.counters["seeded"] = seeded
+    result.details["conflicts"] = current_conflicts
+    if cache is not None and result.solved:
+        cache.put(board, current_board)
+    result.phase_times["finalize"] = time.perf_counter() - finalize_start
+    result.elapsed = time.perf_counter() - start_time
+    if debug_level != "quiet":
+        print_result(result)
+    return result
+
+def anneal_loop(tracker, rng, result, deadline, stop_event, hook, hook_interval, max_iterations, trace, start_time,
+                operators=OPERATORS, initial_temperature=1.0, final_temperature=0.3, reheat_after=3000):
+    """Loop Simulated Annealing untuk `run_local_search`; algoritme dan parameternya dijelaskan pada `solve`."""
+    current_board = tracker.board
+    next_sample = hook_interval if hook is not None else -1
+    temperature = initial_temperature  # Suhu awal untuk proses Simulated Annealing.
+    cooling_rate = 0.0  # Laju pendinginan, dihitung ulang dari sisa anggaran setiap 256 iterasi.
+    path_moves = PathMoves(tracker, operators)  # Operator perpindahan yang dinilai dari `tracker`.
+    current_conflicts = tracker.total  # Jumlah konflik awal pada papan.
+    best_conflicts = current_conflicts  # Konflik paling sedikit sejauh ini dan nilai papannya.
+    best_values = array(current_board.values.typecode, current_board.values)
+    best_iteration = 0
+    iteration = 0  # Inisialisasi penghitung iterasi.
+    accepted = 0
+    uphill_accepted = 0
+    reheats = 0
+    cycle_start = 0  # Iterasi dan waktu saat jadwal pendinginan terakhir dimulai, untuk mengukur kecepatan.
+    cycle_time = time.perf_counter()
+
+    # Proses iterasi dilakukan sampai salah satu kriteria berhenti terpenuhi.
+    while current_conflicts != 0 and (max_iterations is None or iteration < max_iterations):
+        if len(path_moves.free_cells) < 2:
+            break  # Tidak ada tetangga yang bisa dihasilkan
+        if iteration % 256 == 0:
+            now = time.perf_counter()
+            if deadline is not None and now > deadline:
+                result.timed_out = True
+                break
+            if stop_event is not None and stop_event.is_set():
+                result.cancelled = True
+                break
+
+            # Pemanasan ulang jika pencarian macet.
+            if iteration - best_iteration >= reheat_after and temperature < initial_temperature:
+                temperature = initial_temperature
+                best_iteration = iteration
+                reheats += 1
+                cycle_start, cycle_time = iteration, now
+
+            # Perkirakan sisa iterasi dari anggaran iterasi dan/atau sisa waktu, lalu atur laju pendinginan agar suhu
+            # mencapai `final_temperature` di akhir anggaran.
+            remaining = None if max_iterations is None else max_iterations - iteration
+            if deadline is not None and iteration > cycle_start and now > cycle_time:
+                speed = (iteration - cycle_start) / (now - cycle_time)
+                by_time = (deadline - now) * speed
+                remaining = by_time if remaining is None else min(remaining, by_time)
+            if remaining is not None and temperature > final_temperature:
+                cooling_rate = 1 - (final_temperature / temperature) ** (1 / max(remaining, 1))
+            else:
+                cooling_rate = 0.0  # Tahan suhu: suhu akhir sudah tercapai atau kecepatan belum terukur.
+        iteration += 1
+
+        # Usulkan perpindahan dari operator yang dipilih secara adaptif; perubahan konfliknya dihitung dari
+        # `tracker` tanpa mengubah papan, dan papan hanya diubah jika perpindahan diterima.
+        operator, move, delta = path_moves.propose(rng)
+        path_moves.record(operator, delta)
+
+        # Terima perubahan jika mengurangi konflik atau berdasarkan probabilitas yang dihitung dari delta suhu.
+        if move is not None and (delta < 0 or rng.uniform(0, 1) < math.exp(-delta / temperature)):
+            swaps = path_moves.apply(move)
+            current_conflicts = tracker.total
+            accepted += 1
+            if delta > 0:
+                uphill_accepted += 1
+            if trace is not None:
+                for index1, index2 in swaps:
+                    trace.record_swap(index1, index2)  # Catat langkah baru sebagai pertukaran dua sel
+            if current_conflicts < best_conflicts:
+                best_conflicts = current_conflicts
+                best_values[:] = current_board.values
+                best_iteration = iteration
+
+        temperature *= 1 - cooling_rate  # Turunkan suhu secara eksponensial.
+
+        # Kirim sampel ke hook setiap `hook_interval` iterasi, jika hook aktif.
+        if iteration == next_sample:
+            next_sample += hook_interval
+            hook({"iteration": iteration, "temperature": temperature, "conflicts": current_conflicts,
+                  "best_conflicts": best_conflicts, "accepted": accepted, "uphill_accepted": uphill_accepted,
+                  "conflict_evaluations": path_moves.evaluations, "elapsed": time.perf_counter() - start_time})
+
+    result.iterations = iteration
+    result.counters.update({"accepted": accepted, "uphill_accepted": uphill_accepted,
+                            "conflict_evaluations": path_moves.evaluations, "reheats": reheats})
+    result.details["temperature"] = temperature
+    result.details["operators"] = path_moves.stats()
+    return best_values, best_conflicts
+
+def prepare_local_search(board, rng, presolve, result):
+    """
+    Buat salinan `board` yang terisi penuh sebagai titik awal pencarian lokal. Dengan `presolve`, sel yang dipaksa
+    propagasi dibekukan (`freeze_forced`) dan nilai lainnya ditempatkan sesuai domain
+    (`Board.initialize_from_domains`); tanpa itu nilai diacak (`Board.initialize_board`).
+
+    Mengembalikan (papan, jumlah sel dibekukan, jumlah sel yang diisi dari domainnya). Waktu presolve dicatat di
+    `result.phase_times["presolve"]` dan papan yang dibuat di `result.counters["boards_allocated"]`. Jika puzzle terbukti tidak punya solusi, `result.details["infeasible"]` diset
+    dan papan hanya berisi petunjuk; pencarian lokal tidak perlu dijalankan (lihat `infeasible_result`).
+    """
+    current_board = Board(other_board=board)
+    result.counters["boards_allocated"] = 1
+    frozen = seeded = 0
+    if presolve:
+        presolve_start = time.perf_counter()
+        frozen = freeze_forced(current_board, result.counters)
+        if frozen is None:
+            frozen = 0
+            result.details["infeasible"] = True
+        else:
+            seeded = current_board.initialize_from_domains(rng)
+        result.phase_times["presolve"] = time.perf_counter() - presolve_start
+    else:
+        current_board.initialize_board(rng)  # Inisialisasi papan dengan konfigurasi sembarang.
+    return current_board, frozen, seeded
+
+def freeze_forced(board, counters=None):
+    """
+    Siapkan `board` untuk annealing: jalankan propagasi batasan (`propagation.propagate`, termasuk sel dengan satu
+    kemungkinan nilai dan nilai yang hanya mungkin di satu sel) sampai fixpoint, lalu tandai sel yang terisi sebagai
+    tetap agar pencarian lokal tidak memindahkannya.
+
+    Nilai di sel yang bukan petunjuk (misalnya sisa pencarian sebelumnya) dibuang lebih dulu, dengan membangun ulang
+    domain dari petunjuk saja; papan petunjuk yang dibuat untuk itu ditambahkan ke `counters["boards_allocated"]`
+    jika `counters` diberikan. Mengembalikan jumlah sel yang dibekukan, atau None jika propagasi membuktikan puzzle
+    tidak punya solusi; papan lalu hanya berisi petunjuk.
+    """
+    if any(value and not board.fixed >> index & 1 for index, value in enumerate(board.values)):
+        clues = Board(size=board.size)
+        if counters is not None:
+            counters["boards_allocated"] += 1
+        for index, value in enumerate(board.values):
+            if board.fixed >> index & 1:
+                clues.set(index // board.size, index % board.size, value, is_fixed=True)
+        board.values, board.domains = clues.values, clues.domains
+        board.resync()
+    board.start_trail()
+    mark = board.mark()
+    if not propagate(board, new_prune_counts()):
+        board.undo(mark)
+        board.trail = None
+        return None
+    board.trail = None
+    frozen = 0
+    for index, value in enumerate(board.values):
+        if value and not board.fixed >> index & 1:
+            board.fixed |= 1 << index
+            frozen += 1
+    return frozen
+
+def cached_result(board, cache, debug_level, start_time):
+    """Kembalikan `SolveResult` dari solusi di `cache` untuk `board`, atau None jika tidak ada."""
+    solution = cache.get(board)
+    if solution is None:
+        return None
+    result = SolveResult(solution, True)
+    result.details["cached"] = True
+    result.elapsed = time.perf_counter() - start_time
+    if debug_level != "quiet":
+        print(f"Found a cached solution in {result.elapsed:.3f} seconds.")
+        print(solution)
+    return result
+
+def infeasible_result(current_board, result, start_time, debug_level):
+    """
+    Lengkapi dan kembalikan `result` untuk puzzle yang oleh presolve terbukti tidak punya solusi: `current_board`
+    (hanya berisi petunjuk) menjadi papan hasil, tanpa iterasi.
+    """
+    result.board = current_board
+    result.counters.update({"frozen": 0, "seeded": 0})
+    result.elapsed = time.perf_counter() - start_time
+    if debug_level != "quiet":
+        print_result(result)
+    return result
+
+def print_result(result):
+    """Cetak ringkasan `SolveResult` dari `solve` atau `solve_exact` beserta papannya."""
+    if "backtracks" in result.counters:
+        effort = f"{result.iterations} nodes expanded and {result.counters['backtracks']} backtracks"
+        if result.solved:
+            print(f"Success! Found a solution with {effort} in {result.elapsed:.3f} seconds.")
+        elif result.timed_out:
+            print(f"Time limit reached after {effort} in {result.elapsed:.3f} seconds.")
+        else:
+            print(f"No solution exists: {effort} in {result.elapsed:.3f} seconds.")
+    elif result.details.get("infeasible"):
+        print(f"No solution exists: presolve proved the puzzle infeasible in {result.elapsed:.3f} seconds.")
+    elif result.solved:
+        print(f"Success! Found a solution in {result.iterations} iterations.")
+    else:
+        print(f"Failed to find a solution after {result.iterations} iterations.")
+        print(f"Final conflicts: {result.details.get('conflicts')}")
+    if result.board is not None:
+        print(result.board)
+
+def solve_exact(board, debug_level="none", use_propagation=True, time_limit=None, hook=None, hook_interval=1000,
+                cache=None, table=None, stop_event=None, rng=None):
+    """
+    Menyelesaikan puzzle Numbrix secara eksak dengan pencarian depth-first (DFS).
+
+    Parameter:
+    - board: Papan permainan Numbrix yang akan diselesaikan.
+    - debug_level: Tingkat detail log yang diinginkan ("quiet", "none", "trace"); "quiet" tidak mencetak apa pun.
+    - use_propagation: Jalankan propagasi batasan (lihat `propagation.propagate`) sampai fixpoint sebelum setiap
+      keputusan percabangan.
+    - time_limit: Batas waktu dalam detik, atau None untuk tanpa batas.
+    - hook: Fungsi yang dipanggil setiap `hook_interval` simpul dengan dict statistik pencarian saat itu.
+    - cache: `SolutionCache` opsional, seperti pada `solve`.
+    - table: `TranspositionTable` opsional yang mengingat penugasan parsial yang terbukti buntu. Dalam satu pencarian
+      sebuah penugasan tidak pernah muncul dua kali, karena setiap percabangan memilih nilai untuk satu sel; hit
+      datang dari pencarian berikutnya yang memakai tabel yang sama pada puzzle yang sama atau puzzle dengan petunjuk
+      tambahan (misalnya pemeriksaan keunikan di `generator`). Statistiknya bersifat kumulatif.
+    - stop_event: Objek dengan `is_set()`; jika diset, pencarian dihentikan (`cancelled`).
+    - rng: Diabaikan karena pencarian deterministik; ada agar `solve_exact` memenuhi antarmuka strategi
+      (lihat `strategies.py`).
+
+    Pencarian memakai primitif yang sudah ada di `Board`: sel dengan opsi paling sedikit dipilih oleh
+    `get_next_moves` (dasar dari `get_next_boards`), kandidat disaring `would_be_feasible`, dan jalan buntu dideteksi
+    `is_not_feasible`. Semua cabang dijalankan pada satu salinan papan; setiap penempatan dicatat di jejak papan dan
+    dibatalkan dengan `undo` saat backtrack, bukan dengan membuat papan baru per cabang.
+
+    Mengembalikan `SolveResult`: `iterations` adalah jumlah simpul yang diekspansi, `counters["backtracks"]` jumlah
+    backtrack, `details["prunes"]` jumlah pemangkasan per aturan propagasi, dan jika `table` diberikan
+    `counters["tt_hits"]`/`counters["tt_misses"]` serta `details["transposition"]` (lihat `TranspositionTable.stats`).
+    Papan hasil None berarti puzzle tidak punya solusi, kecuali jika `timed_out` atau `cancelled` bernilai True.
+    """
+    start_time = time.perf_counter()
+    if cache is not None:
+        result = cached_result(board, cache, debug_level, start_time)
+        if result is not None:
+            return result
+    deadline = None if time_limit is None else start_time + time_limit
+    stats = {"nodes": 0, "backtracks": 0, "prunes": new_prune_counts(), "timed_out": False, "cancelled": False}
+    result = SolveResult()
+
+    work = Board(other_board=board)
+    boards_allocated = 1
+    work.start_trail()
+    search_start = time.perf_counter()
+    result.phase_times["setup"] = search_start - start_time
+    solution = next(search_solutions(work, stats, use_propagation, deadline, hook, hook_interval, table, stop_event),
+                    None)
+    finalize_start = time.perf_counter()
+    result.phase_times["search"] = finalize_start - search_start
+    if solution is not None:
+        result.board = Board(other_board=solution)
+        boards_allocated += 1
+        result.solved = True
+        if cache is not None:
+            cache.put(board, result.board)
+    result.iterations = stats["nodes"]
+    result.timed_out = stats["timed_out"]
+    result.cancelled = stats["cancelled"]
+    result.counters = {"backtracks": stats["backtracks"], "boards_allocated": boards_allocated}
+    result.details["prunes"] = stats["prunes"]
+    add_table_stats(result, table)
+    result.phase_times["finalize"] = time.perf_counter() - finalize_start
+    result.elapsed = time.perf_counter() - start_time
+
+    if debug_level == "quiet":
+        return result
+    print_result(result)
+    if debug_level == "trace":
+        print("Prunes per rule: " + ", ".join(f"{rule}={count}" for rule, count in stats["prunes"].items()))
+        print_table_stats(table)
+    return result
+
+def count_solutions(board, limit=2, use_propagation=True, time_limit=None, debug_level="quiet", hook=None,
+                    hook_interval=1000, table=None, stop_event=None):
+    """
+    Hitung solusi puzzle dengan pencarian eksak yang sama seperti `solve_exact` (pemilihan sel MRV dari
+    `get_next_moves`, `would_be_feasible` / `is_not_feasible`, dan undo lewat jejak papan tanpa papan baru per cabang),
+    berhenti begitu `limit` solusi ditemukan. `limit=2` cukup untuk memeriksa keunikan; None menghitung semuanya.
+    `hook` dipanggil setiap `hook_interval` simpul dengan statistik pencarian; `table` (tabel transposisi) dan
+    `stop_event` opsional, seperti pada `solve_exact`.
+
+    Mengembalikan `SolveResult`: `details["solutions"]` adalah jumlah solusi yang ditemukan (paling banyak `limit`),
+    `details["unique"]` True jika terbukti tepat satu, `board` adalah solusi pertama dan `details["alternative"]`
+    solusi kedua (sebagai daftar baris) jika ada. `iterations` adalah jumlah simpul. Jika `timed_out` bernilai True,
+    jumlahnya hanya batas bawah.
+    """
+    start_time = time.perf_counter()
+    deadline = None if time_limit is None else start_time + time_limit
+    stats = {"nodes": 0, "backtracks": 0, "prunes": new_prune_counts(), "timed_out": False, "cancelled": False}
+    result = SolveResult()
+
+    work = Board(other_board=board)
+    boards_allocated = 1
+    work.start_trail()
+    search_start = time.perf_counter()
+    result.phase_times["setup"] = search_start - start_time
+    count = 0
+    for solution in search_solutions(work, stats, use_propagation, deadline, hook, hook_interval, table,
+                                     stop_event):
+        count += 1
+        if count == 1:
+            result.board = Board(other_board=solution)
+            boards_allocated += 1
+        elif count == 2:
+            result.details["alternative"] = solution.to_rows()
+        if limit is not None and count >= limit:
+            break
+    result.phase_times["search"] = time.perf_counter() - search_start
+    result.solved = count > 0
+    result.iterations = stats["nodes"]
+    result.timed_out = stats["timed_out"]
+    result.cancelled = stats["cancelled"]
+    result.counters = {"backtracks": stats["backtracks"], "boards_allocated": boards_allocated}
+    result.details["solutions"] = count
+    result.details["unique"] = (count == 1 and not result.timed_out and not result.cancelled
+                                and (limit is None or limit > 1))
+    result.details["prunes"] = stats["prunes"]
+    add_table_stats(result, table)
+    result.elapsed = time.perf_counter() - start_time
+
+    if debug_level != "quiet":
+        status = ("unique" if result.details["unique"] else "time limit reached" if result.timed_out
+                  else "none" if count == 0 else f"at least {count}" if count == limit else str(count))
+        print(f"Solutions: {status} ({result.iterations} nodes expanded in {result.elapsed:.3f} seconds).")
+    return result
+
+def add_table_stats(result, table):
+    """Tambahkan statistik tabel transposisi (jika ada) ke penghitung dan detail `result`."""
+    if table is None:
+        return
+    result.counters["tt_hits"] = table.hits
+    result.counters["tt_misses"] = table.misses
+    result.details["transposition"] = table.stats()
+
+def print_table_stats(table):
+    """Cetak ringkasan tabel transposisi untuk debug_level "trace"."""
+    if table is None:
+        return
+    stats = table.stats()
+    print(f"Transposition table: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.1%}), "
+          f"{stats['size']}/{stats['capacity']} entries (~{stats['memory'] / 1024:.0f} KiB), "
+          f"{stats['evictions']} evictions, ~{stats['saved_nodes']} nodes saved")
+
+def search_solutions(work, stats, use_propagation=True, deadline=None, hook=None, hook_interval=1000, table=None,
+                     stop_event=None):
+    """
+    Generator DFS yang menghasilkan setiap solusi dari papan `work` (yang jejaknya sudah aktif).
+
+    Papan yang dihasilkan adalah `work` itu sendiri, sehingga pemanggil harus menyalinnya sebelum melanjutkan iterasi.
+    `stats["nodes"]` bertambah untuk setiap penempatan yang dicoba dan `stats["backtracks"]` untuk setiap sel yang
+    kehabisan kandidat. Jika `use_propagation` aktif, `stats["prunes"]` harus berisi penghitung dari
+    `new_prune_counts()`. Jika `deadline` (nilai `time.perf_counter()`) terlewati, pencarian berhenti dan
+    `stats["timed_out"]` diatur menjadi True; jika `stop_event` diset, pencarian berhenti dengan `stats["cancelled"]`
+    True. Jika `hook` diberikan, hook dipanggil dengan `stats` setiap `hook_interval` simpul.
+
+    Jika `table` (`TranspositionTable`) diberikan, hash Zobrist papan diperiksa setelah setiap penempatan dan setelah
+    propagasi; penugasan yang sudah terbukti buntu langsung dilewati. Penugasan dicatat sebagai buntu jika
+    propagasi atau `is_not_feasible` menolaknya, atau jika semua kandidat frame-nya habis tanpa menghasilkan solusi.
+    Frame yang belum selesai (batas waktu, atau generator ditutup setelah solusi yang cukup) tidak pernah dicatat.
+    Tanpa `table`, hash tidak dipelihara sama sekali (lihat `Board.start_hashing`).
+    """
+    if table is not None and work.zobrist is None:
+        work.start_hashing()
+    if use_propagation and not propagate(work, stats["prunes"]):
+        return
+    if work.is_not_feasible():
+        return
+    move = work.get_next_moves()
+    if move is None:
+        if work.is_goal():
+            yield work
+        return
+
+    found = 0  # Jumlah solusi yang sudah dihasilkan, untuk mengetahui apakah subpohon sebuah frame buntu
+    # Setiap frame berisi: baris, kolom, kandidat nilai, kandidat berikutnya yang akan dicoba, posisi jejak, hash
+    # penugasan saat frame dibuat (sebelum dan sesudah propagasi), serta jumlah simpul dan solusi saat itu.
+    stack = [[*move, 0, work.mark(), None, None, stats["nodes"], found]]
+    while stack:
+        frame = stack[-1]
+        row, col, candidates, position, mark = frame[:5]
+        work.undo(mark)  # Kembalikan papan ke kondisi sebelum kandidat sebelumnya di frame ini dicoba.
+        if position == len(candidates):
+            stack.pop()
+            stats["backtracks"] += 1
+            if table is not None and frame[5] is not None and frame[8] == found:
+                nodes = stats["nodes"] - frame[7]
+                table.store(frame[5], nodes)
+                if frame[6] != frame[5]:
+                    table.store(frame[6], nodes)
+            continue
+        frame[3] = position + 1
+        if stats["nodes"] % 64 == 0:
+            if deadline is not None and time.perf_counter() > deadline:
+                stats["timed_out"] = True
+                return
+            if stop_event is not None and stop_event.is_set():
+                stats["cancelled"] = True
+                return
+
+        work.set(row, col, candidates[position])
+        stats["nodes"] += 1
+        if hook is not None and stats["nodes"] % hook_interval == 0:
+            hook(stats)
+        assigned = work.zobrist
+        if table is not None and table.probe(assigned):
+            continue
+        if use_propagation and not propagate(work, stats["prunes"]):
+            if table is not None:
+                table.store(assigned)
+            continue
+        propagated = work.zobrist
+        if table is not None and propagated != assigned and table.probe(propagated):
+            continue
+        if work.is_not_feasible():
+            if table is not None:
+                table.store(assigned)
+                if propagated != assigned:
+                    table.store(propagated)
+            continue
+        move = work.get_next_moves()
+        if move is None:
+            if work.is_goal():
+                found += 1
+                yield work
+            continue
+        stack.append([*move, 0, work.mark(), assigned, propagated, stats["nodes"], found])
+
+def check_line(line, size=9):
+    """
+    Memeriksa satu baris input untuk memastikan bahwa formatnya valid:
+    - Baris harus memiliki `size` nilai (sembilan secara default).
+    - Setiap nilai harus berupa digit (1 hingga size * size) atau tanda '-' yang menandakan sel kosong.
+    """
+    vals = line.strip().split()
+    if len(vals) != size:
+        return False
+    for val in vals:
+        if not (val.isdigit() or val == "-"):
+            return False
+        if val.isdigit():
+            num = int(val)
+            if not 1 <= num <= size * size:
+                return False
+    return True
+
+def store_line(line, row, board):
+    """
+    Menyimpan satu baris nilai ke dalam papan pada posisi yang ditentukan:
+    - Digit disimpan sebagai nilai tetap.
+    - Sel kosong tidak diatur.
+    """
+    for col, val in enumerate(line.strip().split()):
+        if val.isdigit():
+            board.set(row, col, int(val), is_fixed=True)
+
+def read_input_from_file(file, board=None, verbose=True, cache=None):
+    """
+    Membaca konfigurasi papan dari file:
+    - Jika `board` tidak diberikan, ukuran papan N diambil dari jumlah nilai pada baris pertama.
+    - Memastikan file memiliki tepat N baris (baris kosong di akhir file diabaikan).
+    - Setiap baris harus valid menurut `check_line`.
+    - Papan yang dibaca dicetak kecuali `verbose` bernilai False; jika `cache` diberikan, juga dilaporkan apakah
+      solusi puzzle ini (atau variannya) sudah tersimpan.
+    Mengembalikan papan yang telah diisi.
+    """
+    with open(file) as f:
+        lines = f.readlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if board is None:
+        board = Board(size=len(lines[0].split()) if lines else 9)
+    size = board.size
+    if len(lines) != size:
+        raise ValueError(f"Input file must contain exactly {size} lines.")
+    for row, line in enumerate(lines):
+        if check_line(line, size):
+            store_line(line, row, board)
+        else:
+            raise ValueError(f"Invalid line {row + 1} in input file.")
+    if verbose:
+        print(f"All lines read from {file}, input board:\n{board}")
+        if cache is not None and board in cache:
+            print("A solution for this puzzle (or a rotated, mirrored or reversed variant) is cached.")
+    return board
+
+def read_input_from_stdin(board):
+    """Read a board from stdin."""
+    size = board.size
+    lines = 0
+    while lines < size:
+        line = input("Please enter line " + str(lines + 1) + ": ")
+        if check_line(line, size):
+            store_line(line, lines, board)
+            lines += 1
+        else:
+            print(f"Error while parsing line, expecting {size} values, 1-{size * size} or '-' separated by spaces, "
+                  "please try again")
+    print(f"All lines entered, input board:\n{board}")
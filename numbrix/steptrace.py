@@ -0,0 +1,163 @@
+# steptrace.py
+import struct
+from array import array
+from collections import deque
+
+# Format file jejak: header, lalu rangkaian record. Record keyframe berisi semua nilai papan, record swap hanya dua
+# indeks sel. Semua bilangan little-endian tak bertanda 16 bit, cukup untuk papan hingga 256 x 256.
+MAGIC = b"NXTR"
+VERSION = 1
+HEADER = struct.Struct("<4sBHI")  # magic, versi, ukuran papan, interval keyframe
+SWAP = struct.Struct("<cHH")
+KEYFRAME_TAG = b"K"
+SWAP_TAG = b"S"
+
+class TraceChunk:
+    """Satu keyframe (nilai papan pada langkah `start`) beserta pertukaran yang mengikutinya."""
+    __slots__ = ("start", "keyframe", "swaps")
+
+    def __init__(self, start, keyframe):
+        self.start = start
+        self.keyframe = keyframe
+        self.swaps = array('H')
+
+    @property
+    def end(self):
+        """Langkah terakhir yang dapat dibangun dari chunk ini."""
+        return self.start + len(self.swaps) // 2
+
+class StepTrace:
+    """
+    Jejak langkah annealing yang ringkas: setiap perpindahan yang diterima disimpan sebagai dua indeks sel, dengan
+    keyframe berkala sehingga papan pada langkah mana pun dapat dibangun ulang dari paling banyak
+    `keyframe_interval` pertukaran.
+
+    Langkah 0 adalah papan setelah inisialisasi acak, langkah s adalah papan setelah s pertukaran. Jika `max_steps`
+    diberikan, jejak di memori menjadi ring buffer yang menyimpan setidaknya `max_steps` langkah terakhir. Jika
+    `path` diberikan, seluruh jejak juga ditulis ke file biner yang dapat diputar ulang dengan `StepTrace.load`.
+    """
+
+    def __init__(self, keyframe_interval=1024, max_steps=None, path=None):
+        if keyframe_interval < 1:
+            raise ValueError("Keyframe interval must be at least 1.")
+        self.keyframe_interval = keyframe_interval
+        max_chunks = None if max_steps is None else -(-max_steps // keyframe_interval) + 1
+        self.chunks = deque(maxlen=max_chunks)
+        self.size = None
+        self.steps = 0
+        self.current = None
+        self.file = None if path is None else open(path, "wb")
+
+    def start(self, board):
+        """Mulai jejak baru dari keadaan `board` saat ini (langkah 0)."""
+        self.size = board.size
+        self.steps = 0
+        self.current = array('H', board.values)
+        self.chunks.clear()
+        if self.file is not None:
+            self.file.write(HEADER.pack(MAGIC, VERSION, self.size, self.keyframe_interval))
+        self._add_keyframe()
+
+    def _add_keyframe(self):
+        self.chunks.append(TraceChunk(self.steps, array('H', self.current)))
+        if self.file is not None:
+            self.file.write(KEYFRAME_TAG + _to_bytes(self.current))
+
+    def record_swap(self, index1, index2):
+        """Catat pertukaran nilai sel `index1` dan `index2` sebagai langkah berikutnya."""
+        if self.steps - self.chunks[-1].start >= self.keyframe_interval:
+            self._add_keyframe()
+        current = self.current
+        current[index1], current[index2] = current[index2], current[index1]
+        self.chunks[-1].swaps.extend((index1, index2))
+        self.steps += 1
+        if self.file is not None:
+            self.file.write(SWAP.pack(SWAP_TAG, index1, index2))
+
+    @property
+    def first_step(self):
+        """Langkah paling awal yang masih tersimpan di memori."""
+        return self.chunks[0].start if self.chunks else 0
+
+    @property
+    def nbytes(self):
+        """Perkiraan memori yang dipakai data jejak, dalam byte."""
+        return sum((len(chunk.keyframe) + len(chunk.swaps)) * chunk.swaps.itemsize for chunk in self.chunks)
+
+    def __len__(self):
+        """Jumlah langkah yang tersimpan di memori, termasuk langkah awal."""
+        return self.steps - self.first_step + 1 if self.chunks else 0
+
+    def frame(self, step):
+        """Kembalikan nilai papan (array, baris demi baris) pada langkah `step`."""
+        for chunk in self.chunks:
+            if chunk.start <= step <= chunk.end:
+                values = array('H', chunk.keyframe)
+                swaps = chunk.swaps
+                for position in range(0, (step - chunk.start) * 2, 2):
+                    index1, index2 = swaps[position], swaps[position + 1]
+                    values[index1], values[index2] = values[index2], values[index1]
+                return values
+        raise IndexError(f"Step {step} is not in the trace (available: {self.first_step}-{self.steps}).")
+
+    def replay(self, start=None):
+        """
+        Hasilkan pasangan (langkah, nilai) mulai dari langkah `start` (default: langkah paling awal yang tersimpan)
+        sampai langkah terakhir. Array nilai yang sama diperbarui di tempat dengan satu pertukaran per langkah;
+        salin jika perlu disimpan.
+        """
+        step = self.first_step if start is None else start
+        values = self.frame(step)
+        yield step, values
+        for chunk in list(self.chunks):
+            swaps = chunk.swaps
+            for position in range(max(0, step - chunk.start) * 2, len(swaps), 2):
+                index1, index2 = swaps[position], swaps[position + 1]
+                values[index1], values[index2] = values[index2], values[index1]
+                step += 1
+                yield step, values
+
+    def close(self):
+        """Tutup file jejak, jika ada."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @classmethod
+    def load(cls, path, max_steps=None):
+        """Baca file jejak yang ditulis dengan `path=...` untuk diputar ulang."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a step trace file.")
+        magic, version, size, keyframe_interval = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} step trace file.")
+
+        trace = cls(keyframe_interval, max_steps)
+        trace.size = size
+        keyframe_bytes = size * size * 2
+        offset = HEADER.size
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            if tag == KEYFRAME_TAG and offset + 1 + keyframe_bytes <= len(data):
+                trace.current = _from_bytes(data[offset + 1:offset + 1 + keyframe_bytes])
+                trace.chunks.append(TraceChunk(trace.steps, array('H', trace.current)))
+                offset += 1 + keyframe_bytes
+            elif tag == SWAP_TAG and offset + SWAP.size <= len(data) and trace.chunks:
+                _, index1, index2 = SWAP.unpack_from(data, offset)
+                trace.current[index1], trace.current[index2] = trace.current[index2], trace.current[index1]
+                trace.chunks[-1].swaps.extend((index1, index2))
+                trace.steps += 1
+                offset += SWAP.size
+            else:
+                raise ValueError(f"Corrupt step trace record at byte {offset} of {path}.")
+        return trace
+
+def _to_bytes(values):
+    """Ubah array nilai menjadi byte little-endian 16 bit."""
+    return struct.pack(f"<{len(values)}H", *values)
+
+def _from_bytes(data):
+    """Kebalikan dari `_to_bytes`."""
+    return array('H', struct.unpack(f"<{len(data) // 2}H", data))
@@ -0,0 +1,85 @@
+# strategies.py
+import random
+import time
+
+from .solver import count_solutions, read_input_from_file, solve, solve_exact
+from .tabu import solve_tabu
+
+# Mesin pencarian yang dapat dipilih dengan nama oleh `solve_board`, CLI, batch, layanan dan benchmark. Setiap
+# strategi dipanggil sebagai `strategy(board, debug_level, time_limit=..., rng=..., stop_event=..., hook=...,
+# hook_interval=..., cache=...)` dan mengembalikan `SolveResult` dengan penghitung dan waktu per fase; mesin baru cukup
+# ditambahkan di sini. Mesin pencarian lokal hanya perlu menyediakan loop pencariannya untuk `solver.run_local_search`.
+STRATEGIES = {
+    "anneal": solve,
+    "tabu": solve_tabu,
+    "exact": solve_exact,
+}
+
+# Metode yang dapat dipilih di CLI: semua strategi, ditambah "count" (pemeriksaan keunikan dengan `count_solutions`).
+METHODS = (*STRATEGIES, "count")
+
+def solve_file(path, method, timeout, seed, cache_path=None):
+    """
+    Selesaikan satu file puzzle di proses pekerja dan kembalikan hasilnya sebagai dict yang siap ditulis ke JSONL.
+    Jika `cache_path` diberikan, cache solusi di path tersebut dipakai dan diperbarui ("cached" pada hasil).
+
+    Status yang mungkin: "solved", "unsolved" (pencarian lokal gagal atau puzzle terbukti tidak punya solusi), "timeout"
+    dan "error" (file tidak valid). Metode "count" memeriksa keunikan dengan `count_solutions` dan menghasilkan
+    "unique" atau "multiple" sebagai pengganti "solved".
+    """
+    start_time = time.perf_counter()
+    result = {"file": path, "method": method, "status": "error", "solution": None, "iterations": 0}
+    try:
+        board = read_input_from_file(path, verbose=False)
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+    else:
+        solve_board(board, method, timeout, seed, cache_path, result)
+    result["elapsed"] = round(time.perf_counter() - start_time, 6)
+    return result
+
+def solve_board(board, method, timeout, seed, cache_path, result, stop_event=None, hook=None, hook_interval=1000):
+    """
+    Selesaikan `board` dengan strategi `method` (nama di `STRATEGIES`, atau "count") dan isi status, solusi dan
+    penghitung ke dict `result`. `seed` memberi strategi `random.Random(seed)` sendiri; `hook` dan `stop_event`
+    diteruskan ke pemecah (status "cancelled" jika `stop_event` diset).
+    """
+    errors = (OSError, ValueError)
+    try:
+        cache = None
+        if cache_path is not None:
+            # Diimpor saat dibutuhkan: sqlite3 dan hashlib menambah waktu startup CLI dan pekerja tanpa cache.
+            import sqlite3
+            from .solution_cache import open_cache
+            errors += (sqlite3.Error,)
+            cache = open_cache(cache_path)
+        if method == "count":
+            outcome = count_solutions(board, 2, time_limit=timeout, hook=hook, hook_interval=hook_interval,
+                                      stop_event=stop_event)
+            result["solutions"] = outcome.details["solutions"]
+        else:
+            strategy = STRATEGIES.get(method)
+            if strategy is None:
+                raise ValueError(f"Unknown method '{method}', expected one of {', '.join(METHODS)}.")
+            outcome = strategy(board, "quiet", time_limit=timeout, rng=random if seed is None else random.Random(seed),
+                               stop_event=stop_event, hook=hook, hook_interval=hook_interval, cache=cache)
+        result["iterations"] = outcome.iterations
+        result["counters"] = outcome.counters
+        result["cached"] = outcome.details.get("cached", False)
+    except errors as e:
+        result["error"] = str(e)
+    else:
+        if method == "count" and outcome.solved and not outcome.timed_out and not outcome.cancelled:
+            result["status"] = "unique" if outcome.details["unique"] else "multiple"
+            result["solution"] = outcome.board.to_rows()
+        elif outcome.solved and method != "count":
+            result["status"] = "solved"
+            result["solution"] = outcome.board.to_rows()
+        elif outcome.details.get("infeasible"):
+            result["status"] = "unsolved"  # Presolve membuktikan tidak ada solusi; bukan karena waktu habis
+        elif outcome.timed_out:
+            result["status"] = "timeout"
+        elif outcome.cancelled:
+            result["status"] = "cancelled"
+        else:
+            result["status"] = "unsolved"
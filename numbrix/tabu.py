@@ -0,0 +1,163 @@
+# tabu.py
+import functools
+import random
+import time
+from array import array
+
+from .solver import run_local_search
+
+def conflict_moves(tracker, fixed, neighbors):
+    """
+    Daftar kandidat pertukaran untuk satu langkah tabu: untuk setiap pasangan angka berurutan (k, k + 1) yang tidak
+    bertetangga, pindahkan salah satunya ke sel tetangga angka yang lain. Hanya sel yang tidak tetap yang ikut
+    ditukar. Setiap pertukaran dikembalikan sekali sebagai (sel kecil, sel besar).
+    """
+    position = tracker.position
+    link_costs = tracker.link_costs
+    moves = set()
+    for num in range(1, tracker.last_link + 1):
+        if not link_costs[num]:
+            continue
+        for moving, anchor in ((num, num + 1), (num + 1, num)):
+            source = position[moving]
+            target_anchor = position[anchor]
+            if source < 0 or target_anchor < 0 or fixed >> source & 1:
+                continue
+            for target in neighbors[target_anchor]:
+                if target != source and not fixed >> target & 1:
+                    moves.add((source, target) if source < target else (target, source))
+    return moves
+
+def solve_tabu(board, debug_level, trace=None, time_limit=None, rng=random, stop_event=None, hook=None,
+               hook_interval=1000, cache=None, max_iterations=None, tenure=None, diversify_after=1000,
+               perturbation=0.1, presolve=True):
+    """
+    Menyelesaikan puzzle Numbrix dengan tabu search atas permutasi nilai di sel yang tidak tetap.
+
+    Parameter `board`, `debug_level`, `trace`, `time_limit`, `rng`, `stop_event`, `hook`, `hook_interval`, `cache`,
+    `max_iterations` dan `presolve` sama seperti pada `solve`. Parameter khusus tabu:
+    - tenure: Lama (dalam iterasi) sebuah nilai dilarang kembali ke sel yang baru ditinggalkannya; None berarti
+      seperdelapan jumlah sel bebas (minimal 7). Setiap larangan ditambah jitter acak hingga setengah `tenure`.
+    - diversify_after: Jumlah iterasi tanpa perbaikan konflik terbaik sebelum diversifikasi.
+    - perturbation: Bagian sel bebas yang ditukar secara acak saat diversifikasi.
+
+    Setiap iterasi menilai semua pertukaran dari `conflict_moves` dengan `ConflictTracker.swap_delta` dan menjalankan
+    yang terbaik, meskipun memperburuk konflik. Pertukaran yang mengembalikan (sel, nilai) yang masih tabu dilewati,
+    kecuali hasilnya lebih baik dari konflik terbaik sejauh ini (aspirasi). Jika tidak ada kandidat yang boleh,
+    dua sel bebas acak ditukar. Diversifikasi mengacak sebagian papan saat pencarian macet.
+
+    Mengembalikan `SolveResult` dengan papan terbaik, seperti `solve`. Sampel hook berisi "iteration", "conflicts",
+    "best_conflicts", "accepted", "uphill_accepted", "conflict_evaluations" dan "elapsed".
+    """
+    search = functools.partial(tabu_loop, tenure=tenure, diversify_after=diversify_after, perturbation=perturbation)
+    return run_local_search(board, debug_level, search, trace, time_limit, rng, stop_event, hook, hook_interval, cache,
+                            max_iterations, 20000, presolve)
+
+def tabu_loop(tracker, rng, result, deadline, stop_event, hook, hook_interval, max_iterations, trace, start_time,
+              tenure=None, diversify_after=1000, perturbation=0.1):
+    """Loop tabu search untuk `solver.run_local_search`; algoritme dan parameternya dijelaskan pada `solve_tabu`."""
+    board = tracker.board
+    values = board.values
+    fixed = board.fixed
+    neighbors = board.geometry.neighbors
+    free_cells = [index for index in range(board.cell_count) if not fixed >> index & 1]
+    next_sample = hook_interval if hook is not None else -1
+    if tenure is None:
+        tenure = max(7, len(free_cells) // 8)
+    stride = board.cell_count + 1
+    # Iterasi sampai (sel, nilai) tabu, dengan kunci sel * stride + nilai. Hanya pasangan yang pernah dipindahkan yang
+    # disimpan, dan yang sudah kedaluwarsa dibuang berkala, sehingga ukurannya mengikuti jumlah larangan yang aktif.
+    tabu_until = {}
+    prune_size = 4 * len(free_cells)
+
+    current_conflicts = tracker.total
+    best_conflicts = current_conflicts
+    best_values = array(values.typecode, values)
+    best_iteration = 0
+    iteration = 0
+    accepted = 0
+    uphill_accepted = 0
+    aspirations = 0
+    diversifications = 0
+    evaluations = 0
+
+    while current_conflicts != 0 and (max_iterations is None or iteration < max_iterations):
+        if len(free_cells) < 2:
+            break
+        if iteration % 256 == 0:
+            if deadline is not None and time.perf_counter() > deadline:
+                result.timed_out = True
+                break
+            if stop_event is not None and stop_event.is_set():
+                result.cancelled = True
+                break
+            if len(tabu_until) > prune_size:
+                tabu_until = {key: until for key, until in tabu_until.items() if until > iteration}
+        iteration += 1
+
+        if iteration - best_iteration >= diversify_after:
+            # Diversifikasi: tukar sebagian sel bebas secara acak, lalu beri waktu penuh lagi sebelum berikutnya.
+            for _ in range(max(1, round(len(free_cells) * perturbation))):
+                first, second = rng.sample(free_cells, 2)
+                tracker.apply_swap(first, second)
+                if trace is not None:
+                    trace.record_swap(first, second)
+            current_conflicts = tracker.total
+            best_iteration = iteration
+            diversifications += 1
+
+        move = None
+        move_delta = 0
+        move_aspirated = False
+        ties = 0
+        for first, second in conflict_moves(tracker, fixed, neighbors):
+            delta = tracker.swap_delta(first, second)
+            evaluations += 1
+            aspirated = False
+            if tabu_until.get(first * stride + values[second], 0) > iteration or \
+                    tabu_until.get(second * stride + values[first], 0) > iteration:
+                if current_conflicts + delta >= best_conflicts:
+                    continue
+                aspirated = True
+            if move is None or delta < move_delta:
+                move, move_delta, move_aspirated, ties = (first, second), delta, aspirated, 1
+            elif delta == move_delta:
+                ties += 1
+                if rng.randrange(ties) == 0:  # Pilih acak di antara kandidat terbaik yang setara
+                    move, move_aspirated = (first, second), aspirated
+        if move is None:
+            move = tuple(rng.sample(free_cells, 2))
+            move_delta = tracker.swap_delta(*move)
+            evaluations += 1
+
+        first, second = move
+        value_first, value_second = values[first], values[second]
+        tracker.apply_swap(first, second)
+        # Larang nilai kembali ke sel yang baru saja ditinggalkannya selama `tenure` (+ jitter) iterasi.
+        tabu_until[first * stride + value_first] = iteration + tenure + rng.randrange(tenure // 2 + 1)
+        tabu_until[second * stride + value_second] = iteration + tenure + rng.randrange(tenure // 2 + 1)
+        current_conflicts = tracker.total
+        accepted += 1
+        if move_delta > 0:
+            uphill_accepted += 1
+        if move_aspirated:
+            aspirations += 1
+        if trace is not None:
+            trace.record_swap(first, second)
+        if current_conflicts < best_conflicts:
+            best_conflicts = current_conflicts
+            best_values[:] = values
+            best_iteration = iteration
+
+        if iteration == next_sample:
+            next_sample += hook_interval
+            hook({"iteration": iteration, "conflicts": current_conflicts, "best_conflicts": best_conflicts,
+                  "accepted": accepted, "uphill_accepted": uphill_accepted, "conflict_evaluations": evaluations,
+                  "elapsed": time.perf_counter() - start_time})
+
+    result.iterations = iteration
+    result.counters.update({"accepted": accepted, "uphill_accepted": uphill_accepted,
+                            "conflict_evaluations": evaluations, "aspirations": aspirations,
+                            "diversifications": diversifications})
+    result.details["tenure"] = tenure
+    return best_values, best_conflicts
@@ -0,0 +1,88 @@
+# transposition.py
+import sys
+
+DEFAULT_CAPACITY = 1 << 16
+
+# Ukuran kunci hash 64-bit sebagai objek int Python (sys.getsizeof), untuk perkiraan memori di `stats`.
+_KEY_BYTES = sys.getsizeof(1 << 63)
+
+class TranspositionTable:
+    """
+    Tabel transposisi terbatas untuk pencarian eksak.
+
+    Menyimpan hash Zobrist (`Board.zobrist`) dari penugasan parsial yang sudah terbukti tidak punya solusi.
+    Penugasan mencakup petunjuk, sehingga status "buntu" hanya bergantung pada nilai yang ditempatkan, bukan pada
+    jalur atau domain saat penugasan itu dicapai.
+
+    Dalam satu pencarian tabel ini praktis tidak pernah hit: setiap percabangan DFS memilih nilai untuk satu sel
+    (MRV), sehingga subpohon saudara tidak pernah mencapai penugasan yang sama. Manfaatnya datang dari pemakaian
+    ulang satu tabel untuk beberapa pencarian yang berkaitan, misalnya pemeriksaan keunikan dan kesulitan berturut-
+    turut di `generator` pada jalur solusi yang sama: penugasan yang terbukti buntu pada pemeriksaan sebelumnya
+    langsung dilewati pada pemeriksaan berikutnya.
+
+    Kebijakan penggusuran LRU: `probe` yang berhasil memindahkan entri ke akhir dict (urutan penyisipan), dan jika
+    tabel penuh entri terdepan (paling lama tidak dipakai) dibuang. Setiap entri juga mencatat jumlah simpul yang
+    dihabiskan untuk membuktikannya, sebagai perkiraan simpul yang dihemat setiap kali entri itu ditemukan.
+
+    Kunci 64-bit tidak diverifikasi. Tabrakan hash dapat memangkas cabang yang sebenarnya benar, tetapi peluangnya
+    sekitar n² / 2^65 untuk n entri.
+    """
+
+    __slots__ = ("capacity", "entries", "hits", "misses", "stores", "evictions", "saved_nodes")
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("Transposition table capacity must be at least 1.")
+        self.capacity = capacity
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_nodes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def probe(self, key):
+        """Kembalikan True jika penugasan dengan hash `key` sudah terbukti buntu (dan tandai entri baru dipakai)."""
+        entries = self.entries
+        nodes = entries.pop(key, None)
+        if nodes is None:
+            self.misses += 1
+            return False
+        entries[key] = nodes
+        self.hits += 1
+        self.saved_nodes += nodes
+        return True
+
+    def store(self, key, nodes=1):
+        """Catat penugasan dengan hash `key` sebagai buntu; `nodes` adalah jumlah simpul yang dibutuhkan buktinya."""
+        entries = self.entries
+        if key in entries:
+            return
+        if len(entries) >= self.capacity:
+            del entries[next(iter(entries))]
+            self.evictions += 1
+        entries[key] = nodes
+        self.stores += 1
+
+    def clear(self):
+        """Kosongkan tabel beserta statistiknya."""
+        self.entries.clear()
+        self.hits = self.misses = self.stores = self.evictions = self.saved_nodes = 0
+
+    def stats(self):
+        """Kembalikan statistik tabel sebagai dict, termasuk rasio hit dan perkiraan memori dalam byte."""
+        probes = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "saved_nodes": self.saved_nodes,
+            "memory": sys.getsizeof(self.entries) + len(self.entries) * _KEY_BYTES,
+        }
@@ -0,0 +1,126 @@
+# test_invariants.py
+import random
+import unittest
+
+from numbrix.board import Board, ConflictTracker, iter_mask
+from numbrix.generator import generate_puzzle
+from numbrix.moves import PathMoves
+from numbrix.propagation import new_prune_counts, propagate
+from numbrix.solver import count_solutions, read_input_from_file
+from numbrix.transposition import TranspositionTable
+
+def full_scan_not_feasible(board):
+    """Pemeriksaan kelayakan atas semua sel, seperti `Board.is_not_feasible` sebelum pelacakan sel kotor."""
+    size = board.size
+    for index, value in enumerate(board.values):
+        if value:
+            if not board.would_be_feasible(index // size, index % size, value):
+                return True
+        elif not board.domains[index]:
+            return True
+    return False
+
+def random_walk(board, rng, steps):
+    """
+    Ubah `board` secara acak lewat primitif pencarian pohon (`set`, `propagate`, `undo`) dan hasilkan setelah
+    setiap langkah. Nilai diambil dari domain sel tanpa memeriksa kelayakan, sehingga papan sering menjadi buntu.
+    """
+    board.start_trail()
+    marks = []
+    for _ in range(steps):
+        empty = [index for index, value in enumerate(board.values) if not value]
+        if marks and (not empty or rng.random() < 0.25):
+            back = rng.randrange(len(marks))
+            board.undo(marks[back])
+            del marks[back:]
+        else:
+            marks.append(board.mark())
+            index = rng.choice(empty)
+            choices = list(iter_mask(board.domains[index])) or range(1, board.cell_count + 1)
+            board.set(index // board.size, index % board.size, rng.choice(choices))
+            if rng.random() < 0.5:
+                propagate(board, new_prune_counts())
+        yield board
+
+def puzzles():
+    """Papan uji: semua sampel 9x9 dan beberapa puzzle yang dibangkitkan dengan ukuran lain."""
+    boards = [read_input_from_file(f"samples/{name}", verbose=False)
+              for name in ("board.1.txt", "board.2.txt", "board3.txt", "board4.txt", "board5.txt")]
+    boards += [generate_puzzle(size, seed, 0.2).to_board() for size, seed in ((6, 1), (7, 2), (12, 3))]
+    return boards
+
+class IncrementalFeasibilityTest(unittest.TestCase):
+    """`is_not_feasible` yang hanya memeriksa sel kotor harus sama dengan pemeriksaan seluruh papan."""
+
+    def test_matches_full_scan_during_search(self):
+        rng = random.Random(0)
+        checks = 0
+        for board in puzzles():
+            for step in random_walk(board, rng, 400):
+                self.assertEqual(step.is_not_feasible(), full_scan_not_feasible(step))
+                checks += 1
+        self.assertGreater(checks, 3000)
+
+    def test_matches_full_scan_after_resync(self):
+        rng = random.Random(1)
+        for board in puzzles():
+            local = Board(other_board=board)
+            local.initialize_board(rng)  # Menulis buffer nilai langsung, tanpa menandai sel kotor
+            local.resync()
+            self.assertEqual(local.is_not_feasible(), full_scan_not_feasible(local))
+
+    def test_hash_follows_undo(self):
+        rng = random.Random(2)
+        board = generate_puzzle(9, 4, 0.2).to_board()
+        board.start_hashing()
+        for step in random_walk(board, rng, 500):
+            self.assertEqual(step.zobrist, Board(other_board=step).start_hashing())
+
+class ConflictTrackerTest(unittest.TestCase):
+    """Skor inkremental `ConflictTracker` dan `PathMoves` harus sama dengan `calculate_conflicts`."""
+
+    def test_swaps_match_full_count(self):
+        rng = random.Random(3)
+        for board in puzzles():
+            local = Board(other_board=board)
+            local.initialize_board(rng)
+            tracker = ConflictTracker(local)
+            self.assertEqual(tracker.total, local.calculate_conflicts())
+            free = [index for index in range(local.cell_count) if not local.fixed >> index & 1]
+            for _ in range(300):
+                first, second = rng.sample(free, 2)
+                delta = tracker.swap_delta(first, second)
+                self.assertEqual(tracker.apply_swap(first, second), delta)
+                self.assertEqual(tracker.total, local.calculate_conflicts())
+
+    def test_path_moves_match_full_count(self):
+        rng = random.Random(4)
+        for board in puzzles():
+            local = Board(other_board=board)
+            local.initialize_board(rng)
+            tracker = ConflictTracker(local)
+            path_moves = PathMoves(tracker)
+            for _ in range(300):
+                _, move, delta = path_moves.propose(rng)
+                if move is None:
+                    continue
+                before = tracker.total
+                path_moves.apply(move)
+                self.assertEqual(tracker.total - before, delta)
+                self.assertEqual(tracker.total, local.calculate_conflicts())
+
+class SolutionCountTest(unittest.TestCase):
+    """Propagasi dan tabel transposisi hanya memangkas cabang buntu, jadi jumlah solusi tidak boleh berubah."""
+
+    def test_propagation_and_table_keep_all_solutions(self):
+        table = TranspositionTable()
+        for seed in range(6):
+            board = generate_puzzle(5, seed, 0.25).to_board()
+            plain = count_solutions(board, 1000, use_propagation=False).details["solutions"]
+            self.assertGreater(plain, 0)
+            self.assertEqual(count_solutions(board, 1000).details["solutions"], plain)
+            for _ in range(2):  # Putaran kedua memakai entri tabel dari putaran pertama
+                self.assertEqual(count_solutions(board, 1000, table=table).details["solutions"], plain)
+
+if __name__ == "__main__":
+    unittest.main()